@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+changelog-updater — changelog_daemon.py
+Daemon de larga duración para update_changelog.py, alimentado por los hooks de git.
+
+Escucha en un socket Unix local. Cada hook post-commit envía una notificación
+(una línea JSON con `cwd`, `file` y las opciones de update_changelog.py:
+`repo_url`, `backend`, `group_by`, `scope_map` y `emit`) y termina en
+milisegundos. El daemon agrupa las ráfagas de notificaciones y aplica una
+única escritura serializada por changelog, reutilizando en memoria el índice
+de secciones y el índice de hashes entre commits.
+
+Usage:
+    python update_changelog.py serve [--socket <path>] [--debounce 50]
+"""
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+import update_changelog
+from changelog_emitters import EMITTERS
+
+MAX_MESSAGE = 64 * 1024
+BACKENDS = ("cli", "native")
+GROUP_BY = ("date", "release")
+
+
+def parse_target(message, backend: str) -> dict:
+    """Validate a notification and turn it into `sync_changelog` arguments.
+
+    Raises ValueError if a field is missing or has the wrong type, so a bad
+    message is rejected by the handler instead of reaching the writer thread.
+    """
+    if not isinstance(message, dict):
+        raise ValueError("la notificación debe ser un objeto JSON")
+    target = {
+        "filename": message.get("file"),
+        "cwd": message.get("cwd"),
+        "repo_url": message.get("repo_url"),
+        "backend": message.get("backend") or backend,
+        "group_by": message.get("group_by") or "date",
+        "scope_map": message.get("scope_map"),
+        "emit": message.get("emit") or [],
+    }
+    if not isinstance(target["filename"], str) or not isinstance(target["cwd"], str):
+        raise ValueError("'file' y 'cwd' son obligatorios")
+    if target["repo_url"] is not None and not isinstance(target["repo_url"], str):
+        raise ValueError("'repo_url' debe ser una cadena")
+    if target["backend"] not in BACKENDS:
+        raise ValueError(f"'backend' debe ser uno de {BACKENDS}")
+    if target["group_by"] not in GROUP_BY:
+        raise ValueError(f"'group_by' debe ser uno de {GROUP_BY}")
+    scope_map = target["scope_map"]
+    if scope_map is not None and not (
+        isinstance(scope_map, dict)
+        and all(isinstance(k, str) and isinstance(v, str) for k, v in scope_map.items())
+    ):
+        raise ValueError("'scope_map' debe ser un objeto {scope: ruta}")
+    emit = target["emit"]
+    if not isinstance(emit, list) or not all(name in EMITTERS for name in emit):
+        raise ValueError(f"'emit' debe ser una lista con valores de {tuple(EMITTERS)}")
+    return target
+
+
+class _NotificationHandler(socketserver.StreamRequestHandler):
+    """Read one JSON notification, queue it and acknowledge immediately."""
+
+    def handle(self):
+        line = self.rfile.readline(MAX_MESSAGE)
+        try:
+            target = parse_target(json.loads(line), self.server.backend)
+        except ValueError:
+            self.wfile.write(b"error\n")
+            return
+
+        self.server.pending.put(target)
+        self.wfile.write(b"ok\n")
+
+
+class ChangelogDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server with a single writer thread that coalesces bursts."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, debounce: float = 0.05, backend: str = "cli"):
+        self.pending: queue.Queue = queue.Queue()
+        self.debounce = debounce
+        self.backend = backend
+        super().__init__(socket_path, _NotificationHandler)
+
+    def writer_loop(self) -> None:
+        """Drain notifications, one serialized sync per changelog and burst."""
+        stopping = False
+        while not stopping:
+            target = self.pending.get()
+            if target is None:
+                return
+
+            batch = {target["filename"]: target}
+            deadline = time.monotonic() + self.debounce
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    target = self.pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if target is None:
+                    stopping = True
+                    break
+                batch[target["filename"]] = target  # latest notification wins
+
+            for target in batch.values():
+                self._sync(target)
+
+    def _sync(self, target: dict) -> None:
+        filename = target["filename"]
+        started = time.perf_counter()
+        try:
+            count = update_changelog.sync_changelog(**target)
+        except (RuntimeError, OSError) as e:
+            print(f"❌ {filename}: {e}")
+            return
+        except Exception as e:
+            # One broken target must not take the writer thread down with it
+            print(f"❌ {filename}: error inesperado ({type(e).__name__}: {e})")
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"📝 {filename}: {count} entradas ({elapsed:.1f} ms)")
+
+
+def serve(socket_path: str, debounce: float = 0.05, backend: str = "cli") -> None:
+    """Run the daemon until interrupted."""
+    sys.stdout.reconfigure(line_buffering=True)
+
+    if os.path.exists(socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except OSError:
+                os.unlink(socket_path)  # stale socket from a previous run
+            else:
+                print(f"❌ Ya hay un daemon escuchando en {socket_path}")
+                sys.exit(1)
+
+    server = ChangelogDaemon(socket_path, debounce, backend)
+    os.chmod(socket_path, 0o600)
+    writer = threading.Thread(target=server.writer_loop, daemon=True)
+    writer.start()
+
+    print(f"🛰️  Daemon escuchando en {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.pending.put(None)
+        writer.join(timeout=5)
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        print("👋 Daemon detenido.")
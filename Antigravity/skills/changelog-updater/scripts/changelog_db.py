@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+changelog-updater — changelog_db.py
+Índice SQLite de las entradas del changelog, mantenido por update_changelog.py.
+
+Cada entrada escrita se registra con su hash, tipo, scope, fecha, sección y
+descripción, con índices por tipo, scope, fecha y hash corto. Así preguntas
+como "todas las entradas `perf` del scope `api` entre dos fechas" o "¿se
+registró alguna vez el commit abc1234?" se responden sin recorrer markdown.
+
+Si el índice no existe se reconstruye desde el CHANGELOG.md en una única
+pasada en streaming. Las entradas escritas por el subcomando `commit`, que
+no llevan hash, se emparejan después con su commit por el asunto.
+
+Usage:
+    python update_changelog.py query --type perf --scope api --since 2024-01-01
+    python update_changelog.py query --hash abc1234
+    python update_changelog.py query --rebuild
+"""
+
+import os
+import sqlite3
+from typing import Iterable, Iterator
+
+import update_changelog
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id      INTEGER PRIMARY KEY,
+    hash    TEXT NOT NULL,  -- full hash when known, short hash otherwise
+    short   TEXT NOT NULL,
+    type    TEXT NOT NULL,
+    scope   TEXT,
+    date    TEXT,           -- commit date (YYYY-MM-DD), if known
+    section TEXT,           -- '## [label]' the entry lives under
+    desc    TEXT NOT NULL,
+    file    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_type ON entries (type, date);
+CREATE INDEX IF NOT EXISTS entries_scope ON entries (scope, date);
+CREATE INDEX IF NOT EXISTS entries_date ON entries (date);
+CREATE INDEX IF NOT EXISTS entries_short ON entries (short);
+"""
+
+COLUMNS = update_changelog.ENTRY_FIELDS
+
+ENTRY_PATTERN = update_changelog.ENTRY_PATTERN  # the inverse of `format_entry`
+FULL_HASH_PATTERN = update_changelog.FULL_HASH_PATTERN
+EMOJI_TYPES = update_changelog.EMOJI_TYPES
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open (creating if needed) the index database at `path`."""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def insert(conn: sqlite3.Connection, rows: Iterable[tuple]) -> int:
+    """Insert rows in COLUMNS order; `rows` may be a lazy iterator."""
+    cursor = conn.executemany(
+        f"INSERT INTO entries ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+        rows,
+    )
+    return cursor.rowcount
+
+
+def rebuild(conn: sqlite3.Connection, filenames: Iterable[str]) -> int:
+    """Replace the whole index with the entries parsed from `filenames`."""
+    conn.execute("DELETE FROM entries")
+    count = 0
+    for filename in filenames:
+        with open(filename, "r", encoding="utf-8") as f:
+            count += insert(conn, parse_entries(f, filename))
+        resolve_hashless(conn, filename)
+    return count
+
+
+def resolve_hashless(conn: sqlite3.Connection, filename: str) -> int:
+    """Fill in the commit of the entries of `filename` written without a hash.
+
+    The `commit` subcommand cannot reference a commit from inside itself, so
+    its entries are matched back to their commits by subject through
+    `update_changelog.match_hashless`. Returns the number resolved.
+    """
+    rows = conn.execute(
+        "SELECT id, type, scope, desc FROM entries WHERE hash = '' AND file = ? ORDER BY id",
+        (filename,),
+    ).fetchall()
+    if not rows:
+        return 0
+    known = update_changelog.HashIndex(
+        commit_hash for (commit_hash,) in conn.execute("SELECT hash FROM entries WHERE hash != ''")
+    )
+    found = update_changelog.match_hashless(
+        [(row["type"], row["scope"], row["desc"]) for row in rows],
+        known,
+        os.path.dirname(os.path.abspath(filename)),
+    )
+    updates = [
+        (commit_hash, commit_hash[:update_changelog.SHORT_HASH_LEN], row["id"])
+        for row, commit_hash in zip(rows, found)
+        if commit_hash
+    ]
+    conn.executemany("UPDATE entries SET hash = ?, short = ? WHERE id = ?", updates)
+    return len(updates)
+
+
+def parse_entries(lines: Iterable[str], filename: str) -> Iterator[tuple]:
+    """Yield one row per changelog entry line, tracking the current section."""
+    section = None
+    for line in lines:
+        if line.startswith("## ["):
+            section = line[4:].split("]", 1)[0]
+            continue
+        if not line.startswith("- "):
+            continue
+        match = ENTRY_PATTERN.match(line)
+        if not match:
+            continue
+        # Entries from the `commit` subcommand have no reference (hash "")
+        short = match.group("short") or match.group("linked") or ""
+        full = (match.group("url") or "").rsplit("/", 1)[-1]
+        commit_hash = full if FULL_HASH_PATTERN.match(full) else short
+        date = section if section and update_changelog.DATE_LABEL_PATTERN.fullmatch(section) else None
+        yield (
+            commit_hash,
+            short[:update_changelog.SHORT_HASH_LEN],
+            EMOJI_TYPES.get(match.group("emoji"), "other"),
+            match.group("scope"),
+            date,
+            section,
+            match.group("desc"),
+            filename,
+        )
+
+
+def query(
+    conn: sqlite3.Connection,
+    commit_type: str | None = None,
+    scope: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    commit_hash: str | None = None,
+    text: str | None = None,
+    limit: int | None = None,
+) -> list[sqlite3.Row]:
+    """Return matching entries, newest first."""
+    clauses, params = [], []
+    if commit_type:
+        clauses.append("type = ?")
+        params.append(commit_type.lower())
+    if scope:
+        clauses.append("scope = ?")
+        params.append(scope)
+    if since:
+        clauses.append("date >= ?")
+        params.append(since)
+    if until:
+        clauses.append("date <= ?")
+        params.append(until)
+    if commit_hash:
+        commit_hash = commit_hash.lower()
+        # Either side may be the abbreviated one
+        clauses.append("short = ? AND (hash LIKE ? || '%' OR ? LIKE hash || '%')")
+        params += [commit_hash[:update_changelog.SHORT_HASH_LEN], commit_hash, commit_hash]
+    if text:
+        clauses.append("desc LIKE ?")
+        params.append(f"%{text}%")
+
+    sql = f"SELECT {', '.join(COLUMNS)} FROM entries"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY date DESC, id DESC"
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return conn.execute(sql, params).fetchall()
+
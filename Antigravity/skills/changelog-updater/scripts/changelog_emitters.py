@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+changelog-updater — changelog_emitters.py
+Salidas adicionales del changelog (JSONL, HTML y notas por release).
+
+Todas consumen las mismas filas que update_changelog.py ya ha parseado para
+el CHANGELOG.md (una por entrada, con los campos de ENTRY_FIELDS), de modo
+que ningún formato vuelve a parsear el markdown. Cada salida se actualiza
+con una única escritura secuencial por lote:
+
+  - jsonl: añade una línea JSON por entrada al final del archivo.
+  - html:  inserta las entradas nuevas al principio de una página estática,
+           copiando el resto del archivo a nivel de kernel.
+  - notes: actualiza `release-notes/<sección>.md`, agrupado por tipo.
+
+Las secciones se ordenan como en el markdown (fecha ISO o rango de release,
+la más reciente primero). Con `--group-by release`, al aparecer un tag nuevo
+las notas de "Unreleased" pasan al archivo de su release.
+
+Para añadir un formato basta con registrar una clase con un método
+`write(rows, releases=None)` en EMITTERS.
+
+Usage:
+    python update_changelog.py --emit jsonl --emit html --emit notes
+"""
+
+import html
+import json
+import os
+import re
+import tempfile
+from itertools import chain
+
+import update_changelog
+
+TYPE_TITLES = {
+    "feat": "Nuevas características",
+    "fix": "Corrección de errores",
+    "docs": "Documentación",
+    "style": "Estilos y formato",
+    "refactor": "Refactorización",
+    "perf": "Rendimiento",
+    "test": "Tests",
+    "build": "Build y dependencias",
+    "ci": "Integración continua",
+    "chore": "Mantenimiento",
+    "revert": "Reversiones",
+    "other": "Misc",
+}
+
+
+# Release notes file names: tags such as "release/1.2" become "release-1.2"
+NOTES_NAME_PATTERN = re.compile(r"[\w+-][\w.+-]*")
+
+
+def _section_key(releases=None):
+    """Sort key for section labels, as in the markdown: release rank or ISO date."""
+    return releases.rank if releases else (lambda label: label)
+
+
+def _by_section(rows: list[dict], releases=None) -> dict[str, list[dict]]:
+    """Group rows by section label, newest section first.
+
+    Labels are not monotone in log order (committer timezones, parallel
+    branches), so rows are bucketed like `group_dates` / `group_releases`
+    do for the markdown; they keep their log order within each label.
+    """
+    sections: dict[str, list[dict]] = {}
+    for row in rows:
+        sections.setdefault(row["section"], []).append(row)
+    key = _section_key(releases)
+    return {label: sections[label] for label in sorted(sections, key=key, reverse=True)}
+
+
+def _notes_name(label: str) -> str | None:
+    """File name (without .md) for the notes of a section, or None if unusable."""
+    name = label.replace("/", "-")
+    return name if NOTES_NAME_PATTERN.fullmatch(name) else None
+
+
+def _atomic_write(path: str, chunks) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".emit-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+# ─────────────────────────────────────────────
+# JSONL
+# ─────────────────────────────────────────────
+
+class JsonlEmitter:
+    """Append-only JSON Lines log, one object per entry."""
+
+    def __init__(self, filename: str):
+        self.path = os.path.splitext(filename)[0] + ".jsonl"
+
+    def write(self, rows: list[dict], releases=None) -> None:
+        if not rows:
+            return
+        payload = "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(payload)
+
+
+# ─────────────────────────────────────────────
+# HTML
+# ─────────────────────────────────────────────
+
+HTML_MARKER = b"<!-- entries -->\n"
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<title>Changelog</title>
+<style>
+body {{ font-family: system-ui, sans-serif; max-width: 48rem; margin: 2rem auto; padding: 0 1rem; }}
+h2 {{ border-bottom: 1px solid #ddd; padding-bottom: .25rem; }}
+li {{ margin: .2rem 0; }}
+code {{ color: #666; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+"""
+HTML_TAIL = "</body>\n</html>\n"
+HTML_HASH_PATTERN = re.compile(rb"<code>([0-9a-f]{7,40})</code>")
+
+
+class HtmlEmitter:
+    """Static page with the newest sections first.
+
+    New sections are spliced in among the existing ones by the same order as
+    the markdown; entries whose label is already on the page join the top of
+    that section instead of repeating the heading. When new tags appear, the
+    released entries of "Unreleased" move to their release. The page is only
+    read up to the oldest section of the batch; the rest is copied
+    kernel-side.
+    """
+
+    def __init__(self, filename: str):
+        self.path = os.path.splitext(filename)[0] + ".html"
+        self.title = os.path.basename(filename)
+
+    def write(self, rows: list[dict], releases=None) -> None:
+        sections = {
+            label: [self._item(row) for row in items]
+            for label, items in _by_section(rows, releases).items()
+        }
+        if not os.path.exists(self.path):
+            if sections:
+                _atomic_write(self.path, [
+                    HTML_HEAD.format(title=html.escape(self.title)).encode("utf-8"),
+                    HTML_MARKER,
+                    *(self._section(label, items) for label, items in sections.items()),
+                    HTML_TAIL.encode("utf-8"),
+                ])
+            return
+        released = releases.released if releases else []
+        if not sections and not released:
+            return
+
+        key = _section_key(releases)
+        with open(self.path, "rb") as src:
+            head = src.read(update_changelog.READ_CHUNK)
+            marker = head.find(HTML_MARKER)
+            if marker == -1:
+                raise ValueError(f"{self.path} no contiene el marcador {HTML_MARKER!r}")
+            start = marker + len(HTML_MARKER)
+            size = os.fstat(src.fileno()).st_size
+            headings = self._headings(src, start, size)
+            page = next(headings)  # (label, heading offset, list offset)
+
+            # New tags: "Unreleased" (always the top section) hands entries over
+            kept = None
+            if released and page[0] == update_changelog.UNRELEASED:
+                after = next(headings)
+                body = os.pread(src.fileno(), after[1] - page[2], page[2])
+                kept, moved = self._split_released(body, releases)
+                for label, items in moved.items():
+                    sections.setdefault(label, []).extend(items)
+                if moved:
+                    page = after
+                else:
+                    kept = None
+                    headings = chain([after], headings)
+            if kept is None and not sections:
+                return
+            sections = {label: sections[label] for label in sorted(sections, key=key, reverse=True)}
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(prefix=".emit-", dir=directory)
+            try:
+                os.write(fd, head[:start])
+                cursor = start
+                if kept is not None:
+                    items = sections.pop(update_changelog.UNRELEASED, []) + kept
+                    if items:
+                        os.write(fd, self._section(update_changelog.UNRELEASED, items))
+                    cursor = page[1]
+                for label, items in sections.items():
+                    while page[0] is not None and key(page[0]) > key(label):
+                        page = next(headings)
+                    if page[0] == label:
+                        update_changelog._copy_range(src.fileno(), fd, cursor, page[2] - cursor)
+                        os.write(fd, b"".join(items))
+                        cursor = page[2]
+                        page = next(headings)
+                    else:
+                        update_changelog._copy_range(src.fileno(), fd, cursor, page[1] - cursor)
+                        os.write(fd, self._section(label, items))
+                        cursor = page[1]
+                update_changelog._copy_range(src.fileno(), fd, cursor, size - cursor)
+                os.close(fd)
+                fd = -1
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                if fd != -1:
+                    os.close(fd)
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+    @staticmethod
+    def _split_released(body: bytes, releases) -> tuple[list[bytes], dict[str, list[bytes]]]:
+        """Split the items of the "Unreleased" list into kept and moved (by release)."""
+        short_len = update_changelog.SHORT_HASH_LEN
+        released = {sha[:short_len]: sha for sha in releases.released}
+        kept: list[bytes] = []
+        moved: dict[str, list[bytes]] = {}
+        for line in body.splitlines(keepends=True):
+            if not line.startswith(b"<li"):
+                continue
+            match = HTML_HASH_PATTERN.search(line)
+            short = match.group(1).decode("ascii")[:short_len] if match else None
+            if short in released:
+                moved.setdefault(releases.label_of(released[short]), []).append(line)
+            else:
+                kept.append(line)
+        return kept, moved
+
+    @staticmethod
+    def _headings(src, start: int, size: int):
+        """Yield (label, heading offset, list offset) for each section of the page.
+
+        Ends with (None, offset, offset) at the closing `</body>` (or the end
+        of the file), where sections older than every existing one go.
+        """
+        src.seek(start)
+        offset = start
+        for line in iter(src.readline, b""):
+            if line.startswith(b'<h2 id="'):
+                text = line[line.index(b'">') + 2:line.rindex(b"</h2>")].decode("utf-8")
+                list_line = src.readline()
+                yield html.unescape(text), offset, offset + len(line) + len(list_line)
+                offset += len(line) + len(list_line)
+                continue
+            if line.startswith(b"</body>"):
+                break
+            offset += len(line)
+        while True:
+            yield None, min(offset, size), min(offset, size)
+
+    @staticmethod
+    def _heading(label: str) -> bytes:
+        label = html.escape(label)
+        return f'<h2 id="{label}">{label}</h2>'.encode("utf-8")
+
+    def _section(self, label: str, items: list[bytes]) -> bytes:
+        return self._heading(label) + b"\n<ul>\n" + b"".join(items) + b"</ul>\n"
+
+    @staticmethod
+    def _item(row: dict) -> bytes:
+        emoji = update_changelog.TYPE_EMOJIS.get(row["type"], "❓")
+        scope = f"<strong>({html.escape(row['scope'])})</strong> " if row["scope"] else ""
+        return (
+            f'<li class="{row["type"]}">{emoji} {scope}{html.escape(row["desc"])} '
+            f'<code>{row["short"]}</code></li>\n'
+        ).encode("utf-8")
+
+
+# ─────────────────────────────────────────────
+# Release notes
+# ─────────────────────────────────────────────
+
+class ReleaseNotesEmitter:
+    """One markdown file per section (release or date), grouped by type."""
+
+    def __init__(self, filename: str):
+        self.directory = os.path.join(os.path.dirname(filename), "release-notes")
+
+    def write(self, rows: list[dict], releases=None) -> None:
+        if releases and releases.released:
+            self._release(releases)
+        for label, items in _by_section(rows, releases).items():
+            name = _notes_name(label)
+            if name is None:
+                continue  # not usable as a file name
+            path = os.path.join(self.directory, f"{name}.md")
+            groups = self._read(path)
+            for row in reversed(items):  # keep the newest entry on top
+                scope = f"**({row['scope']})** " if row["scope"] else ""
+                line = f"- {scope}{row['desc']} (`{row['short']}`)\n"
+                groups.setdefault(row["type"], []).insert(0, line)
+            _atomic_write(path, [self._render(label, groups).encode("utf-8")])
+
+    def _release(self, releases) -> None:
+        """Move the notes of newly tagged commits out of the "Unreleased" file."""
+        path = os.path.join(self.directory, f"{update_changelog.UNRELEASED}.md")
+        if not os.path.exists(path):
+            return
+        short_len = update_changelog.SHORT_HASH_LEN
+        released = {sha[:short_len]: sha for sha in releases.released}
+        kept: dict[str, list[str]] = {}
+        moved: dict[str, dict[str, list[str]]] = {}
+        for commit_type, lines in self._read(path).items():
+            for line in lines:
+                label = None
+                for ref in update_changelog.HASH_REF_PATTERN.findall(line):
+                    if ref[:short_len] in released:
+                        label = releases.label_of(released[ref[:short_len]])
+                        break
+                if label and _notes_name(label):
+                    moved.setdefault(label, {}).setdefault(commit_type, []).append(line)
+                else:
+                    kept.setdefault(commit_type, []).append(line)
+        if not moved:
+            return
+
+        for label, lines_by_type in moved.items():
+            release_path = os.path.join(self.directory, f"{_notes_name(label)}.md")
+            groups = self._read(release_path)
+            for commit_type, lines in lines_by_type.items():
+                groups[commit_type] = lines + groups.get(commit_type, [])
+            _atomic_write(release_path, [self._render(label, groups).encode("utf-8")])
+        if any(kept.values()):
+            _atomic_write(path, [self._render(update_changelog.UNRELEASED, kept).encode("utf-8")])
+        else:
+            os.unlink(path)
+
+    @staticmethod
+    def _read(path: str) -> dict[str, list[str]]:
+        """Entries already in a notes file, by type (files are small: one release)."""
+        groups: dict[str, list[str]] = {}
+        if not os.path.exists(path):
+            return groups
+        titles = {title: commit_type for commit_type, title in TYPE_TITLES.items()}
+        current = None
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("### "):
+                    current = titles.get(line[4:].split(" ", 1)[-1].strip(), "other")
+                elif line.startswith("- ") and current:
+                    groups.setdefault(current, []).append(line)
+        return groups
+
+    @staticmethod
+    def _render(label: str, groups: dict[str, list[str]]) -> str:
+        parts = [f"# {label}\n"]
+        for commit_type, title in TYPE_TITLES.items():
+            if groups.get(commit_type):
+                emoji = update_changelog.TYPE_EMOJIS[commit_type]
+                parts.append(f"\n### {emoji} {title}\n\n" + "".join(groups[commit_type]))
+        return "".join(parts)
+
+
+EMITTERS = {
+    "jsonl": JsonlEmitter,
+    "html": HtmlEmitter,
+    "notes": ReleaseNotesEmitter,
+}
@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+"""
+changelog-updater — git_native.py
+Lector nativo de objetos git para update_changelog.py (sin lanzar `git`).
+
+Resuelve HEAD y referencias leyendo `.git` directamente, descomprime objetos
+sueltos con zlib y localiza objetos empaquetados con búsqueda binaria sobre
+el `.idx` (v2) mapeado en memoria. Cualquier caso que no sepa manejar
+(repos SHA-256, alternates, revisiones como `HEAD~3`...) lanza
+`NativeUnsupported` para que el llamador vuelva al CLI de git.
+
+Usage:
+    from git_native import Repository, NativeUnsupported
+
+    repo = Repository(".")
+    commit = repo.commit(repo.resolve("HEAD"))
+"""
+
+import glob
+import heapq
+import mmap
+import os
+import re
+import struct
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+
+from update_changelog import find_repo
+
+# ─────────────────────────────────────────────
+# Constants
+# ─────────────────────────────────────────────
+
+OBJ_COMMIT = 1
+OBJ_TREE = 2
+OBJ_BLOB = 3
+OBJ_TAG = 4
+OBJ_OFS_DELTA = 6
+OBJ_REF_DELTA = 7
+
+TYPE_NAMES = {
+    OBJ_COMMIT: "commit",
+    OBJ_TREE: "tree",
+    OBJ_BLOB: "blob",
+    OBJ_TAG: "tag",
+}
+
+IDX_MAGIC = b"\377tOc"
+SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+INFLATE_CHUNK = 4096
+DELTA_BASE_CACHE = 256  # resolved delta bases kept per pack
+WALK_SLOP = 5  # extra commits walked once only excluded ones are queued (as git)
+
+
+class NativeUnsupported(Exception):
+    """The native reader cannot handle this request; fall back to the git CLI."""
+
+
+# ─────────────────────────────────────────────
+# Packfiles
+# ─────────────────────────────────────────────
+
+class Pack:
+    """A packfile plus its memory-mapped v2 index."""
+
+    def __init__(self, idx_path: str):
+        self.idx_path = idx_path
+        self.pack_path = idx_path[:-4] + ".pack"
+
+        with open(idx_path, "rb") as f:
+            self.idx = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.idx[:4] != IDX_MAGIC or struct.unpack(">I", self.idx[4:8])[0] != 2:
+            raise NativeUnsupported(f"índice de pack no soportado: {idx_path}")
+
+        self.fanout = struct.unpack(">256I", self.idx[8:8 + 1024])
+        self.count = self.fanout[255]
+        self.sha_table = 8 + 1024
+        self.offset_table = self.sha_table + 24 * self.count  # after SHAs + CRCs
+        self.large_table = self.offset_table + 4 * self.count
+
+        with open(self.pack_path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._bases: OrderedDict[int, tuple[int, bytes]] = OrderedDict()
+
+    def find(self, sha: bytes) -> int | None:
+        """Binary-search the index for a 20-byte SHA and return its pack offset."""
+        first = sha[0]
+        lo = self.fanout[first - 1] if first else 0
+        hi = self.fanout[first]
+        idx = self.idx
+        base = self.sha_table
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = base + 20 * mid
+            current = idx[start:start + 20]
+            if current < sha:
+                lo = mid + 1
+            elif current > sha:
+                hi = mid
+            else:
+                return self._offset(mid)
+        return None
+
+    def _offset(self, position: int) -> int:
+        start = self.offset_table + 4 * position
+        offset = struct.unpack(">I", self.idx[start:start + 4])[0]
+        if offset & 0x80000000:
+            start = self.large_table + 8 * (offset & 0x7FFFFFFF)
+            offset = struct.unpack(">Q", self.idx[start:start + 8])[0]
+        return offset
+
+    def read(self, offset: int, repo: "Repository") -> tuple[int, bytes]:
+        """Read and fully resolve the object stored at `offset`."""
+        data = self.data
+        pos = offset
+        byte = data[pos]
+        pos += 1
+        obj_type = (byte >> 4) & 7
+        size = byte & 0x0F
+        shift = 4
+        while byte & 0x80:
+            byte = data[pos]
+            pos += 1
+            size |= (byte & 0x7F) << shift
+            shift += 7
+
+        if obj_type == OBJ_OFS_DELTA:
+            byte = data[pos]
+            pos += 1
+            distance = byte & 0x7F
+            while byte & 0x80:
+                byte = data[pos]
+                pos += 1
+                distance = ((distance + 1) << 7) | (byte & 0x7F)
+            base_type, base = self._read_base(offset - distance, repo)
+            return base_type, _apply_delta(base, self._inflate(pos, size))
+
+        if obj_type == OBJ_REF_DELTA:
+            base_sha = data[pos:pos + 20].hex()
+            pos += 20
+            base_type, base = repo.read_object(base_sha)
+            return base_type, _apply_delta(base, self._inflate(pos, size))
+
+        if obj_type not in TYPE_NAMES:
+            raise NativeUnsupported(f"tipo de objeto desconocido en pack: {obj_type}")
+        return obj_type, self._inflate(pos, size)
+
+    def _read_base(self, offset: int, repo: "Repository") -> tuple[int, bytes]:
+        """Read a delta base through a small LRU (deltas chain on the same bases)."""
+        cached = self._bases.get(offset)
+        if cached is not None:
+            self._bases.move_to_end(offset)
+            return cached
+        cached = self.read(offset, repo)
+        self._bases[offset] = cached
+        if len(self._bases) > DELTA_BASE_CACHE:
+            self._bases.popitem(last=False)
+        return cached
+
+    def _inflate(self, pos: int, size: int) -> bytes:
+        """Decompress one zlib stream starting at `pos` (compressed length unknown)."""
+        inflater = zlib.decompressobj()
+        out = bytearray()
+        chunk = max(size, INFLATE_CHUNK)
+        while not inflater.eof:
+            piece = self.data[pos:pos + chunk]
+            if not piece:
+                raise NativeUnsupported(f"pack truncado: {self.pack_path}")
+            out += inflater.decompress(piece)
+            pos += len(piece)
+        return bytes(out)
+
+    def close(self) -> None:
+        self.idx.close()
+        self.data.close()
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    """Rebuild an object from its base and a git delta stream."""
+    pos = 0
+    _, pos = _delta_varint(delta, pos)  # source size
+    target_size, pos = _delta_varint(delta, pos)
+    out = bytearray()
+
+    while pos < len(delta):
+        op = delta[pos]
+        pos += 1
+        if op & 0x80:
+            offset = size = 0
+            for shift, bit in ((0, 0x01), (8, 0x02), (16, 0x04), (24, 0x08)):
+                if op & bit:
+                    offset |= delta[pos] << shift
+                    pos += 1
+            for shift, bit in ((0, 0x10), (8, 0x20), (16, 0x40)):
+                if op & bit:
+                    size |= delta[pos] << shift
+                    pos += 1
+            out += base[offset:offset + (size or 0x10000)]
+        elif op:
+            out += delta[pos:pos + op]
+            pos += op
+        else:
+            raise NativeUnsupported("instrucción de delta inválida")
+
+    if len(out) != target_size:
+        raise NativeUnsupported("delta con tamaño inesperado")
+    return bytes(out)
+
+
+def _delta_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, pos
+
+
+# ─────────────────────────────────────────────
+# Repository
+# ─────────────────────────────────────────────
+
+class Repository:
+    """Read-only access to the refs and objects of a git repository."""
+
+    def __init__(self, start: str = "."):
+        repo = find_repo(start)
+        if repo is None:
+            raise NativeUnsupported("no es un repositorio git")
+        self.git_dir = repo[1]
+
+        self.common_dir = self.git_dir
+        commondir_file = os.path.join(self.git_dir, "commondir")
+        if os.path.exists(commondir_file):
+            with open(commondir_file, "r", encoding="utf-8") as f:
+                self.common_dir = os.path.normpath(
+                    os.path.join(self.git_dir, f.read().strip())
+                )
+
+        config = os.path.join(self.common_dir, "config")
+        if os.path.exists(config):
+            with open(config, "r", encoding="utf-8", errors="replace") as f:
+                if re.search(r"objectformat\s*=\s*sha256", f.read(), re.IGNORECASE):
+                    raise NativeUnsupported("repositorios SHA-256 no soportados")
+
+        self.objects_dir = os.path.join(self.common_dir, "objects")
+        self._packs: list[Pack] | None = None
+        self._packed_refs: dict[str, str] | None = None
+
+    # ── Refs ──
+
+    def resolve(self, rev: str) -> str:
+        """Resolve HEAD, a ref name or a full SHA to a commit SHA."""
+        if SHA_PATTERN.match(rev):
+            return self._peel(rev)
+
+        candidates = [rev] if rev == "HEAD" or rev.startswith("refs/") else [
+            rev,
+            f"refs/{rev}",
+            f"refs/tags/{rev}",
+            f"refs/heads/{rev}",
+            f"refs/remotes/{rev}",
+        ]
+        for name in candidates:
+            sha = self._read_ref(name)
+            if sha:
+                return self._peel(sha)
+        raise NativeUnsupported(f"revisión no soportada: {rev}")
+
+    def _read_ref(self, name: str, depth: int = 0) -> str | None:
+        if depth > 5:
+            raise NativeUnsupported(f"referencia simbólica demasiado profunda: {name}")
+
+        # HEAD and other per-worktree refs live in git_dir, the rest in common_dir
+        for base in (self.git_dir, self.common_dir):
+            path = os.path.join(base, name)
+            if os.path.isfile(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    value = f.read().strip()
+                if value.startswith("ref:"):
+                    return self._read_ref(value[4:].strip(), depth + 1)
+                return value if SHA_PATTERN.match(value) else None
+
+        return self._load_packed_refs().get(name)
+
+    def _load_packed_refs(self) -> dict[str, str]:
+        if self._packed_refs is None:
+            self._packed_refs = {}
+            path = os.path.join(self.common_dir, "packed-refs")
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if line.startswith(("#", "^")):
+                            continue
+                        sha, _, name = line.strip().partition(" ")
+                        if name:
+                            self._packed_refs[name] = sha
+        return self._packed_refs
+
+    def _peel(self, sha: str) -> str:
+        """Follow annotated tags until reaching a commit."""
+        for _ in range(10):
+            obj_type, data = self.read_object(sha)
+            if obj_type == OBJ_COMMIT:
+                return sha
+            if obj_type != OBJ_TAG:
+                raise NativeUnsupported(f"{sha} no es un commit")
+            sha = data.split(b"\n", 1)[0].split(b" ", 1)[1].decode("ascii")
+        raise NativeUnsupported(f"cadena de tags demasiado larga: {sha}")
+
+    # ── Objects ──
+
+    def read_object(self, sha: str) -> tuple[int, bytes]:
+        """Return (type, content) of an object, loose or packed."""
+        loose = os.path.join(self.objects_dir, sha[:2], sha[2:])
+        if os.path.exists(loose):
+            with open(loose, "rb") as f:
+                raw = zlib.decompress(f.read())
+            header, _, content = raw.partition(b"\0")
+            type_name = header.split(b" ", 1)[0].decode("ascii")
+            for obj_type, name in TYPE_NAMES.items():
+                if name == type_name:
+                    return obj_type, content
+            raise NativeUnsupported(f"tipo de objeto desconocido: {type_name}")
+
+        binary = bytes.fromhex(sha)
+        for pack in self._load_packs():
+            offset = pack.find(binary)
+            if offset is not None:
+                return pack.read(offset, self)
+
+        # Alternates, promisor remotes, objects written after the packs were loaded...
+        raise NativeUnsupported(f"objeto no encontrado: {sha}")
+
+    def _load_packs(self) -> list[Pack]:
+        if self._packs is None:
+            pattern = os.path.join(self.objects_dir, "pack", "*.idx")
+            self._packs = [Pack(path) for path in sorted(glob.glob(pattern))]
+        return self._packs
+
+    def commit(self, sha: str) -> dict:
+        """Read a commit and return it in the same shape as `git log` output."""
+        obj_type, raw = self.read_object(sha)
+        if obj_type != OBJ_COMMIT:
+            raise NativeUnsupported(f"{sha} no es un commit")
+        return _parse_commit(sha, raw)
+
+    # ── History ──
+
+    def walk(
+        self,
+        include: list[str],
+        exclude: list[str] | None = None,
+        max_count: int | None = None,
+    ) -> Iterator[dict]:
+        """Yield commits reachable from `include` but not from `exclude`, newest first.
+
+        Mirrors `git log` ordering: a priority queue on committer time. With
+        no `exclude` commits stream as they are popped. Otherwise the walk is
+        limited the way git's `limit_list` does it: excluded ("uninteresting")
+        flags reach every ancestor, including commits already popped, and
+        nothing is yielded until only uninteresting commits remain queued
+        (plus WALK_SLOP more, for skewed commit dates). The interesting
+        commits of the range are held in memory until then.
+        """
+        queue: list[tuple[int, int, str]] = []
+        flags: dict[str, bool] = {}  # sha -> uninteresting
+        commits: dict[str, dict] = {}
+        parents: dict[str, list[str]] = {}  # popped sha -> parents (limited walks)
+        limited = bool(exclude)
+        pending = 0  # interesting commits still queued
+        counter = 0
+
+        def push(sha: str, uninteresting: bool) -> None:
+            nonlocal pending, counter
+            previous = flags.get(sha)
+            if previous is None:
+                commit = self.commit(sha)
+                commits[sha] = commit
+                flags[sha] = uninteresting
+                counter += 1
+                heapq.heappush(queue, (-commit["time"], counter, sha))
+                if not uninteresting:
+                    pending += 1
+            elif uninteresting and not previous:
+                mark_uninteresting(sha)
+
+        def mark_uninteresting(sha: str) -> None:
+            nonlocal pending
+            stack = [sha]
+            while stack:
+                sha = stack.pop()
+                if flags.get(sha) is not False:
+                    continue
+                flags[sha] = True
+                if sha in parents:
+                    stack.extend(parents[sha])  # popped: its parents are known
+                else:
+                    pending -= 1  # still queued
+
+        for sha in exclude or []:
+            push(sha, True)
+        for sha in include:
+            push(sha, False)
+
+        found: list[dict] = []
+        emitted = 0
+        slop = WALK_SLOP
+        while queue:
+            if pending:
+                slop = WALK_SLOP
+            elif not limited or slop == 0:
+                break
+            else:
+                slop -= 1
+            _, _, sha = heapq.heappop(queue)
+            commit = commits.pop(sha)
+            uninteresting = flags[sha]
+            if limited:
+                parents[sha] = commit["parents"]
+            if not uninteresting:
+                pending -= 1
+                if limited:
+                    found.append(commit)
+                else:
+                    yield commit
+                    emitted += 1
+                    if max_count is not None and emitted >= max_count:
+                        return
+            for parent in commit["parents"]:
+                push(parent, uninteresting)
+
+        for commit in found:
+            if flags[commit["hash"]]:
+                continue  # reached from the excluded side after it was popped
+            yield commit
+            emitted += 1
+            if max_count is not None and emitted >= max_count:
+                return
+
+    def close(self) -> None:
+        for pack in self._packs or []:
+            pack.close()
+        self._packs = None
+
+
+def _parse_commit(sha: str, raw: bytes) -> dict:
+    """Parse a raw commit object into hash, date, subject, body, parents and time."""
+    header, _, message = raw.partition(b"\n\n")
+    parents: list[str] = []
+    committer = b""
+    encoding = "utf-8"
+
+    for line in header.split(b"\n"):
+        if line.startswith(b" "):
+            continue  # continuation of a multi-line header (gpgsig, mergetag)
+        key, _, value = line.partition(b" ")
+        if key == b"parent":
+            parents.append(value.decode("ascii"))
+        elif key == b"committer":
+            committer = value
+        elif key == b"encoding":
+            encoding = value.decode("ascii")
+
+    try:
+        _, timestamp, tz = committer.rsplit(b" ", 2)
+        seconds = int(timestamp)
+        sign = -1 if tz.startswith(b"-") else 1
+        minutes = sign * (int(tz[1:3]) * 60 + int(tz[3:5]))
+    except ValueError:
+        raise NativeUnsupported(f"committer ilegible en {sha}")
+    date = datetime.fromtimestamp(seconds, timezone(timedelta(minutes=minutes)))
+
+    try:
+        text = message.decode(encoding, "replace")
+    except LookupError:
+        text = message.decode("utf-8", "replace")
+
+    # Same split as git's %s / %b: first paragraph (joined) and the rest
+    paragraph, _, body = text.lstrip("\n").partition("\n\n")
+    return {
+        "hash": sha,
+        "date": date.strftime("%Y-%m-%d"),
+        "subject": " ".join(line.strip() for line in paragraph.splitlines()),
+        "body": body.strip(),
+        "parents": parents,
+        "time": seconds,
+    }
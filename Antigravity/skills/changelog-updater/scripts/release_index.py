@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+changelog-updater — release_index.py
+Índice commit → release (el primer tag que contiene cada commit) para update_changelog.py.
+
+En lugar de un `git describe --contains` por commit, el índice se construye
+con un único recorrido del historial: se leen todos los tags (ordenados por
+fecha de creación) con `git for-each-ref` y el grafo de commits alcanzables
+desde ellos con un solo `git rev-list --parents`. Cada commit se asigna al
+tag más antiguo que lo contiene.
+
+El índice se cachea en disco, identificado por el conjunto de tags. Cuando
+aparecen tags nuevos (posteriores a los ya indexados) solo se recorren los
+commits que no contenían los anteriores; `released` expone esos commits para
+mover sus entradas desde la sección "Unreleased" a la de su release.
+
+Usage:
+    from release_index import ReleaseIndex
+
+    releases = ReleaseIndex.load(".git/changelog-updater/releases.json", cwd=".")
+    releases.label_of(commit_hash)  # "v1.2.0" o "Unreleased"
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+
+UNRELEASED = "Unreleased"
+INDEX_VERSION = 1
+
+
+class ReleaseIndex:
+    """Maps commits to the oldest release tag that contains them."""
+
+    def __init__(self, tags: list[list], commits: dict[str, int]):
+        self.tags = tags  # [name, commit sha, creator timestamp], oldest first
+        self.commits = commits  # commit sha -> position in `tags`
+        self.released: list[str] = []  # commits assigned by the last `extend`
+        self._ranks = {name: position for position, (name, _, _) in enumerate(tags)}
+
+    # ── Queries ──
+
+    def label_of(self, commit_hash: str) -> str:
+        """Release tag that first contains the commit, or 'Unreleased'."""
+        position = self.commits.get(commit_hash)
+        return UNRELEASED if position is None else self.tags[position][0]
+
+    def rank(self, label: str) -> int:
+        """Sort key for section labels: newer releases rank higher.
+
+        'Unreleased' ranks above every tag; unknown labels (e.g. old date
+        sections) rank below all of them.
+        """
+        if label == UNRELEASED:
+            return len(self.tags)
+        return self._ranks.get(label, -1)
+
+    # ── Building ──
+
+    @classmethod
+    def load(cls, cache_path: str, cwd: str | None = None) -> "ReleaseIndex":
+        """Return an up-to-date index, reusing or extending the cached one."""
+        tags = list_tags(cwd)
+        digest = _digest(tags)
+
+        cached = None
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    cached = json.load(f)
+            except (OSError, ValueError):
+                cached = None
+        if cached is not None and cached.get("version") != INDEX_VERSION:
+            cached = None
+
+        if cached is not None and cached["digest"] == digest:
+            return cls(cached["tags"], cached["commits"])
+
+        if cached is not None and _is_extension(cached["tags"], tags):
+            index = cls(cached["tags"], cached["commits"])
+            index.extend(tags[len(cached["tags"]):], cwd)
+        else:
+            index = cls([], {})
+            index.extend(tags, cwd)
+
+        index.save(cache_path, digest)
+        return index
+
+    def extend(self, new_tags: list[list], cwd: str | None = None) -> None:
+        """Assign the commits first contained by `new_tags` (oldest first).
+
+        A single `rev-list` lists every commit reachable from the new tags
+        but not from the already indexed ones, so previously assigned
+        history is never walked again.
+        """
+        if not new_tags:
+            return
+
+        revisions = [sha for _, sha, _ in new_tags]
+        revisions += [f"^{sha}" for _, sha, _ in self.tags]
+        parents = _read_graph(revisions, cwd)
+
+        for name, sha, timestamp in new_tags:
+            position = len(self.tags)
+            self.tags.append([name, sha, timestamp])
+            self._ranks[name] = position
+            stack = [sha]
+            while stack:
+                commit = stack.pop()
+                if commit in self.commits or commit not in parents:
+                    continue
+                self.commits[commit] = position
+                self.released.append(commit)
+                stack.extend(parents[commit])
+
+    def save(self, cache_path: str, digest: str | None = None) -> None:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "digest": digest or _digest(self.tags),
+                    "tags": self.tags,
+                    "commits": self.commits,
+                },
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, cache_path)
+
+
+# ─────────────────────────────────────────────
+# Git
+# ─────────────────────────────────────────────
+
+def list_tags(cwd: str | None = None) -> list[list]:
+    """Return [name, commit sha, timestamp] for every tag on a commit, oldest first."""
+    result = subprocess.run(
+        [
+            "git", "for-each-ref", "--sort=creatordate",
+            "--format=%(refname:short)%09%(objecttype)%09%(objectname)"
+            "%09%(*objecttype)%09%(*objectname)%09%(creatordate:unix)",
+            "refs/tags",
+        ],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        cwd=cwd,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+
+    tags = []
+    for line in result.stdout.splitlines():
+        name, obj_type, sha, peeled_type, peeled, timestamp = line.split("\t")
+        if peeled:
+            obj_type, sha = peeled_type, peeled
+        if obj_type == "commit":
+            tags.append([name, sha, int(timestamp or 0)])
+    return tags
+
+
+def _read_graph(revisions: list[str], cwd: str | None) -> dict[str, list[str]]:
+    """Commit -> parents for everything `revisions` selects, in one rev-list."""
+    result = subprocess.run(
+        ["git", "rev-list", "--parents", "--stdin"],
+        input="\n".join(revisions) + "\n",
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        cwd=cwd,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+
+    parents: dict[str, list[str]] = {}
+    for line in result.stdout.splitlines():
+        commit, *rest = line.split()
+        parents[commit] = rest
+    return parents
+
+
+def _digest(tags: list[list]) -> str:
+    payload = "\n".join(f"{name} {sha}" for name, sha, _ in tags)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _is_extension(old: list[list], new: list[list]) -> bool:
+    """True if `new` only appends tags created after every tag of `old`."""
+    if len(new) < len(old):
+        return False
+    if any(a[:2] != b[:2] for a, b in zip(old, new)):
+        return False
+    newest = max((t[2] for t in old), default=0)
+    return all(t[2] >= newest for t in new[len(old):])
@@ -6,21 +6,46 @@ Actualiza automáticamente CHANGELOG.md basándose en el último commit de git.
 Analiza mensajes con formato Conventional Commits (con emoji opcional)
 y genera entradas formateadas con emoji, scope y hash corto.
 
+Solo se procesan los commits nuevos desde la última ejecución (watermark
+guardado en `.git/changelog-updater/`), por lo que es seguro ejecutarlo
+tantas veces como se quiera.
+
 Usage:
     python update_changelog.py [--file CHANGELOG.md] [--repo-url <github-url>]
+                               [--range A..B] [--since <date>]
+    python update_changelog.py serve [--socket <path>]
+    python update_changelog.py notify [--socket <path>]
+    python update_changelog.py fleet <repo|glob>... [--workers N] [--timeout S]
 
 Examples:
     python update_changelog.py
     python update_changelog.py --file HISTORIAL.md
     python update_changelog.py --repo-url https://github.com/user/repo
+    python update_changelog.py --range v1.0..HEAD
+    python update_changelog.py --since 2024-01-01
+    python update_changelog.py serve &
+    python update_changelog.py notify
+    python update_changelog.py fleet "~/projects/*" --workers 8
 """
 
 import argparse
+import glob
+import hashlib
+import io
+import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, groupby
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator
 
 # ─────────────────────────────────────────────
 # Constants
@@ -50,6 +75,48 @@ COMMIT_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# First letters of the type keywords: any other ASCII start cannot match
+TYPE_INITIALS = frozenset(t[0] for t in TYPE_EMOJIS if t != "other")
+SUBJECT_CACHE_SIZE = 16384
+
+# Fields are separated by US (0x1F) and commits by NUL (`git log -z`), so
+# subjects and bodies can contain any printable text.
+GIT_LOG_FORMAT = "%H%x1f%cd%x1f%s%x1f%b"
+READ_CHUNK = 64 * 1024
+NOTIFY_TIMEOUT = 0.5  # seconds the hook client waits for the daemon
+FLEET_TIMEOUT = 300  # seconds before a fleet repository is reported as hung
+FLEET_POLL = 0.05  # seconds between two checks of the fleet timeouts
+
+# Per-repository state (watermark + recorded hashes) lives inside the git dir
+STATE_DIR_NAME = "changelog-updater"
+SHORT_HASH_LEN = 7
+HASH_REF_PATTERN = re.compile(r"`([0-9a-f]{7,40})`")
+FULL_HASH_PATTERN = re.compile(r"[0-9a-f]{40}$")
+EMOJI_TYPES = {emoji: commit_type for commit_type, emoji in TYPE_EMOJIS.items()}
+
+# The inverse of `format_entry`: "- <emoji> **(scope)** desc (`hash`)",
+# "- <emoji> **(scope)** desc [`hash`](<url>/commit/<full hash>)" or, for
+# entries written by the `commit` subcommand, no reference at all
+ENTRY_PATTERN = re.compile(
+    rf"- (?P<emoji>{'|'.join(map(re.escape, [*TYPE_EMOJIS.values(), '❓']))}) "
+    r"(?:\*\*\((?P<scope>[^)]*)\)\*\* )?(?P<desc>.*?)"
+    r"(?: (?:\(`(?P<short>[0-9a-f]{7,40})`\)|\[`(?P<linked>[0-9a-f]{7,40})`\]\((?P<url>[^)]*)\)))?\s*$"
+)
+
+UNRELEASED = "Unreleased"
+SCOPE_NAME_PATTERN = re.compile(r"[\w-][\w.-]*")
+
+# Fields of the rows handed to the query index and the emitters, per entry
+ENTRY_FIELDS = ("hash", "short", "type", "scope", "date", "section", "desc", "file")
+
+# Set while `commit` runs git, so a post-commit hook does not log the commit twice
+PRECOMMIT_ENV = "CHANGELOG_UPDATER_PRECOMMIT"
+AUTOSQUASH_PREFIXES = ("fixup!", "squash!", "amend!")
+
+# Rotation: date sections move to <archive dir>/<year>.md, linked from the prelude
+DATE_LABEL_PATTERN = re.compile(r"(\d{4})-\d{2}-\d{2}")
+ARCHIVE_LINE_PREFIX = "> 📦 Archivo:"
+
 
 # ─────────────────────────────────────────────
 # Git Operations
@@ -86,41 +153,200 @@ def get_last_commit() -> dict | None:
         return None
 
 
+def iter_commits(
+    rev_range: str | None = None,
+    since: str | None = None,
+    max_count: int | None = None,
+    backend: str = "cli",
+    cwd: str | None = None,
+) -> Iterator[dict]:
+    """Stream every commit of a range (newest first) from a single `git log` process.
+
+    Commits are yielded one at a time as git produces them. The generator
+    itself only keeps the hashes the native reader already yielded (to
+    resume on the CLI); what else the range costs in memory is up to the
+    caller. Raises RuntimeError if git exits with an error.
+
+    With `backend="native"` the range is walked in-process by `git_native`
+    (no `git` spawn). If the native reader gives up halfway, the CLI takes
+    over from the start of the range, skips the commits already yielded and
+    stops once `max_count` commits have been yielded in total.
+    """
+    seen: set[str] = set()
+    if backend == "native" and since is None:
+        try:
+            for commit in _native_commits(rev_range, max_count, cwd):
+                seen.add(commit["hash"])
+                yield commit
+            return
+        except Exception:
+            # Anything the native reader trips on is delegated to git itself
+            pass
+
+    cmd = ["git", "log", "-z", "--date=short", f"--pretty=format:{GIT_LOG_FORMAT}"]
+    if since:
+        cmd.append(f"--since={since}")
+    if max_count is not None:
+        cmd.append(f"--max-count={max_count}")
+    if rev_range:
+        cmd.append(rev_range)
+
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=cwd
+    )
+    left = None if max_count is None else max_count - len(seen)
+    pending = b""
+    try:
+        for chunk in iter(lambda: proc.stdout.read(READ_CHUNK), b""):
+            records = (pending + chunk).split(b"\0")
+            pending = records.pop()
+            for record in records:
+                if left == 0:
+                    break
+                commit = _parse_log_record(record)
+                if commit["hash"] not in seen:
+                    yield commit
+                    left = None if left is None else left - 1
+            if left == 0:
+                pending = b""
+                proc.kill()  # the rest of the output is not needed
+                break
+        if pending and left != 0:
+            commit = _parse_log_record(pending)
+            if commit["hash"] not in seen:
+                yield commit
+    finally:
+        proc.stdout.close()
+        stderr = proc.stderr.read()
+        proc.stderr.close()
+        returncode = proc.wait()
+
+    if returncode != 0 and left != 0:
+        raise RuntimeError(stderr.decode("utf-8", "replace").strip())
+
+
+def _native_commits(
+    rev_range: str | None, max_count: int | None, cwd: str | None = None
+) -> Iterator[dict]:
+    """Walk `rev_range` with the pure-Python reader (raises if unavailable)."""
+    import git_native
+
+    if rev_range is None:
+        include, exclude = ["HEAD"], []
+    elif "..." in rev_range:
+        raise git_native.NativeUnsupported(f"rango simétrico: {rev_range}")
+    elif ".." in rev_range:
+        start, end = rev_range.split("..", 1)
+        include, exclude = [end or "HEAD"], [start or "HEAD"]
+    else:
+        include, exclude = [rev_range], []
+
+    repo = git_native.Repository(cwd or ".")
+    try:
+        yield from repo.walk(
+            [repo.resolve(rev) for rev in include],
+            [repo.resolve(rev) for rev in exclude],
+            max_count,
+        )
+    finally:
+        repo.close()
+
+
+def _parse_log_record(record: bytes) -> dict:
+    """Split one `GIT_LOG_FORMAT` record into a commit dict."""
+    commit_hash, date, subject, body = record.decode("utf-8", "replace").split("\x1f", 3)
+    return {
+        "hash": commit_hash.strip(),
+        "date": date,
+        "subject": subject,
+        "body": body.strip(),
+    }
+
+
 # ─────────────────────────────────────────────
 # Parsing
 # ─────────────────────────────────────────────
 
-def parse_commit(commit: dict) -> dict:
+class CommitRecord:
+    """A parsed commit.
+
+    Slotted to stay compact in large batches; `record["type"]` still works
+    for code written against the dicts `parse_commit` used to return.
+    """
+
+    __slots__ = ("hash", "type", "scope", "desc", "body")
+
+    def __init__(
+        self,
+        commit_hash: str,
+        commit_type: str,
+        scope: str | None,
+        desc: str,
+        body: str = "",
+    ):
+        self.hash = commit_hash
+        self.type = commit_type
+        self.scope = scope
+        self.desc = desc
+        self.body = body
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CommitRecord):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        return f"CommitRecord({self.as_dict()!r})"
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def parse_commit(commit: dict) -> CommitRecord:
     """Parse a commit dict into structured data with type, scope, description."""
-    match = COMMIT_PATTERN.match(commit["subject"])
+    commit_type, scope, desc = classify_subject(commit["subject"])
+    return CommitRecord(commit["hash"], commit_type, scope, desc, commit["body"])
+
+
+@lru_cache(maxsize=SUBJECT_CACHE_SIZE)
+def classify_subject(subject: str) -> tuple[str, str | None, str]:
+    """Return (type, scope, desc) for a commit subject.
 
+    A cheap dispatch on the first character settles most non-conventional
+    subjects ("Merge ...", "Update ...") without touching the regex; only
+    subjects that can start with an emoji or a type keyword go through
+    `COMMIT_PATTERN`. Results are cached because bots repeat subjects a lot.
+    """
+    first = subject[:1]
+    if first.isascii() and first.lower() not in TYPE_INITIALS:
+        return "other", None, subject.strip()
+
+    match = COMMIT_PATTERN.match(subject)
     if match:
-        return {
-            "hash": commit["hash"],
-            "type": match.group("type").lower(),
-            "scope": match.group("scope"),
-            "desc": match.group("desc").strip(),
-            "body": commit["body"],
-        }
+        commit_type, scope, desc = match.group("type", "scope", "desc")
+        return commit_type.lower(), scope, desc.strip()
 
     # Fallback for non-conventional commits
-    return {
-        "hash": commit["hash"],
-        "type": "other",
-        "scope": None,
-        "desc": commit["subject"].strip(),
-        "body": commit["body"],
-    }
+    return "other", None, subject.strip()
 
 
 # ─────────────────────────────────────────────
 # Formatting
 # ─────────────────────────────────────────────
 
-def format_entry(data: dict, repo_url: str | None = None) -> str:
+def format_entry(data: CommitRecord | dict, repo_url: str | None = None) -> str:
     """Format a parsed commit into a CHANGELOG entry line."""
     emoji = TYPE_EMOJIS.get(data["type"], "❓")
     scope = f"**({data['scope']})** " if data["scope"] else ""
+    if not data["hash"]:
+        # Written before the commit exists (`commit` subcommand)
+        return f"- {emoji} {scope}{data['desc']}\n"
     short_hash = data["hash"][:7]
 
     if repo_url:
@@ -136,80 +362,1532 @@ def format_entry(data: dict, repo_url: str | None = None) -> str:
 # File Operations
 # ─────────────────────────────────────────────
 
-def update_changelog(entry: str, filename: str = "CHANGELOG.md") -> None:
+def update_changelog(
+    entry: str,
+    filename: str = "CHANGELOG.md",
+    clock: Callable[[], datetime] = datetime.now,
+) -> None:
     """Insert a new entry into the CHANGELOG file under today's date section."""
-    today = datetime.now().strftime("%Y-%m-%d")
-    header = f"## [{today}]"
+    today = clock().strftime("%Y-%m-%d")
+    if backfill_changelog([(today, entry)], filename):
+        print(f"✅ {filename} actualizado correctamente.")
+
+
+def backfill_changelog(
+    dated_entries: Iterable[tuple[str, str]],
+    filename: str = "CHANGELOG.md",
+    order: Callable[[str], object] | None = None,
+    drop: str | None = None,
+) -> int:
+    """Merge a stream of (date, entry) pairs into the CHANGELOG in one rewrite.
+
+    Entries must arrive grouped by date, newest first (see `group_dates`,
+    which buffers the batch in memory; this function only holds one group
+    at a time).
+    Each group is spliced between the existing date sections, located
+    through the sidecar section index instead of a rescan. Untouched byte
+    ranges of the old file are copied kernel-side into a temporary file
+    that atomically replaces the original, so only the new entries and a few
+    header bytes ever pass through Python. `order` maps a section label to its
+    sort key (default: the label itself, i.e. ISO dates); the section labelled
+    `drop`, if any, is left out of the result. Returns the number of entries
+    written.
+    """
+    exists = os.path.exists(filename)
+    index = load_section_index(filename) if exists else {"size": 0, "sections": []}
+
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_path = tempfile.mkstemp(prefix=".changelog-", dir=directory)
+    src_fd = os.open(filename, os.O_RDONLY) if exists else -1
+    try:
+        splicer = _Splicer(src_fd, fd)
+        count, new_sections = merge_entries(
+            dated_entries, index["sections"], index["size"], splicer, order, drop
+        )
+        splicer.flush()
+        os.close(fd)
+        fd = -1
+
+        if count == 0:
+            os.unlink(tmp_path)
+            return 0
+        if exists:
+            shutil.copymode(filename, tmp_path)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if fd != -1:
+            os.close(fd)
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    finally:
+        if src_fd != -1:
+            os.close(src_fd)
+
+    st = os.stat(filename)
+    save_section_index(
+        filename,
+        {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sections": new_sections},
+    )
+    return count
+
+
+def merge_entries(
+    dated_entries: Iterable[tuple[str, str]],
+    sections: list[list],
+    size: int,
+    splicer: "_Splicer",
+    order: Callable[[str], object] | None = None,
+    drop: str | None = None,
+) -> tuple[int, list[list]]:
+    """Splice (date, entry) pairs, newest first, between existing date sections.
+
+    `sections` is the [label, offset] index of the source and `size` its
+    length; the splicer copies source ranges and receives the new bytes.
+    Labels are compared through `order` when given (e.g. release ranks) and
+    the bytes of the section labelled `drop` are skipped while copying.
+    Returns the number of entries written and the index of the result.
+    """
+    key = order or (lambda label: label)
+    hole = None  # [start, end) of the dropped section in the source
+    for n, (label, offset) in enumerate(sections):
+        if label == drop:
+            hole = (offset, sections[n + 1][1] if n + 1 < len(sections) else size)
+            sections = sections[:n] + sections[n + 1:]
+            break
+    new_sections: list[list] = []
+    cursor = 0  # next byte of the source not yet copied
+    mapped = 0  # existing sections already carried over to new_sections
+    i = 0  # next existing section not yet passed
+    count = 0
+
+    def copy_until(end: int) -> None:
+        nonlocal cursor, mapped
+        if hole and cursor <= hole[0] < end:
+            copy_until(hole[0])
+            cursor = hole[1]
+        delta = splicer.pos - cursor
+        while mapped < len(sections) and sections[mapped][1] < end:
+            label, offset = sections[mapped]
+            new_sections.append([label, offset + delta])
+            mapped += 1
+        splicer.copy(cursor, end)
+        cursor = end
+
+    if size == 0:
+        splicer.write(b"# Changelog\n\n")
+
+    for date, group in groupby(dated_entries, key=itemgetter(0)):
+        # Existing sections newer than this group stay in front
+        while i < len(sections) and key(sections[i][0]) > key(date):
+            i += 1
+
+        if i < len(sections) and sections[i][0] == date:
+            # Same day: new entries go on top of the existing ones
+            copy_until(_section_body_offset(splicer, sections[i][1]))
+            splicer.newline()
+            i += 1
+        else:
+            copy_until(sections[i][1] if i < len(sections) else size)
+            splicer.blank()
+            new_sections.append([date, splicer.pos])
+            splicer.write(f"## [{date}]\n\n".encode("utf-8"))
+
+        for _, entry in group:
+            splicer.write(entry.encode("utf-8"))
+            count += 1
+        if i < len(sections) and sections[i][1] == cursor:
+            splicer.blank()
+
+    # Untouched tail of the source
+    copy_until(size)
+    return count, new_sections
+
+
+class _Splicer:
+    """Assemble a file from byte ranges of another file plus new bytes."""
+
+    def __init__(self, src_fd: int, dst_fd: int):
+        self.src_fd = src_fd
+        self.dst_fd = dst_fd
+        self.buffer = bytearray()
+        self.pos = 0
+        self.tail = b""  # last two bytes written, to manage blank lines
+
+    def write(self, data: bytes) -> None:
+        self.buffer += data
+        self.pos += len(data)
+        self.tail = (self.tail + data)[-2:]
+        if len(self.buffer) >= READ_CHUNK:
+            self.flush()
+
+    def copy(self, start: int, end: int) -> None:
+        if end <= start:
+            return
+        self.flush()
+        _copy_range(self.src_fd, self.dst_fd, start, end - start)
+        self.pos += end - start
+        last = min(2, end - start)
+        self.tail = (self.tail + self.read_at(end - last, last))[-2:]
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        return os.pread(self.src_fd, size, offset)
+
+    def flush(self) -> None:
+        written = 0
+        with memoryview(self.buffer) as view:
+            while written < len(view):
+                written += os.write(self.dst_fd, view[written:])
+        self.buffer.clear()
+
+    def newline(self) -> None:
+        """Make sure the output ends at the start of a line."""
+        if self.tail and not self.tail.endswith(b"\n"):
+            self.write(b"\n")
+
+    def blank(self) -> None:
+        """Make sure the output ends with a blank separator line."""
+        if self.pos and self.tail != b"\n\n":
+            self.write(b"\n" if self.tail.endswith(b"\n") else b"\n\n")
+
+
+class _BufferSplicer(_Splicer):
+    """Same as `_Splicer`, but from an in-memory source into a bytearray."""
+
+    def __init__(self, src: bytes):
+        super().__init__(-1, -1)
+        self.src = src
+        self.out = bytearray()
+
+    def copy(self, start: int, end: int) -> None:
+        if end <= start:
+            return
+        self.flush()
+        self.out += self.src[start:end]
+        self.pos += end - start
+        self.tail = (self.tail + self.src[max(start, end - 2):end])[-2:]
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        return self.src[offset:offset + size]
+
+    def flush(self) -> None:
+        self.out += self.buffer
+        self.buffer.clear()
+
+
+def _copy_range(src_fd: int, dst_fd: int, offset: int, count: int) -> None:
+    """Append `count` bytes of `src_fd` starting at `offset` to `dst_fd`.
+
+    Uses `os.copy_file_range` (reflink/in-kernel copy) when available, then
+    `os.sendfile`, and finally a plain read/write loop.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            while count > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, count, offset_src=offset)
+                if copied == 0:
+                    break
+                offset += copied
+                count -= copied
+        except OSError:
+            pass
+
+    if count > 0 and hasattr(os, "sendfile"):
+        try:
+            while count > 0:
+                sent = os.sendfile(dst_fd, src_fd, offset, count)
+                if sent == 0:
+                    break
+                offset += sent
+                count -= sent
+        except OSError:
+            pass
+
+    while count > 0:
+        chunk = os.pread(src_fd, min(count, READ_CHUNK), offset)
+        if not chunk:
+            break
+        os.write(dst_fd, chunk)
+        offset += len(chunk)
+        count -= len(chunk)
+
+
+def _section_body_offset(splicer: _Splicer, offset: int) -> int:
+    """Offset right after a section header line and its blank line, if any."""
+    head = splicer.read_at(offset, 512)
+    newline = head.find(b"\n")
+    if newline == -1:
+        return offset + len(head)
+    body = newline + 1
+    if head[body:body + 1] == b"\n":
+        body += 1
+    return offset + body
+
+
+# ─────────────────────────────────────────────
+# Section Index
+# ─────────────────────────────────────────────
+
+_INDEX_CACHE: dict[str, dict] = {}
 
-    # Read existing content
-    content: list[str] = []
+
+def build_section_index(filename: str) -> dict:
+    """Scan `filename` once and map every '## [label]' header to its byte offset."""
+    with open(filename, "rb") as f:
+        sections = scan_sections(f)
+        st = os.fstat(f.fileno())
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sections": sections}
+
+
+def scan_sections(lines: Iterable[bytes]) -> list[list]:
+    """Return [label, offset] for every '## [label]' header among `lines`."""
+    sections = []
+    offset = 0
+    for line in lines:
+        if line.startswith(b"## ["):
+            label = line[4:].split(b"]", 1)[0].decode("utf-8", "replace")
+            sections.append([label, offset])
+        offset += len(line)
+    return sections
+
+
+def load_section_index(filename: str) -> dict:
+    """Return the section index of `filename`, rebuilding it only when stale.
+
+    The index is cached in memory and persisted next to the watermark; both
+    copies are validated against the file's mtime and size.
+    """
+    st = os.stat(filename)
+    key = os.path.abspath(filename)
+
+    index = _INDEX_CACHE.get(key)
+    if index is None:
+        try:
+            with open(state_path(filename, "index"), "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = None
+
+    if (
+        index is None
+        or index.get("mtime_ns") != st.st_mtime_ns
+        or index.get("size") != st.st_size
+    ):
+        index = build_section_index(filename)
+        save_section_index(filename, index)
+    _INDEX_CACHE[key] = index
+    return index
+
+
+def save_section_index(filename: str, index: dict) -> None:
+    """Persist the section index of `filename` atomically."""
+    _INDEX_CACHE[os.path.abspath(filename)] = index
+    path = state_path(filename, "index")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+# ─────────────────────────────────────────────
+# Embeddable API
+# ─────────────────────────────────────────────
+
+def parse_commits(commits: Iterable[dict]) -> list[CommitRecord]:
+    """Parse a batch of commit dicts (`hash`, `subject` and optional `body`)."""
+    return [parse_commit({"body": "", **commit}) for commit in commits]
+
+
+def render_entries(
+    records: Iterable[CommitRecord], repo_url: str | None = None
+) -> list[str]:
+    """Render a batch of parsed commits into CHANGELOG entry lines."""
+    return [format_entry(record, repo_url) for record in records]
+
+
+def read_text(filename: str) -> str | None:
+    """Default reader for `Changelog.load`: file contents, or None if missing."""
+    if not os.path.exists(filename):
+        return None
+    with open(filename, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def write_text(filename: str, text: str) -> None:
+    """Default writer for `Changelog.save`: atomic replace through a temp file."""
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_path = tempfile.mkstemp(prefix=".changelog-", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class Changelog:
+    """In-memory CHANGELOG buffer for in-process use (no prints, no implicit I/O).
+
+    Entries are merged with the same logic as the file writer, so saving a
+    buffer produces exactly what the CLI would have written. The clock is
+    only consulted for entries without an explicit date.
+
+    Example:
+        log = Changelog.load("CHANGELOG.md", clock=lambda: fixed_now)
+        log.add_commits([{"hash": h, "subject": "feat(api): x", "date": "2024-05-01"}])
+        log.save("CHANGELOG.md")
+    """
+
+    def __init__(self, text: str = "", clock: Callable[[], datetime] = datetime.now):
+        self.clock = clock
+        self._data = text.encode("utf-8")
+        self._sections = scan_sections(self._data.splitlines(keepends=True))
+
+    @classmethod
+    def load(
+        cls,
+        filename: str,
+        reader: Callable[[str], str | None] = read_text,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> "Changelog":
+        return cls(reader(filename) or "", clock)
+
+    def save(self, filename: str, writer: Callable[[str, str], None] = write_text) -> None:
+        writer(filename, self.text)
+
+    @property
+    def text(self) -> str:
+        return self._data.decode("utf-8")
+
+    @property
+    def sections(self) -> list[str]:
+        """Section labels in file order (e.g. dates, newest first)."""
+        return [label for label, _ in self._sections]
+
+    def add(self, entries: Iterable[str], date: str | None = None) -> int:
+        """Add rendered entries under `date` (default: today per the clock)."""
+        date = date or self.clock().strftime("%Y-%m-%d")
+        return self.merge((date, entry) for entry in entries)
+
+    def add_commits(self, commits: Iterable[dict], repo_url: str | None = None) -> int:
+        """Parse, render and add commits (newest first) under their own dates."""
+        today = self.clock().strftime("%Y-%m-%d")
+        return self.merge(group_dates(
+            (commit.get("date") or today, entry)
+            for commit, entry in (
+                (commit, format_entry(parse_commit({"body": "", **commit}), repo_url))
+                for commit in commits
+            )
+        ))
+
+    def merge(self, dated_entries: Iterable[tuple[str, str]]) -> int:
+        """Merge (date, entry) pairs, newest first. Returns entries added."""
+        splicer = _BufferSplicer(self._data)
+        count, sections = merge_entries(
+            dated_entries, self._sections, len(self._data), splicer
+        )
+        if count:
+            splicer.flush()
+            self._data = bytes(splicer.out)
+            self._sections = sections
+        return count
+
+
+# ─────────────────────────────────────────────
+# State (watermark + hash index)
+# ─────────────────────────────────────────────
+
+def find_repo(start: str = ".") -> tuple[str, str] | None:
+    """Return (worktree root, git dir) for `start`, following `.git` files of worktrees."""
+    path = os.path.abspath(start)
+    while True:
+        candidate = os.path.join(path, ".git")
+        if os.path.isdir(candidate):
+            return path, candidate
+        if os.path.isfile(candidate):
+            with open(candidate, "r", encoding="utf-8") as f:
+                line = f.read().strip()
+            if line.startswith("gitdir:"):
+                return path, os.path.normpath(os.path.join(path, line[7:].strip()))
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def state_path(filename: str, suffix: str) -> str:
+    """Path of a state file for `filename` (one set of files per changelog).
+
+    State lives in `.git/changelog-updater/` so it never shows up in the
+    working tree; outside a repository it falls back to `.tmp/`.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    repo = find_repo(directory)
+    if repo:
+        root, git_dir = repo
+        base = os.path.join(git_dir, STATE_DIR_NAME)
+    else:
+        root = directory
+        base = os.path.join(directory, ".tmp", STATE_DIR_NAME)
+
+    rel = os.path.relpath(os.path.abspath(filename), root)
+    key = re.sub(r"[^\w.-]", "_", rel)
+    return os.path.join(base, f"{key}.{suffix}")
+
+
+def read_watermark(filename: str) -> str | None:
+    """Return the hash of the last commit written to `filename`, if any."""
+    path = state_path(filename, "watermark")
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().strip() or None
+
+
+def write_watermark(filename: str, commit_hash: str) -> None:
+    """Atomically record `commit_hash` as the last processed commit."""
+    path = state_path(filename, "watermark")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(commit_hash + "\n")
+    os.replace(tmp_path, path)
+
+
+class HashIndex:
+    """Commits recorded in one changelog.
+
+    Full hashes are compared exactly. Entries only known from the markdown
+    (rebuilt from a short `abc1234` reference) keep their 7-character prefix
+    and are the only ones matched by prefix.
+    """
+
+    __slots__ = ("full", "short")
+
+    def __init__(self, hashes: Iterable[str] = ()):
+        self.full: set[str] = set()
+        self.short: set[str] = set()
+        self.update(hashes)
+
+    def __contains__(self, commit_hash: str) -> bool:
+        return commit_hash in self.full or commit_hash[:SHORT_HASH_LEN] in self.short
+
+    def __iter__(self) -> Iterator[str]:
+        return chain(self.full, self.short)
+
+    def __len__(self) -> int:
+        return len(self.full) + len(self.short)
+
+    def update(self, hashes: Iterable[str]) -> None:
+        for commit_hash in hashes:
+            if FULL_HASH_PATTERN.match(commit_hash):
+                self.full.add(commit_hash)
+            else:
+                self.short.add(commit_hash[:SHORT_HASH_LEN])
+
+
+_HASH_CACHE: dict[str, tuple[int, HashIndex]] = {}
+
+
+def load_hash_index(filename: str) -> HashIndex:
+    """Load the commits already recorded in `filename`.
+
+    The index is an append-only sidecar file, cached in memory while its size
+    does not change. When it does not exist yet it is rebuilt once from the
+    changelog itself: full hashes from commit links, short ones otherwise,
+    and entries without a reference matched back to their commits.
+    """
+    path = state_path(filename, "hashes")
+    if os.path.exists(path):
+        size = os.path.getsize(path)
+        cached = _HASH_CACHE.get(path)
+        if cached is not None and cached[0] == size:
+            return cached[1]
+        with open(path, "r", encoding="utf-8") as f:
+            recorded = HashIndex(line.strip() for line in f if line.strip())
+        _HASH_CACHE[path] = (size, recorded)
+        return recorded
+
+    recorded = HashIndex()
+    hashless: list[tuple[str, str | None, str]] = []
     if os.path.exists(filename):
         with open(filename, "r", encoding="utf-8") as f:
-            content = f.readlines()
-
-    # Case 1: File doesn't exist or is empty
-    if not content:
-        new_content = [
-            "# Changelog\n",
-            "\n",
-            f"{header}\n",
-            "\n",
-            entry,
-        ]
-        _write(filename, new_content)
+            for line in f:
+                refs = HASH_REF_PATTERN.findall(line)
+                match = ENTRY_PATTERN.match(line)
+                linked = (match["url"] or "").rsplit("/", 1)[-1] if match else ""
+                recorded.update([linked] if FULL_HASH_PATTERN.match(linked) else refs)
+                if match and not refs:
+                    hashless.append(
+                        (EMOJI_TYPES.get(match["emoji"], "other"), match["scope"], match["desc"])
+                    )
+    if hashless:
+        cwd = os.path.dirname(os.path.abspath(filename))
+        recorded.update(h for h in match_hashless(hashless, recorded, cwd) if h)
+    append_hash_index(filename, recorded)
+    return recorded
+
+
+def match_hashless(
+    entries: list[tuple[str, str | None, str]], known: HashIndex, cwd: str | None = None
+) -> list[str | None]:
+    """Find the commits of entries written without a hash reference.
+
+    `entries` are (type, scope, desc) triples, newest first. One `git log`
+    pass pairs each with the newest commit whose subject parses to the same
+    triple and that is not in `known` (already referenced by another
+    entry); the walk stops as soon as every entry is paired.
+    Returns the full hashes, with None where nothing matches (e.g. a line
+    written by hand) or `cwd` is not a repository.
+    """
+    pending: dict[tuple, list[int]] = {}
+    for n, key in enumerate(entries):
+        pending.setdefault(key, []).append(n)
+    found: list[str | None] = [None] * len(entries)
+    left = len(entries)
+    try:
+        for commit in iter_commits(cwd=cwd):
+            if commit["hash"] in known:
+                continue
+            slots = pending.get(classify_subject(commit["subject"]))
+            if slots:
+                found[slots.pop(0)] = commit["hash"]
+                left -= 1
+                if not left:
+                    break
+    except RuntimeError:
+        pass
+    return found
+
+
+def append_hash_index(filename: str, hashes: Iterable[str]) -> None:
+    """Append newly recorded hashes to the sidecar index."""
+    path = state_path(filename, "hashes")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    hashes = list(hashes)
+    with open(path, "a", encoding="utf-8") as f:
+        f.writelines(f"{h}\n" for h in hashes)
+
+    cached = _HASH_CACHE.get(path)
+    if cached is not None:
+        cached[1].update(hashes)
+        _HASH_CACHE[path] = (os.path.getsize(path), cached[1])
+
+
+@contextmanager
+def changelog_lock(filename: str) -> Iterator[None]:
+    """Serialize writers of `filename` across processes (no-op without fcntl)."""
+    try:
+        import fcntl
+    except ImportError:
+        yield
         return
 
-    # Case 2: Today's section already exists
-    date_index = _find_line(content, header)
-    if date_index != -1:
-        # Insert after the header + blank line
-        insert_at = date_index + 2
-        # Make sure we don't go past the file length
-        insert_at = min(insert_at, len(content))
-        content.insert(insert_at, entry)
-        _write(filename, content)
+    path = state_path(filename, "lock")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def sync_changelog(
+    filename: str = "CHANGELOG.md",
+    repo_url: str | None = None,
+    backend: str = "cli",
+    cwd: str | None = None,
+    group_by: str = "date",
+    scope_map: dict[str, str] | None = None,
+    emit: Iterable[str] = (),
+) -> int:
+    """Register exactly the commits between the stored watermark and HEAD.
+
+    Safe to call any number of times: already recorded commits are skipped
+    and the watermark only moves forward. Returns the number of entries
+    written; raises RuntimeError if git fails.
+    """
+    with changelog_lock(filename):
+        watermark = read_watermark(filename)
+        if watermark:
+            try:
+                count, newest = register_commits(
+                    iter_commits(f"{watermark}..HEAD", backend=backend, cwd=cwd),
+                    filename,
+                    repo_url,
+                    group_by,
+                    scope_map,
+                    emit,
+                )
+            except RuntimeError:
+                # Watermark no longer resolvable (gc'd, history rewritten...)
+                print(f"⚠️ Watermark {watermark[:SHORT_HASH_LEN]} no válido, se usa solo HEAD.")
+                watermark = None
+        if not watermark:
+            count, newest = register_commits(
+                iter_commits(max_count=1, backend=backend, cwd=cwd),
+                filename,
+                repo_url,
+                group_by,
+                scope_map,
+                emit,
+            )
+
+        if newest:
+            write_watermark(filename, newest)
+    return count
+
+
+def register_commits(
+    commits: Iterable[dict],
+    filename: str,
+    repo_url: str | None,
+    group_by: str = "date",
+    scope_map: dict[str, str] | None = None,
+    emit: Iterable[str] = (),
+) -> tuple[int, str | None]:
+    """Write every commit not yet in the hash index to the changelog.
+
+    With group_by="release" entries go under the first tag that contains
+    their commit (or "Unreleased") instead of their commit date; when new
+    tags appear, the "Unreleased" lines of every changelog (see
+    `changelog_files`) move to their release, new entries or not. With a
+    `scope_map` each entry is routed to the changelog of its scope (see
+    `route_scope`); entries are bucketed per file during the single pass
+    over `commits` and every file is then rewritten exactly once. The same
+    parsed rows then feed the query index and every format named in `emit`.
+    Returns the number of entries written and the hash of the newest commit
+    seen (recorded or not), which callers use as the next watermark.
+    """
+    recorded: dict[str, HashIndex] = {}
+    newest: str | None = None
+    written: dict[str, list[tuple]] = {}  # target -> rows for the query index
+
+    releases = None
+    if group_by == "release":
+        from release_index import ReleaseIndex
+
+        releases = ReleaseIndex.load(
+            state_path(filename, "releases"),
+            cwd=os.path.dirname(os.path.abspath(filename)),
+        )
+
+    def fresh() -> Iterator[tuple[str, str, str]]:
+        nonlocal newest
+        for commit in commits:
+            if newest is None:
+                newest = commit["hash"]
+            record = parse_commit(commit)
+            target = route_scope(record.scope, scope_map, filename) if scope_map else filename
+            if target not in recorded:
+                recorded[target] = load_hash_index(target)
+            if commit["hash"] in recorded[target]:
+                continue
+            label = releases.label_of(commit["hash"]) if releases else commit["date"]
+            written.setdefault(target, []).append((
+                commit["hash"], commit["hash"][:SHORT_HASH_LEN], record.type,
+                record.scope, commit["date"], label, record.desc, target,
+            ))
+            yield target, label, format_entry(record, repo_url)
+
+    if scope_map:
+        buckets: dict[str, list[tuple[str, str]]] = {}
+        for target, label, entry in fresh():
+            buckets.setdefault(target, []).append((label, entry))
+        if releases and releases.released:
+            # New tags: a changelog without new entries may still hold
+            # "Unreleased" lines that now belong to a release
+            present = {os.path.normpath(target) for target in buckets}
+            for target in changelog_files(filename, scope_map):
+                if target not in present:
+                    buckets[target] = []
+        batches = buckets.items()
+    else:
+        batches = [(filename, ((label, entry) for _, label, entry in fresh()))]
+
+    count = 0
+    for target, labeled_entries in batches:
+        count += write_entries(labeled_entries, target, releases)
+    for target, rows in written.items():
+        append_hash_index(target, [row[0] for row in rows])
+    if written:
+        index_entries(filename, written, scope_map)
+    if written or (releases and releases.released):
+        emit_entries(filename, written, emit, releases)
+    return count, newest
+
+
+def emit_entries(
+    filename: str, written: dict[str, list[tuple]], emit: Iterable[str], releases=None
+) -> None:
+    """Hand the rows of one batch to each requested emitter (one write each).
+
+    `releases` (group_by="release") gives the emitters the section order
+    and the commits whose "Unreleased" entries now belong to a release.
+    """
+    if not emit:
         return
+    from changelog_emitters import EMITTERS
+
+    rows = [dict(zip(ENTRY_FIELDS, row)) for row in chain.from_iterable(written.values())]
+    for name in emit:
+        EMITTERS[name](filename).write(rows, releases)
 
-    # Case 3: Other date sections exist — insert before the first one
-    first_section = _find_first_section(content)
-    if first_section != -1:
-        new_section = [f"\n{header}\n", "\n", entry, "\n"]
-        new_content = content[:first_section] + new_section + content[first_section:]
-        _write(filename, new_content)
+
+def index_entries(
+    filename: str, written: dict[str, list[tuple]], scope_map: dict[str, str] | None = None
+) -> None:
+    """Add freshly written entries to the SQLite query index of `filename`.
+
+    When the index does not exist yet it is built from the changelogs
+    themselves (see `changelog_files`), which already contain the new
+    entries. Skipped silently if Python was built without sqlite3.
+    """
+    try:
+        import changelog_db
+    except ImportError:
         return
 
-    # Case 4: Fallback — append at the end
-    content.extend([f"\n{header}\n", "\n", entry])
-    _write(filename, content)
+    path = state_path(filename, "db")
+    exists = os.path.exists(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = changelog_db.connect(path)
+    try:
+        with conn:
+            if exists:
+                changelog_db.insert(conn, chain.from_iterable(written.values()))
+            else:
+                changelog_db.rebuild(conn, changelog_files(filename, scope_map))
+    finally:
+        conn.close()
+
+
+def write_entries(
+    labeled_entries: Iterable[tuple[str, str]], filename: str, releases=None
+) -> int:
+    """Merge (label, entry) pairs into one changelog with a single rewrite."""
+    if not releases:
+        return backfill_changelog(group_dates(labeled_entries), filename)
+
+    # New tags: entries waiting under "Unreleased" move to their release
+    carried = unreleased_entries(filename, releases) if releases.released else []
+    count = backfill_changelog(
+        group_releases(chain(labeled_entries, carried), releases.rank),
+        filename,
+        releases.rank,
+        drop=UNRELEASED if carried else None,
+    )
+    return count - len(carried)
+
+
+def route_scope(scope: str | None, scope_map: dict[str, str], filename: str) -> str:
+    """Changelog for a commit scope, or `filename` when the scope is not mapped.
+
+    Map values are paths relative to the directory of `filename`. The "*"
+    key is a template such as "packages/{scope}/CHANGELOG.md", used only
+    when the resulting directory exists.
+    """
+    if not scope:
+        return filename
+    target = scope_map.get(scope) or scope_map.get(scope.lower())
+    if target is None and "*" in scope_map and SCOPE_NAME_PATTERN.fullmatch(scope):
+        for name in dict.fromkeys((scope, scope.lower())):
+            candidate = scope_map["*"].format(scope=name)
+            if os.path.isdir(os.path.join(os.path.dirname(filename), os.path.dirname(candidate))):
+                target = candidate
+                break
+    if target is None:
+        return filename
+    return os.path.join(os.path.dirname(filename), target)
+
+
+def load_scope_map(path: str) -> dict[str, str]:
+    """Read a JSON object mapping scopes to changelog paths."""
+    with open(path, "r", encoding="utf-8") as f:
+        scope_map = json.load(f)
+    if not isinstance(scope_map, dict) or not all(
+        isinstance(k, str) and isinstance(v, str) for k, v in scope_map.items()
+    ):
+        raise ValueError("el mapa de scopes debe ser un objeto JSON {scope: ruta}")
+    return scope_map
+
+
+def changelog_files(filename: str, scope_map: dict[str, str] | None = None) -> list[str]:
+    """Every existing changelog whose entries belong to the index of `filename`.
+
+    That is `filename` itself, the changelogs its `scope_map` routes to (the
+    "*" template expanded over the packages present) and the per-year
+    archives linked from the prelude of each of them by `rotate_changelog`.
+    """
+    base = os.path.dirname(filename)
+    files = [filename]
+    for scope, target in (scope_map or {}).items():
+        if scope == "*":
+            pattern = os.path.join(glob.escape(base), target.replace("{scope}", "*"))
+            files += sorted(glob.glob(pattern))
+        else:
+            files.append(os.path.join(base, target))
+    files = [path for path in dict.fromkeys(map(os.path.normpath, files)) if os.path.isfile(path)]
+
+    archives = []
+    for path in files:
+        sections = load_section_index(path)["sections"]
+        with open(path, "rb") as f:
+            prelude = f.read(sections[0][1]) if sections else f.read()
+        for line in prelude.decode("utf-8", "replace").splitlines():
+            if line.startswith(ARCHIVE_LINE_PREFIX):
+                archives += [
+                    os.path.normpath(os.path.join(os.path.dirname(path), link))
+                    for link in re.findall(r"\]\(([^)]+)\)", line)
+                ]
+    return list(dict.fromkeys(files + [path for path in archives if os.path.isfile(path)]))
+
+
+def unreleased_entries(filename: str, releases) -> list[tuple[str, str]]:
+    """Relabel the lines of the "Unreleased" section with their release.
+
+    Only commits assigned by the latest index update can have left the
+    section; everything else (including hand-written lines) stays there.
+    """
+    if not os.path.exists(filename):
+        return []
+    index = load_section_index(filename)
+    sections = index["sections"]
+    for n, (label, offset) in enumerate(sections):
+        if label == UNRELEASED:
+            end = sections[n + 1][1] if n + 1 < len(sections) else index["size"]
+            break
+    else:
+        return []
+
+    with open(filename, "rb") as f:
+        f.seek(offset)
+        lines = f.read(end - offset).decode("utf-8").splitlines()[1:]
+
+    released = {sha[:SHORT_HASH_LEN]: sha for sha in releases.released}
+    entries = []
+    for line in lines:
+        if not line.strip():
+            continue
+        label = UNRELEASED
+        for ref in HASH_REF_PATTERN.findall(line):
+            if ref[:SHORT_HASH_LEN] in released:
+                label = releases.label_of(released[ref[:SHORT_HASH_LEN]])
+                break
+        entries.append((label, line + "\n"))
+    return entries
+
+
+def group_dates(dated_entries: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Regroup (date, entry) pairs newest date first.
+
+    `--date=short` renders each commit in its committer's timezone and log
+    order follows the commit graph, so dates are not monotone along the
+    log. Entries keep their log order within each date. The whole batch is
+    held in memory until the last commit arrives, so memory grows with the
+    range (one formatted line per commit).
+    """
+    return group_releases(dated_entries, rank=lambda date: date)
+
+
+def group_releases(
+    labeled_entries: Iterable[tuple[str, str]], rank: Callable[[str], object]
+) -> list[tuple[str, str]]:
+    """Regroup (release, entry) pairs newest release first.
+
+    Commits from parallel branches interleave in `git log` order, so unlike
+    dates the releases are not contiguous; entries keep their log order
+    within each release.
+    """
+    buckets: dict[str, list[str]] = {}
+    for label, entry in labeled_entries:
+        buckets.setdefault(label, []).append(entry)
+    return [
+        (label, entry)
+        for label in sorted(buckets, key=rank, reverse=True)
+        for entry in buckets[label]
+    ]
+
+
+# ─────────────────────────────────────────────
+# Rotation (archive old sections)
+# ─────────────────────────────────────────────
+
+def rotate_changelog(
+    filename: str = "CHANGELOG.md",
+    keep_days: int | None = None,
+    keep: int | None = None,
+    archive_dir: str = "changelogs",
+    clock: Callable[[], datetime] = datetime.now,
+) -> dict[str, int]:
+    """Move old date sections into per-year archive files.
+
+    A section is archived when its date is more than `keep_days` days old or
+    when it is not among the `keep` newest sections. Archived sections are
+    merged into `<archive_dir>/<year>.md` (relative to the changelog) and the
+    prelude of the main file gets a line linking every archive. The file is
+    streamed section by section through the section index, so memory use is
+    bounded by the largest single section. Returns sections moved per year.
+    """
+    with changelog_lock(filename):
+        index = load_section_index(filename)
+        sections, size = index["sections"], index["size"]
+        ranges = [
+            (label, offset, sections[n + 1][1] if n + 1 < len(sections) else size)
+            for n, (label, offset) in enumerate(sections)
+        ]
+
+        dated = sorted(
+            (r for r in ranges if DATE_LABEL_PATTERN.fullmatch(r[0])),
+            key=itemgetter(0),
+            reverse=True,
+        )
+        cutoff = None
+        if keep_days is not None:
+            cutoff = datetime.fromordinal(clock().toordinal() - keep_days).strftime("%Y-%m-%d")
+        archived = {
+            r for n, r in enumerate(dated)
+            if (keep is not None and n >= keep) or (cutoff is not None and r[0] < cutoff)
+        }
+        if not archived:
+            return {}
+
+        base = os.path.dirname(filename)
+        by_year: dict[str, list[tuple[str, int, int]]] = {}
+        for section in sorted(archived, key=itemgetter(0), reverse=True):
+            by_year.setdefault(section[0][:4], []).append(section)
+
+        moved: dict[str, int] = {}
+        with open(filename, "rb") as src:
+            splicer = _Splicer(src.fileno(), -1)
+            for year, year_sections in by_year.items():
+                path = os.path.join(base, archive_dir, f"{year}.md")
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                if os.path.exists(path):
+                    # Sections already there come from an interrupted earlier run
+                    present = {label for label, _ in load_section_index(path)["sections"]}
+                    year_sections = [s for s in year_sections if s[0] not in present]
+                else:
+                    with open(path, "w", encoding="utf-8") as f:
+                        f.write(f"# Changelog {year}\n\n")
+                moved[year] = backfill_changelog(
+                    _section_bodies(splicer, year_sections), path
+                )
+
+        years = sorted(
+            {name[:-3] for name in os.listdir(os.path.join(base, archive_dir))
+             if re.fullmatch(r"\d{4}\.md", name)},
+            reverse=True,
+        )
+        links = " · ".join(f"[{y}]({archive_dir}/{y}.md)" for y in years)
+        _rewrite_without(filename, ranges, archived, f"{ARCHIVE_LINE_PREFIX} {links}")
+    return moved
 
 
-def _find_line(content: list[str], target: str) -> int:
-    """Find the index of a line matching the target string."""
-    for i, line in enumerate(content):
-        if line.strip() == target.strip():
-            return i
-    return -1
+def _section_bodies(
+    splicer: "_Splicer", sections: list[tuple[str, int, int]]
+) -> Iterator[tuple[str, str]]:
+    """Yield (date, body) for each section, read lazily from the source."""
+    for label, start, end in sections:
+        body_start = _section_body_offset(splicer, start)
+        body = splicer.read_at(body_start, end - body_start).rstrip(b"\n")
+        yield label, body.decode("utf-8") + "\n"
 
 
-def _find_first_section(content: list[str]) -> int:
-    """Find the first '## [' section header after the title."""
-    for i, line in enumerate(content):
-        if line.startswith("## [") and i > 0:
-            return i
-    return -1
+def _rewrite_without(
+    filename: str,
+    ranges: list[tuple[str, int, int]],
+    dropped: set[tuple[str, int, int]],
+    archive_line: str,
+) -> None:
+    """Rewrite `filename` without the `dropped` sections and with `archive_line`."""
+    first = ranges[0][1] if ranges else os.path.getsize(filename)
+    with open(filename, "rb") as f:
+        prelude = f.read(first)
+    lines = [l for l in prelude.splitlines(keepends=True) if not l.startswith(ARCHIVE_LINE_PREFIX.encode("utf-8"))]
+    while lines and not lines[-1].strip():
+        lines.pop()
+    lines.append(f"\n{archive_line}\n".encode("utf-8"))
 
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_path = tempfile.mkstemp(prefix=".changelog-", dir=directory)
+    src_fd = os.open(filename, os.O_RDONLY)
+    new_sections = []
+    try:
+        splicer = _Splicer(src_fd, fd)
+        splicer.write(b"".join(lines))
+        for section in ranges:
+            if section in dropped:
+                continue
+            label, start, end = section
+            splicer.blank()
+            new_sections.append([label, splicer.pos])
+            splicer.copy(start, end)
+        splicer.flush()
+        os.close(fd)
+        fd = -1
+        shutil.copymode(filename, tmp_path)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if fd != -1:
+            os.close(fd)
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    finally:
+        os.close(src_fd)
 
-def _write(filename: str, lines: list[str]) -> None:
-    """Write lines to file."""
-    with open(filename, "w", encoding="utf-8") as f:
-        f.writelines(lines)
-    print(f"✅ {filename} actualizado correctamente.")
+    st = os.stat(filename)
+    save_section_index(
+        filename,
+        {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sections": new_sections},
+    )
+
+
+# ─────────────────────────────────────────────
+# Fleet (many repositories)
+# ─────────────────────────────────────────────
+
+def expand_repos(patterns: Iterable[str]) -> list[str]:
+    """Expand paths and glob patterns into the git worktrees they match."""
+    repos: list[str] = []
+    seen: set[str] = set()
+    for pattern in patterns:
+        pattern = os.path.expanduser(pattern)
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            path = os.path.abspath(path)
+            if path in seen or not os.path.isdir(path):
+                continue
+            if os.path.exists(os.path.join(path, ".git")):
+                seen.add(path)
+                repos.append(path)
+    return repos
+
+
+def update_repo(
+    repo: str,
+    filename: str = "CHANGELOG.md",
+    repo_url: str | None = None,
+    backend: str = "cli",
+    rev_range: str | None = None,
+    since: str | None = None,
+    group_by: str = "date",
+    scope_map: dict[str, str] | None = None,
+    emit: Iterable[str] = (),
+) -> dict:
+    """Update the changelog of one repository and return a JSON-able report.
+
+    Never raises: failures are reported in the result so a broken repository
+    cannot take a fleet run down with it.
+    """
+    started = time.perf_counter()
+    path = os.path.join(repo, filename)
+    log = io.StringIO()
+    report = {"repo": repo, "file": path, "ok": True, "entries": 0, "error": None}
+    try:
+        with redirect_stdout(log):
+            if rev_range or since:
+                with changelog_lock(path):
+                    report["entries"], _ = register_commits(
+                        iter_commits(rev_range, since, backend=backend, cwd=repo),
+                        path,
+                        repo_url,
+                        group_by,
+                        scope_map,
+                        emit,
+                    )
+            else:
+                report["entries"] = sync_changelog(
+                    path, repo_url, backend, repo, group_by, scope_map, emit
+                )
+    except Exception as e:
+        report["ok"] = False
+        report["error"] = f"{type(e).__name__}: {e}"
+    report["seconds"] = round(time.perf_counter() - started, 4)
+    if log.getvalue():
+        report["messages"] = log.getvalue().splitlines()
+    return report
+
+
+_FLEET_TASKS = None  # (start times, worker pids) per fleet task, shared with the pool
+
+
+def _init_fleet_worker(starts, pids) -> None:
+    global _FLEET_TASKS
+    _FLEET_TASKS = (starts, pids)
+
+
+def _fleet_task(n: int, repo: str, options: dict) -> dict:
+    """Record when (and in which worker) task `n` starts, then run it."""
+    starts, pids = _FLEET_TASKS
+    pids[n] = os.getpid()
+    starts[n] = time.monotonic()
+    return update_repo(repo, **options)
+
+
+def run_fleet(
+    repos: list[str],
+    workers: int | None = None,
+    timeout: float = FLEET_TIMEOUT,
+    **options,
+) -> list[dict]:
+    """Update many repositories in a bounded process pool.
+
+    Each repository runs in its own task; a repository that does not finish
+    within `timeout` seconds of its own start (time spent queued behind
+    other repositories does not count) is reported as failed and its worker
+    is killed, so the pool replaces it and the queue keeps moving.
+    """
+    import multiprocessing
+    import signal
+
+    starts = multiprocessing.Array("d", len(repos), lock=False)  # 0 until started
+    pids = multiprocessing.Array("i", len(repos), lock=False)
+    pool = multiprocessing.Pool(workers, _init_fleet_worker, (starts, pids))
+    try:
+        pending = {
+            n: pool.apply_async(_fleet_task, (n, repo, options)) for n, repo in enumerate(repos)
+        }
+        results: dict[int, dict] = {}
+        while pending:
+            now = time.monotonic()
+            for n, result in list(pending.items()):
+                if result.ready():
+                    results[n] = result.get()
+                    del pending[n]
+                elif starts[n] and now - starts[n] > timeout:
+                    del pending[n]
+                    results[n] = {
+                        "repo": repos[n],
+                        "file": os.path.join(repos[n], options.get("filename", "CHANGELOG.md")),
+                        "ok": False,
+                        "entries": 0,
+                        "error": f"timeout tras {timeout:g}s",
+                        "seconds": None,
+                    }
+                    # Unless the worker has already moved on to another task
+                    if not any(starts[m] and pids[m] == pids[n] for m in pending):
+                        try:
+                            os.kill(pids[n], signal.SIGTERM)
+                        except OSError:
+                            pass
+            if pending:
+                next(iter(pending.values())).wait(FLEET_POLL)
+    finally:
+        pool.terminate()
+        pool.join()
+    return [results[n] for n in range(len(repos))]
 
 
 # ─────────────────────────────────────────────
 # CLI
 # ─────────────────────────────────────────────
 
+def backfill(
+    rev_range: str | None,
+    since: str | None,
+    filename: str,
+    repo_url: str | None,
+    backend: str = "cli",
+    group_by: str = "date",
+    scope_map: dict[str, str] | None = None,
+    emit: Iterable[str] = (),
+) -> None:
+    """Register a whole range of commits, grouped by date or release, in one pass."""
+    try:
+        with changelog_lock(filename):
+            count, _ = register_commits(
+                iter_commits(rev_range, since, backend=backend),
+                filename,
+                repo_url,
+                group_by,
+                scope_map,
+                emit,
+            )
+    except RuntimeError as e:
+        print(f"❌ Error ejecutando git: {e}")
+        sys.exit(1)
+
+    if count:
+        print(f"✅ {filename} actualizado correctamente.")
+    print(f"📝 Registradas {count} entradas.")
+
+
+def incremental(
+    filename: str,
+    repo_url: str | None,
+    backend: str = "cli",
+    group_by: str = "date",
+    scope_map: dict[str, str] | None = None,
+    emit: Iterable[str] = (),
+) -> None:
+    """Register exactly the commits between the stored watermark and HEAD."""
+    if os.environ.get(PRECOMMIT_ENV):
+        return  # the entry is already part of the commit
+    try:
+        count = sync_changelog(
+            filename, repo_url, backend, group_by=group_by, scope_map=scope_map, emit=emit
+        )
+    except RuntimeError as e:
+        print(f"❌ Error ejecutando git: {e}")
+        print("⚠️ No se encontró commit o hubo un error de git.")
+        sys.exit(1)
+
+    if count:
+        print(f"✅ {filename} actualizado correctamente.")
+        print(f"📝 Registradas {count} entradas.")
+    else:
+        print("ℹ️ No hay commits nuevos que registrar.")
+
+
+def commit_with_entry(
+    message: str,
+    filename: str = "CHANGELOG.md",
+    git_args: Iterable[str] = (),
+    scope_map: dict[str, str] | None = None,
+    clock: Callable[[], datetime] = datetime.now,
+    emit: Iterable[str] = (),
+) -> int:
+    """Write the entry for `message`, stage it and create one commit with both.
+
+    The hash cannot appear in a file that is part of its own commit, so the
+    entry is written without a commit reference; once `git commit` succeeds
+    the new hash is recorded in the hash index and the query index, which
+    keeps later incremental runs from logging it again. If the commit fails
+    the changelog is restored, both on disk and in the index (whatever was
+    staged for it before, not HEAD's version). Returns git's exit code.
+    """
+    lines = [l for l in message.splitlines() if not l.startswith("#")]
+    subject = next((l.strip() for l in lines if l.strip()), "")
+    commit = {"hash": "", "subject": subject, "body": "", "date": clock().strftime("%Y-%m-%d")}
+    record = parse_commit(commit)
+    target = route_scope(record.scope, scope_map, filename) if scope_map else filename
+    git_args = list(git_args)
+    command = ["git", "commit", "-m", message, *git_args]
+    env = dict(os.environ, **{PRECOMMIT_ENV: "1"})
+
+    if not subject or subject.startswith(AUTOSQUASH_PREFIXES):
+        return subprocess.run(command, env=env).returncode
+
+    # Staging the changelog must not turn "nothing to commit" into a commit
+    staged = subprocess.run(["git", "diff", "--cached", "--quiet"]).returncode != 0
+    if not staged and not {"-a", "--all", "--allow-empty"} & set(git_args):
+        print("❌ No hay cambios preparados para el commit (usa git add o -- -a).")
+        return 1
+
+    with changelog_lock(filename):
+        backup = None
+        if os.path.exists(target):
+            # The rewrite replaces the file, so a hard link keeps the old version
+            backup = state_path(target, "backup")
+            os.makedirs(os.path.dirname(backup), exist_ok=True)
+            if os.path.exists(backup):
+                os.unlink(backup)
+            os.link(target, backup)
+        # What the user had staged for the changelog (all stages, if conflicted)
+        index_entry = subprocess.run(
+            ["git", "ls-files", "-s", "--full-name", "--", target],
+            capture_output=True, text=True, check=True,
+        ).stdout
+
+        result = None
+        try:
+            backfill_changelog([(commit["date"], format_entry(record))], target)
+            subprocess.run(["git", "add", "--", target], check=True)
+            result = subprocess.run(command, env=env)
+        finally:
+            if result is None or result.returncode != 0:
+                if backup:
+                    os.replace(backup, target)
+                elif os.path.exists(target):
+                    os.unlink(target)
+                subprocess.run(["git", "update-index", "-q", "--force-remove", "--", target])
+                if index_entry:
+                    subprocess.run(["git", "update-index", "--index-info"], input=index_entry, text=True)
+        if result.returncode != 0:
+            return result.returncode
+
+        if backup:
+            os.unlink(backup)
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        append_hash_index(target, [head])
+        written = {target: [(
+            head, head[:SHORT_HASH_LEN], record.type, record.scope,
+            commit["date"], commit["date"], record.desc, target,
+        )]}
+        index_entries(filename, written, scope_map)
+        emit_entries(filename, written, emit)
+    return 0
+
+
+def default_socket_path(start: str = ".") -> str:
+    """Socket shared by every worktree of the repository containing `start`."""
+    repo = find_repo(start)
+    git_dir = repo[1] if repo else os.path.abspath(start)
+    commondir_file = os.path.join(git_dir, "commondir")
+    if os.path.exists(commondir_file):
+        with open(commondir_file, "r", encoding="utf-8") as f:
+            git_dir = os.path.normpath(os.path.join(git_dir, f.read().strip()))
+
+    # Unix socket paths are limited to ~100 bytes, so keep them short
+    digest = hashlib.sha1(git_dir.encode("utf-8")).hexdigest()[:12]
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, f"changelog-updater-{digest}.sock")
+
+
+def notify(
+    filename: str,
+    repo_url: str | None,
+    backend: str,
+    socket_path: str | None,
+    group_by: str = "date",
+    scope_map: dict[str, str] | None = None,
+    emit: Iterable[str] = (),
+) -> None:
+    """Hand the update over to a running daemon, or do it inline if there is none."""
+    if os.environ.get(PRECOMMIT_ENV):
+        return  # the entry is already part of the commit
+    import socket
+
+    message = {
+        "cwd": os.getcwd(),
+        "file": os.path.abspath(filename),
+        "repo_url": repo_url,
+        "backend": backend,
+        "group_by": group_by,
+        "scope_map": scope_map,
+        "emit": list(emit),
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(NOTIFY_TIMEOUT)
+            client.connect(socket_path or default_socket_path())
+            client.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            if client.recv(16).startswith(b"ok"):
+                return
+    except OSError:
+        pass
+
+    print("⚠️ Daemon no disponible, actualizando directamente.")
+    incremental(filename, repo_url, backend, group_by, scope_map, emit)
+
+
+def compact(args: argparse.Namespace) -> None:
+    """Archive old sections of the changelog and report what moved."""
+    if not os.path.exists(args.file):
+        print(f"❌ No existe {args.file}")
+        sys.exit(1)
+    moved = rotate_changelog(args.file, args.keep_days, args.keep, args.archive_dir)
+    if not moved:
+        print("ℹ️ No hay secciones que archivar.")
+        return
+    for year, count in sorted(moved.items(), reverse=True):
+        print(f"📦 {count} secciones → {os.path.join(args.archive_dir, year)}.md")
+    print(f"✅ {args.file} compactado correctamente.")
+
+
+def query(args: argparse.Namespace) -> None:
+    """Answer a query from the SQLite index, rebuilding it first if asked."""
+    import changelog_db
+
+    path = state_path(args.file, "db")
+    if args.rebuild or not os.path.exists(path):
+        if not os.path.exists(args.file):
+            print(f"❌ No existe {args.file}")
+            sys.exit(1)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = changelog_db.connect(path)
+        with conn:
+            count = changelog_db.rebuild(conn, changelog_files(args.file, args.scope_map))
+        print(f"🗃️  Índice reconstruido: {count} entradas.", file=sys.stderr)
+    else:
+        conn = changelog_db.connect(path)
+
+    started = time.perf_counter()
+    try:
+        rows = changelog_db.query(
+            conn,
+            commit_type=args.type,
+            scope=args.scope,
+            since=args.since,
+            until=args.until,
+            commit_hash=args.hash,
+            text=args.text,
+            limit=args.limit,
+        )
+    finally:
+        conn.close()
+    elapsed = (time.perf_counter() - started) * 1000
+
+    for row in rows:
+        if args.json:
+            print(json.dumps(dict(row), ensure_ascii=False))
+        else:
+            scope = f"({row['scope']})" if row["scope"] else ""
+            print(f"{row['date'] or row['section']}  {row['short']}  {row['type']}{scope}: {row['desc']}")
+    print(f"🔎 {len(rows)} resultados en {elapsed:.1f} ms", file=sys.stderr)
+    if args.hash and not rows:
+        sys.exit(1)
+
+
+def commit(args: argparse.Namespace) -> None:
+    """Run `git commit` with the changelog entry staged in the same commit."""
+    if args.file_message:
+        with open(args.file_message, "r", encoding="utf-8") as f:
+            message = f.read()
+    else:
+        message = "\n\n".join(args.message or [])
+    if not message.strip():
+        print("❌ Indica el mensaje con -m o -F.")
+        sys.exit(1)
+
+    git_args = args.git_args[1:] if args.git_args[:1] == ["--"] else args.git_args
+    sys.exit(commit_with_entry(message, args.file, git_args, args.scope_map, emit=args.emit))
+
+
+def fleet(args: argparse.Namespace) -> None:
+    """Run the fleet mode and print a JSON report on stdout."""
+    patterns = list(args.repos)
+    if patterns == ["-"]:
+        patterns = [line.strip() for line in sys.stdin if line.strip()]
+    repos = expand_repos(patterns)
+
+    started = time.perf_counter()
+    results = run_fleet(
+        repos,
+        workers=args.workers,
+        timeout=args.timeout,
+        filename=args.file,
+        repo_url=args.repo_url,
+        backend=args.backend,
+        rev_range=args.rev_range,
+        since=args.since,
+        group_by=args.group_by,
+        scope_map=args.scope_map,
+        emit=args.emit,
+    )
+    failed = sum(1 for r in results if not r["ok"])
+    summary = {
+        "repos": len(results),
+        "ok": len(results) - failed,
+        "failed": failed,
+        "entries": sum(r["entries"] for r in results),
+        "seconds": round(time.perf_counter() - started, 4),
+        "results": results,
+    }
+    json.dump(summary, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    if failed:
+        sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Actualiza CHANGELOG.md con el último commit de git."
@@ -224,20 +1902,175 @@ def main():
         default=None,
         help="URL del repositorio para generar links a commits (ej: https://github.com/user/repo)",
     )
+    parser.add_argument(
+        "--range",
+        dest="rev_range",
+        default=None,
+        help="Rango de commits a registrar de una vez (ej: v1.0..HEAD)",
+    )
+    parser.add_argument(
+        "--since",
+        default=None,
+        help="Registra todos los commits desde una fecha (ej: 2024-01-01)",
+    )
+    parser.add_argument(
+        "--backend",
+        default="cli",
+        choices=["cli", "native"],
+        help="Lectura de git: 'cli' (subprocess) o 'native' (lee .git directamente, con fallback al CLI)",
+    )
+    parser.add_argument(
+        "--group-by",
+        default="date",
+        choices=["date", "release"],
+        help="Secciones por fecha del commit o por release (primer tag que contiene el commit)",
+    )
+    parser.add_argument(
+        "--scope-map",
+        default=None,
+        help="JSON {scope: ruta} para repartir las entradas en changelogs por paquete (monorepos)",
+    )
+    parser.add_argument(
+        "--emit",
+        action="append",
+        default=[],
+        choices=["jsonl", "html", "notes"],
+        help="Salidas adicionales: jsonl, html o notes (notas por release); repetible",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    serve_parser = subparsers.add_parser(
+        "serve", help="Arranca el daemon que recibe notificaciones de los hooks"
+    )
+    serve_parser.add_argument("--socket", default=None, help="Ruta del socket Unix")
+    serve_parser.add_argument(
+        "--debounce",
+        type=int,
+        default=50,
+        help="Milisegundos para agrupar ráfagas de notificaciones (default: 50)",
+    )
+    notify_parser = subparsers.add_parser(
+        "notify", help="Cliente para el hook post-commit: avisa al daemon y termina"
+    )
+    notify_parser.add_argument("--socket", default=None, help="Ruta del socket Unix")
+    commit_parser = subparsers.add_parser(
+        "commit", help="Hace el commit con la entrada del changelog incluida (sin --amend)"
+    )
+    commit_parser.add_argument(
+        "-m", dest="message", action="append", help="Mensaje del commit (repetible, como en git)"
+    )
+    commit_parser.add_argument("-F", dest="file_message", default=None, help="Lee el mensaje de un archivo")
+    commit_parser.add_argument(
+        "git_args", nargs=argparse.REMAINDER, help="Argumentos extra para git commit (tras --)"
+    )
+    compact_parser = subparsers.add_parser(
+        "compact", help="Mueve las secciones antiguas a archivos por año"
+    )
+    keep_group = compact_parser.add_mutually_exclusive_group(required=True)
+    keep_group.add_argument(
+        "--keep-days", type=int, default=None, help="Archiva las secciones con más de N días"
+    )
+    keep_group.add_argument(
+        "--keep", type=int, default=None, help="Conserva solo las N secciones más recientes"
+    )
+    compact_parser.add_argument(
+        "--archive-dir",
+        default="changelogs",
+        help="Directorio de archivos por año, relativo al changelog (default: changelogs)",
+    )
+    query_parser = subparsers.add_parser(
+        "query", help="Consulta el índice SQLite de entradas (tipo, scope, fechas, hash)"
+    )
+    query_parser.add_argument("--type", default=None, help="Tipo de commit (feat, fix, perf...)")
+    query_parser.add_argument("--scope", default=None, help="Scope exacto")
+    query_parser.add_argument(
+        "--since", dest="since", default=None, help="Fecha mínima (YYYY-MM-DD)"
+    )
+    query_parser.add_argument("--until", default=None, help="Fecha máxima (YYYY-MM-DD)")
+    query_parser.add_argument("--hash", default=None, help="Hash (o prefijo) de un commit")
+    query_parser.add_argument("--text", default=None, help="Texto contenido en la descripción")
+    query_parser.add_argument("--limit", type=int, default=None, help="Máximo de resultados")
+    query_parser.add_argument("--json", action="store_true", help="Una línea JSON por entrada")
+    query_parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Reconstruye el índice desde el changelog, los de --scope-map y sus archivos por año",
+    )
+    fleet_parser = subparsers.add_parser(
+        "fleet", help="Actualiza muchos repositorios en paralelo (reporte JSON)"
+    )
+    fleet_parser.add_argument(
+        "repos", nargs="+", help="Rutas o globs de repositorios ('-' para leerlas de stdin)"
+    )
+    fleet_parser.add_argument(
+        "--workers", type=int, default=None, help="Procesos en paralelo (default: nº de CPUs)"
+    )
+    fleet_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=FLEET_TIMEOUT,
+        help=f"Segundos antes de dar un repo por colgado (default: {FLEET_TIMEOUT})",
+    )
 
     args = parser.parse_args()
 
-    # Get and parse the last commit
-    commit = get_last_commit()
-    if not commit:
-        print("⚠️ No se encontró commit o hubo un error de git.")
-        sys.exit(1)
+    if args.scope_map:
+        try:
+            args.scope_map = load_scope_map(args.scope_map)
+        except (OSError, ValueError) as e:
+            print(f"❌ Mapa de scopes no válido: {e}")
+            sys.exit(1)
+
+    if args.command == "serve":
+        from changelog_daemon import serve
+
+        serve(args.socket or default_socket_path(), args.debounce / 1000, args.backend)
+        return
+
+    if args.command == "notify":
+        notify(
+            args.file,
+            args.repo_url,
+            args.backend,
+            args.socket,
+            args.group_by,
+            args.scope_map,
+            args.emit,
+        )
+        return
 
-    data = parse_commit(commit)
-    entry = format_entry(data, args.repo_url)
+    if args.command == "fleet":
+        fleet(args)
+        return
+
+    if args.command == "commit":
+        commit(args)
+        return
 
-    print(f"📝 Registrando: {entry.strip()}")
-    update_changelog(entry, args.file)
+    if args.command == "compact":
+        compact(args)
+        return
+
+    if args.command == "query":
+        query(args)
+        return
+
+    if args.rev_range or args.since:
+        backfill(
+            args.rev_range,
+            args.since,
+            args.file,
+            args.repo_url,
+            args.backend,
+            args.group_by,
+            args.scope_map,
+            args.emit,
+        )
+        return
+
+    incremental(
+        args.file, args.repo_url, args.backend, args.group_by, args.scope_map, args.emit
+    )
 
 
 if __name__ == "__main__":
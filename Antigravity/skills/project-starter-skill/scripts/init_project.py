@@ -4,586 +4,665 @@ ProjectStarterSkill — init_project.py
 Scaffolds a complete project structure following the E.T.A.P.A. v2.0 protocol.
 
 Usage:
-    python init_project.py <project-name> [--path <dir>] [--license MIT|Apache-2.0|GPL-3.0|Proprietary] [--visibility public|private]
+    python init_project.py <project-name> [--path <dir>] [--license MIT|Apache-2.0|GPL-3.0|Proprietary] [--visibility public|private] [--verbose]
+    python init_project.py --batch <manifest.csv|.json|.yaml> [--path <dir>] [--jobs N]
+    python init_project.py <project-name> --archive tar|tgz|zip [--output <file>|-]
+    python init_project.py <project-name> --install-skills [<skills-dir>] [--store <dir>] [--hardlink-skills]
+    python init_project.py --upgrade <project-dir>... [--dry-run]
+    python init_project.py <project-name> --durability fast|atomic|durable
 
 Examples:
     python init_project.py mi-proyecto
     python init_project.py mi-proyecto --path /home/user/projects --license MIT --visibility private
+    python init_project.py --batch cohorte.csv --path /srv/alumnos --license Apache-2.0
+    python init_project.py mi-proyecto --archive tgz | ssh host tar xzf - -C /srv
 """
 
 import argparse
+import contextlib
+import csv
+import hashlib
+import io
+import json
 import os
+import shutil
+import signal
 import sys
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 
+from skill_store import DEFAULT_SOURCE, SkillStore, install
+from template_engine import TemplateLoader, check_slots, make_context, render
+
 # ─────────────────────────────────────────────
 # File Templates
 # ─────────────────────────────────────────────
 
-def genesis_template(project_name: str) -> str:
-    return f"""# {project_name} — Constitución del Proyecto (genesis.md)
-
-> Este archivo es la **fuente de verdad absoluta** del proyecto.
-> Si un script contradice lo que dice aquí, el script está mal.
-> Modificar este archivo es **Nivel Rojo** (requiere aprobación).
-
-## Versión 1.0 — {datetime.now().strftime("%Y-%m-%d")}
-
-## Directriz Principal
-
-<!-- ¿Cuál es el resultado singular deseado? -->
-TODO: Definir tras el descubrimiento.
-
-## Esquema de Datos
-
-### Input
-
-```json
-{{
-  "TODO": "Definir schema de entrada"
-}}
-```
-
-### Output
-
-```json
-{{
-  "TODO": "Definir schema de salida"
-}}
-```
-
-## Reglas de Comportamiento
-
-<!-- Restricciones de negocio -->
-- TODO: Definir reglas.
-
-## Invariantes Arquitectónicas
-
-- Todas las herramientas leen credenciales de `.env`.
-- Los archivos temporales van siempre en `.tmp/`.
-- La comunicación entre tools es vía JSON.
-- Toda herramienta debe ser idempotente salvo marcado explícito.
-
-## Pipeline
-
-<!-- Grafo de dependencias entre herramientas -->
-TODO: Definir cuando las herramientas existan.
-
-## Templates
-
-<!-- Referencias a las plantillas de output en templates/ -->
-TODO: Definir formatos de entrega.
-"""
-
-
-def task_plan_template(project_name: str) -> str:
-    return f"""# {project_name} — Plan de Tareas (task_plan.md)
-
-## Fase Actual: E — Estrategia (1/5)
-
----
-
-## Fase E — Estrategia
-### Objetivo
-Definir la visión, schemas de datos y reglas del proyecto.
-
-### Definition of Done
-- [ ] Las 5 preguntas de descubrimiento respondidas.
-- [ ] Esquema JSON de Input/Output definido en `genesis.md`.
-- [ ] Reglas de comportamiento documentadas en `genesis.md`.
-- [ ] Este plan aprobado por el usuario.
-
----
-
-## Fase T — Tests
-### Objetivo
-Verificar todas las conexiones y credenciales.
-
-### Definition of Done
-- [ ] Todas las credenciales `.env` verificadas.
-- [ ] Scripts `test_*.py` ejecutados y pasando.
-- [ ] Respuestas de APIs validadas contra schema de `genesis.md`.
-- [ ] Resultados documentados en `findings.md`.
-
----
-
-## Fase A — Arquitectura
-### Objetivo
-Construir las 3 capas: SOPs, navegación y herramientas.
-
-### Definition of Done
-- [ ] SOPs escritos en `architecture/` para cada herramienta.
-- [ ] Scripts implementados en `tools/`.
-- [ ] Grafo de dependencias documentado en `genesis.md`.
-- [ ] Tests de integración pasando.
-- [ ] Herramientas con side-effects marcadas.
-
----
-
-## Fase P — Pulido
-### Objetivo
-Refinar todas las salidas para entrega profesional.
-
-### Definition of Done
-- [ ] Todas las salidas validadas contra templates en `templates/`.
-- [ ] Formatos de entrega verificados.
-- [ ] Si hay interfaz: revisión visual completada.
-
----
-
-## Fase A — Automatización
-### Objetivo
-Desplegar a producción y configurar triggers.
-
-### Definition of Done
-- [ ] `.tmp/` limpio.
-- [ ] Código desplegado.
-- [ ] Triggers configurados y verificados.
-- [ ] Smoke test en producción pasando.
-- [ ] `progress.md` actualizado con estado final.
-"""
-
-
-def progress_template(project_name: str) -> str:
-    today = datetime.now().strftime("%Y-%m-%d")
-    return f"""# {project_name} — Diario de Progreso (progress.md)
-
-## Estado Actual
-- Fase: Estrategia (1/5)
-- Bloqueadores: Ninguno
-- Último test: ⏳ Pendiente
-- Próximo paso: Completar descubrimiento y poblar genesis.md
-
----
-
-## Log de Ejecución
-
-### [{today}] — Inicialización
-- ✅ Estructura de proyecto creada con ProjectStarterSkill.
-- ✅ Infraestructura de agente (`.agent/`) inicializada.
-- ⏳ Pendiente: Descubrimiento y genesis.md.
-"""
-
-
-def findings_template(project_name: str) -> str:
-    return f"""# {project_name} — Biblioteca de Hallazgos (findings.md)
-
-> Investigación, descubrimientos, restricciones y aprendizajes.
-> Actualiza este archivo cada vez que descubras algo relevante.
-
-## Investigación Inicial
-
-TODO: Documentar hallazgos tras el descubrimiento.
-
-## Restricciones Conocidas
-
-TODO: Documentar limitaciones técnicas o de negocio.
-
-## Aprendizajes de Auto-Reparación
-
-<!-- Se llena automáticamente cuando el Self-Annealing actúa -->
-"""
-
-
-def changelog_template(project_name: str) -> str:
-    today = datetime.now().strftime("%Y-%m-%d")
-    return f"""# {project_name} — Historial de Cambios (changelog.md)
-
-> Registro versionado de cambios en `genesis.md`.
-> Cada modificación a la constitución se documenta aquí.
-
-## [{today}] — v1.0 Inicialización
-
-### Cambio
-- Creación inicial de `genesis.md` con estructura base.
-
-### Motivo
-- Inicialización del proyecto con ProjectStarterSkill (E.T.A.P.A. v2.0).
-"""
-
-
-def agent_template(project_name: str) -> str:
-    return f"""# Agente del Proyecto: {project_name}
-
-## Identidad
-Eres el agente principal del proyecto **{project_name}**. Operas bajo el protocolo E.T.A.P.A. v2.0.
-
-## Fuente de Verdad
-Tu fuente de verdad es `genesis.md`. Antes de tomar cualquier decisión, consulta este archivo.
-
-## Comportamiento
-- Sigue las reglas de comportamiento definidas en `genesis.md`.
-- Respeta la Matriz de Autonomía (Semáforo) para determinar qué acciones puedes tomar.
-- Documenta tu progreso en `progress.md`.
-- Registra hallazgos en `findings.md`.
-
-## Skills Disponibles
-Consulta `.agent/skills/_registry.md` para ver las skills instaladas.
-También puedes buscar nuevas skills con `npx skills find <keyword>`.
-
-## Ciclo de Trabajo
-1. Lee `task_plan.md` para saber en qué fase estás.
-2. Consulta `genesis.md` para entender los datos y reglas.
-3. Usa el router (`.agent/hub/router.md`) para saber qué skill aplicar.
-4. Ejecuta y documenta.
-"""
-
-
-def router_template() -> str:
-    return """# Router de Skills
-
-## Propósito
-Este archivo define las reglas de enrutamiento entre el agente principal y las skills disponibles. Cuando el agente detecta un contexto específico, consulta estas reglas para decidir qué skill invocar.
-
-## Reglas de Enrutamiento
-
-### Contexto: Commit de código
-- **Trigger**: El usuario pide hacer un commit o se completa un cambio de código.
-- **Skill**: `commiter`
-- **Acción**: Consulta la skill para formatear el mensaje de commit.
-
-### Contexto: Post-commit
-- **Trigger**: Se acaba de realizar un commit exitoso.
-- **Skill**: `changelog-updater`
-- **Acción**: Ejecuta `scripts/update_changelog.py` para registrar el cambio.
-
-### Contexto: Inicialización de proyecto
-- **Trigger**: El usuario quiere crear un nuevo proyecto.
-- **Skill**: `ProjectStarterSkill` (global)
-- **Acción**: Ejecutar el protocolo de inicialización completo.
-
-## Cómo Añadir Nuevas Reglas
-
-Cada regla sigue este formato:
-
-```markdown
-### Contexto: [descripción]
-- **Trigger**: [qué activa la regla]
-- **Skill**: [nombre de la skill]
-- **Acción**: [qué debe hacer el agente]
-```
-
-Al instalar una nueva skill, añade su regla de enrutamiento aquí.
-"""
-
-
-def registry_template() -> str:
-    today = datetime.now().strftime("%Y-%m-%d")
-    return f"""# Registro de Skills
-
-> Índice de todas las skills instaladas en el proyecto.
-> Actualiza este archivo cada vez que se instale o desinstale una skill.
-
-## Skills Instaladas
-
-| Skill | Versión | Fecha | Descripción |
-|-------|---------|-------|-------------|
-| `commiter` | 1.0 | {today} | Guía para mensajes de commit en español con Conventional Commits y emojis. |
-| `changelog-updater` | 1.0 | {today} | Actualización automática de CHANGELOG.md tras cada commit. |
-
-## Skills Recomendadas (Pendientes de Instalación)
+# (output path, template name) in display order; templates live in
+# assets/templates/ and can be overridden with --templates.
+TEMPLATE_FILES = [
+    # Memory files
+    ("genesis.md", "genesis.md"),
+    ("task_plan.md", "task_plan.md"),
+    ("progress.md", "progress.md"),
+    ("findings.md", "findings.md"),
+    ("changelog.md", "changelog.md"),
+    # Agent infrastructure
+    (".agent/hub/agent.md", "agent.md"),
+    (".agent/hub/router.md", "router.md"),
+    (".agent/skills/_registry.md", "registry.md"),
+    (".agent/config/skill-search.md", "skill-search.md"),
+    # Repository files
+    ("README.md", "README.md"),
+    (".gitignore", "gitignore"),
+    ("LICENSE", "licenses/{license}"),
+    # CHANGELOG.md (git-level, separate from changelog.md which tracks genesis.md)
+    ("CHANGELOG.md", "CHANGELOG.md"),
+    # .env placeholder
+    (".env", "env"),
+    (".tmp/.gitkeep", "gitkeep"),
+]
 
-<!-- Aquí el agente registra skills recomendadas tras analizar genesis.md -->
+LICENSE_TYPES = ("MIT", "Apache-2.0", "GPL-3.0", "Proprietary")
 
-| Skill | Motivo | Prioridad |
-|-------|--------|-----------|
-| TODO | Analizar `genesis.md` para recomendar | — |
-"""
 
+# ─────────────────────────────────────────────
+# Scaffolding Logic
+# ─────────────────────────────────────────────
 
-def skill_search_template() -> str:
-    return """# Configuración del Buscador de Skills
+DIRS = [
+    ".agent/hub",
+    ".agent/skills/commiter",
+    ".agent/skills/changelog-updater/scripts",
+    ".agent/config",
+    "architecture",
+    "tools",
+    "templates",
+    ".tmp",
+]
+
+# Writes are latency-bound (especially on network filesystems), not CPU-bound
+WRITE_WORKERS = 8
+
+
+def compile_manifest(
+    license_type: str, context: dict, loader: TemplateLoader
+) -> list[tuple[str, tuple[str, ...]]]:
+    """Every (relative path, compiled template) of a project, in display order.
+
+    Templates are resolved and checked against `context` up front, so
+    rendering cannot fail halfway through a project. The LICENSE is skipped
+    if there is no template for `license_type`.
+    """
+    spec = []
+    for path, name in TEMPLATE_FILES:
+        name = name.format(license=license_type)
+        if path == "LICENSE" and not loader.exists(name):
+            continue
+        compiled = loader.get(name)
+        check_slots(name, compiled, context)
+        spec.append((path, compiled))
+    return spec
+
+
+def build_manifest(
+    project_name: str,
+    license_type: str = "MIT",
+    context: dict | None = None,
+    loader: TemplateLoader | None = None,
+) -> list[tuple[str, str]]:
+    """Return every (relative path, content) pair of a project, in display order.
 
-## Propósito
-Define los criterios y herramientas que el agente usa para buscar y recomendar skills relevantes basándose en la definición del proyecto en `genesis.md`.
+    All files are rendered from one context snapshot (see `make_context`).
+    """
+    context = context or make_context(project_name, license_type)
+    spec = compile_manifest(license_type, context, loader or TemplateLoader())
+    return [(path, render(compiled, context)) for path, compiled in spec]
 
-## Herramienta de Búsqueda
 
-Usa el CLI del ecosistema de skills:
+def manifest_dirs(manifest: list[tuple[str, str]], dirs: list[str] = DIRS) -> list[str]:
+    """Every directory the project needs (explicit ones plus file parents), parents first."""
+    needed = set()
+    for rel in [*dirs, *(os.path.dirname(path) for path, _ in manifest)]:
+        while rel and rel not in needed:
+            needed.add(rel)
+            rel = os.path.dirname(rel)
+    return sorted(needed, key=lambda d: (d.count("/"), d))
 
-```bash
-# Buscar skills por keyword
-npx skills find <keyword>
 
-# Listar skills disponibles en un repositorio
-npx skills add <repo-url> --list
+def _write(path: str, content: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
 
-# Instalar una skill específica (local, solo este proyecto)
-npx skills add <repo-url> --skill <nombre> -a antigravity
 
-# Instalar una skill globalmente (todos los proyectos)
-npx skills add <repo-url> --skill <nombre> -a antigravity -g
-```
+# Hash of every generated file, read back by `--upgrade`
+SCAFFOLD_RECORD = ".agent/scaffold.json"
+RECORD_VERSION = 1
 
-## Criterios de Búsqueda
 
-El agente analiza `genesis.md` buscando:
+def content_digest(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
-1. **Stack tecnológico**: Lenguajes, frameworks, herramientas mencionadas.
-2. **Integraciones**: APIs, servicios externos, bases de datos.
-3. **Tipo de output**: Web, API, CLI, reportes, notificaciones.
-4. **Dominio**: Finanzas, educación, e-commerce, etc.
 
-## Fuentes de Skills
+def scaffold_record(context: dict, digests: dict[str, str]) -> str:
+    """The SCAFFOLD_RECORD of a project: its render context and file hashes."""
+    record = {"version": RECORD_VERSION, "context": context, "files": digests}
+    return json.dumps(record, ensure_ascii=False, indent=2) + "\n"
 
-1. Ecosistema abierto: `npx skills find` (busca en skills.sh).
-2. Repositorios de la comunidad en GitHub/GitLab.
-3. Skills locales del usuario (custom).
 
-## Proceso de Recomendación
+def write_record(root: str, context: dict, manifest: list[tuple[str, str]]) -> None:
+    digests = {path: content_digest(content) for path, content in manifest}
+    _write(os.path.join(root, SCAFFOLD_RECORD), scaffold_record(context, digests))
 
-1. Leer `genesis.md` completo.
-2. Extraer keywords del stack, integraciones y dominio.
-3. Ejecutar `npx skills find <keyword>` para cada keyword relevante.
-4. Registrar recomendaciones en `_registry.md` bajo "Skills Recomendadas".
-5. Presentar al usuario para aprobación (Nivel Rojo — no instalar sin permiso).
-"""
 
+def write_manifest(
+    root: str,
+    manifest: list[tuple[str, str]],
+    dirs: list[str] = DIRS,
+    workers: int = WRITE_WORKERS,
+) -> list[str]:
+    """Create every directory once, then write all files through a thread pool.
 
-def readme_template(project_name: str) -> str:
-    return f"""# {project_name}
+    Returns the directories created (relative to `root`). Any write error is
+    re-raised once the pool has finished.
+    """
+    created = manifest_dirs(manifest, dirs)
+    os.makedirs(root, exist_ok=True)
+    for rel in created:
+        os.mkdir(os.path.join(root, rel))
 
-> Proyecto inicializado con [ProjectStarterSkill](https://github.com) — E.T.A.P.A. v2.0
+    if workers <= 1:
+        for path, content in manifest:
+            _write(os.path.join(root, path), content)
+        return created
 
-## Descripción
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_write, os.path.join(root, path), content) for path, content in manifest
+        ]
+    for future in futures:
+        future.result()
+    return created
 
-TODO: Completar con la directriz principal definida en `genesis.md`.
 
-## Estructura del Proyecto
+# ─────────────────────────────────────────────
+# Transactional Writes
+# ─────────────────────────────────────────────
 
-```
-├── .agent/           # Infraestructura de agente (hub, skills, config)
-├── architecture/     # SOPs técnicos
-├── tools/            # Scripts de ejecución
-├── templates/        # Plantillas de output
-├── genesis.md        # Constitución del proyecto
-├── task_plan.md      # Plan de fases
-├── progress.md       # Diario de ejecución
-├── findings.md       # Hallazgos e investigación
-└── changelog.md      # Historial de cambios en genesis.md
-```
+# fast:    write straight into the target (a failure leaves a partial tree)
+# atomic:  build in a sibling staging directory, rename it into place
+# durable: atomic + fsync of every file and directory before the rename
+DURABILITY_MODES = ("fast", "atomic", "durable")
+DEFAULT_DURABILITY = "atomic"
+
+
+def _staging_prefix(project_name: str) -> str:
+    return f".{project_name}.staging-"
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        return True  # os.kill(pid, 0) is not a probe on Windows
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def clean_stale_staging(base_path: str, project_name: str) -> None:
+    """Remove staging directories left by killed runs (their pid is gone)."""
+    prefix = _staging_prefix(project_name)
+    for entry in os.listdir(base_path):
+        if not entry.startswith(prefix):
+            continue
+        pid = entry[len(prefix):].split("-", 1)[0]
+        if pid.isdigit() and not _pid_alive(int(pid)):
+            shutil.rmtree(os.path.join(base_path, entry), ignore_errors=True)
+
+
+def _fsync(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_tree(root: str, workers: int = WRITE_WORKERS) -> int:
+    """fsync every file, then every directory (deepest first), in one batch.
+
+    With `workers` > 1 the file syncs run on a thread pool, which pays off
+    when each sync is a network round trip. Returns the number of syncs.
+    """
+    files, dirs = [], []
+    for dirpath, _, filenames in os.walk(root):
+        dirs.append(dirpath)
+        files += [os.path.join(dirpath, name) for name in filenames]
+    if workers <= 1:
+        for path in files:
+            _fsync(path)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_fsync, files))
+    if os.name != "nt":  # directories cannot be opened for fsync on Windows
+        for path in reversed(dirs):
+            _fsync(path)
+    return len(files) + len(dirs)
+
+
+@contextlib.contextmanager
+def _sigterm_as_exit():
+    """Turn SIGTERM into SystemExit so `finally`/`except` blocks get to run."""
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def handler(signum, frame):
+        raise SystemExit(128 + signum)
+
+    previous = signal.signal(signal.SIGTERM, handler)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+
+
+@contextlib.contextmanager
+def staged(root: str, durability: str = DEFAULT_DURABILITY, workers: int = WRITE_WORKERS):
+    """Yield the directory to build `root` in, and publish it on success.
+
+    In "atomic" and "durable" modes the project is built in a sibling
+    staging directory that is renamed to `root` only when everything was
+    written; any error, Ctrl+C or SIGTERM removes it instead. "durable"
+    also fsyncs the whole tree once before the rename, and the parent
+    directory after it.
+    """
+    if durability == "fast":
+        yield root
+        return
+
+    root = os.path.abspath(root)
+    base_path, project_name = os.path.split(root)
+    os.makedirs(base_path, exist_ok=True)
+    clean_stale_staging(base_path, project_name)
+
+    with _sigterm_as_exit():
+        staging = tempfile.mkdtemp(
+            prefix=f"{_staging_prefix(project_name)}{os.getpid()}-", dir=base_path
+        )
+        try:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(staging, 0o777 & ~umask)  # mkdtemp creates it 0700
+
+            yield staging
+
+            if durability == "durable":
+                fsync_tree(staging, workers)
+            if os.path.exists(root):
+                raise FileExistsError(f"el directorio '{root}' ya existe")
+            os.rename(staging, root)
+            if durability == "durable" and os.name != "nt":
+                _fsync(base_path)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+
+ARCHIVE_FORMATS = ("tar", "tgz", "zip")
+
+
+def write_archive(
+    fileobj,
+    fmt: str,
+    project_name: str,
+    spec: list[tuple[str, tuple[str, ...]]],
+    context: dict,
+    dirs: list[str] = DIRS,
+) -> list[str]:
+    """Stream a project into a tar/zip on `fileobj`, rendering file by file.
+
+    Every entry lives under `<project_name>/`. The stream is written
+    sequentially (stdout and pipes work) and only one file is held in
+    memory at a time. Returns the directories written.
+    """
+    created = manifest_dirs([(path, None) for path, _ in spec], dirs)
+    mtime = int(time.time())
+    digests = {}
+
+    if fmt == "zip":
+        archive = zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED)
+
+        def add_dir(rel: str) -> None:
+            info = zipfile.ZipInfo(f"{project_name}/{rel}/".replace("//", "/"), time.localtime(mtime)[:6])
+            info.external_attr = (0o40755 << 16) | 0x10
+            archive.writestr(info, b"")
+
+        def add_file(path: str, data: bytes) -> None:
+            info = zipfile.ZipInfo(f"{project_name}/{path}", time.localtime(mtime)[:6])
+            info.external_attr = 0o100644 << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, data)
+    else:
+        archive = tarfile.open(
+            fileobj=fileobj, mode="w|gz" if fmt == "tgz" else "w|", format=tarfile.PAX_FORMAT
+        )
+
+        def add_dir(rel: str) -> None:
+            info = tarfile.TarInfo(f"{project_name}/{rel}".rstrip("/"))
+            info.type, info.mode, info.mtime = tarfile.DIRTYPE, 0o755, mtime
+            archive.addfile(info)
+
+        def add_file(path: str, data: bytes) -> None:
+            info = tarfile.TarInfo(f"{project_name}/{path}")
+            info.size, info.mode, info.mtime = len(data), 0o644, mtime
+            archive.addfile(info, io.BytesIO(data))
+
+    with archive:
+        for rel in [""] + created:
+            add_dir(rel)
+        for path, compiled in spec:
+            content = render(compiled, context)
+            add_file(path, content.encode("utf-8"))
+            digests[path] = content_digest(content)
+        add_file(SCAFFOLD_RECORD, scaffold_record(context, digests).encode("utf-8"))
+    return created
 
-## Protocolo E.T.A.P.A.
 
-Este proyecto sigue el protocolo **E.T.A.P.A.** (Estrategia, Tests, Arquitectura, Pulido, Automatización) para construcción determinista y autorreparable.
+def scaffold_project(
+    project_name: str,
+    base_path: str = ".",
+    license_type: str = "MIT",
+    visibility: str = "private",
+    verbose: bool = False,
+    workers: int = WRITE_WORKERS,
+    templates: str | None = None,
+    archive: str | None = None,
+    output=None,
+    skills: list[tuple[str, str]] | None = None,
+    durability: str = DEFAULT_DURABILITY,
+    hardlink_skills: bool = False,
+):
+    """Scaffold the complete project structure.
 
-## Licencia
+    `templates` is a directory whose files override the built-in templates.
+    With `archive` ("tar", "tgz" or "zip") nothing is written to disk: the
+    project is streamed into `output` (a binary file object, stdout by
+    default) and the summary goes to stderr. `skills` is a `SkillStore.plan`
+    to install into `.agent/skills/` (sharing the store's read-only inodes
+    when `hardlink_skills`). `durability` is one of DURABILITY_MODES.
+    """
 
-Ver archivo [LICENSE](LICENSE).
-"""
+    root = os.path.join(base_path, project_name)
 
+    if not archive and os.path.exists(root):
+        print(f"  ❌ Error: El directorio '{root}' ya existe.")
+        sys.exit(1)
 
-def gitignore_template() -> str:
-    return """# Entorno
-.env
-.env.local
-.env.*.local
-
-# Temporales del proyecto (E.T.A.P.A.)
-.tmp/
-
-# Python
-__pycache__/
-*.py[cod]
-*$py.class
-*.so
-.Python
-env/
-venv/
-.venv/
-
-# Node
-node_modules/
-npm-debug.log*
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-*~
-
-# OS
-.DS_Store
-Thumbs.db
-"""
+    log = sys.stderr if archive else sys.stdout
+    started = time.perf_counter()
+    context = make_context(project_name, license_type, visibility)
+    try:
+        spec = compile_manifest(license_type, context, TemplateLoader(templates))
+    except (OSError, ValueError) as e:
+        print(f"  ❌ Error en las plantillas: {e}", file=log)
+        sys.exit(1)
 
+    if archive:
+        output = output or sys.stdout.buffer
+        created = write_archive(output, archive, project_name, spec, context)
+        output.flush()
+        location = getattr(output, "name", None)
+        location = f"<{archive}> {location if isinstance(location, str) else 'stream'}"
+        paths = [f"{project_name}/{path}" for path, _ in spec]
+        used = None
+    else:
+        manifest = [(path, render(compiled, context)) for path, compiled in spec]
+        try:
+            with staged(root, durability, workers) as target:
+                created = write_manifest(target, manifest, DIRS, workers)
+                write_record(target, context, manifest)
+                used = (
+                    install(skills, os.path.join(target, ".agent", "skills"), hardlink_skills)
+                    if skills else None
+                )
+        except OSError as e:
+            undone = "" if durability == "fast" else " (no se ha creado nada)"
+            print(f"  ❌ Error escribiendo el proyecto{undone}: {e}")
+            sys.exit(1)
+        location = os.path.abspath(root)
+        paths = [os.path.relpath(os.path.join(root, path)) for path, _ in spec]
+    elapsed = (time.perf_counter() - started) * 1000
+
+    # ── Summary (printed once) ──
+    out = [
+        f"\n🚀 Inicializando proyecto: {project_name}",
+        f"   Ubicación: {location}",
+        f"   Licencia: {license_type}",
+        f"   Visibilidad: {visibility}",
+        "",
+    ]
+    if verbose:
+        out.append("📂 Directorios:")
+        out += [f"  📁 {d}/" for d in created]
+        out.append("📜 Archivos:")
+        out += [f"  ✅ {path}" for path in paths]
+        out.append("")
+    out += [
+        f"📦 {len(created)} directorios y {len(paths)} archivos creados en {elapsed:.1f} ms"
+        + ("." if archive else f" (escritura {durability})."),
+    ]
+    if used:
+        methods = ", ".join(f"{method}: {count}" for method, count in used.most_common())
+        out.append(f"🧩 Skills base instaladas: {sum(used.values())} archivos ({methods}).")
+    out += [
+        "",
+        "=" * 50,
+        f"✅ Proyecto '{project_name}' inicializado correctamente.",
+        "",
+        "📋 Próximos pasos:",
+        "  1. Responde las preguntas de descubrimiento.",
+        "  2. Puebla genesis.md con schemas y reglas.",
+        "  3. Instala las skills base (commiter, changelog-updater).",
+        "  4. Crea el repositorio en GitHub.",
+        "  5. Realiza el primer commit.",
+        "",
+    ]
+    print("\n".join(out), file=log)
 
-# License templates
-LICENSES = {
-    "MIT": lambda name: f"""MIT License
-
-Copyright (c) {datetime.now().year} {name}
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:
-
-The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE.
-""",
-    "Apache-2.0": lambda name: f"""Copyright {datetime.now().year} {name}
-
-Licensed under the Apache License, Version 2.0 (the "License");
-you may not use this file except in compliance with the License.
-You may obtain a copy of the License at
-
-    http://www.apache.org/licenses/LICENSE-2.0
-
-Unless required by applicable law or agreed to in writing, software
-distributed under the License is distributed on an "AS IS" BASIS,
-WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-See the License for the specific language governing permissions and
-limitations under the License.
-""",
-    "GPL-3.0": lambda name: f"""{name}
-Copyright (C) {datetime.now().year} {name}
-
-This program is free software: you can redistribute it and/or modify
-it under the terms of the GNU General Public License as published by
-the Free Software Foundation, either version 3 of the License, or
-(at your option) any later version.
-
-This program is distributed in the hope that it will be useful,
-but WITHOUT ANY WARRANTY; without even the implied warranty of
-MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
-GNU General Public License for more details.
-
-You should have received a copy of the GNU General Public License
-along with this program. If not, see <https://www.gnu.org/licenses/>.
-""",
-    "Proprietary": lambda name: f"""Copyright (c) {datetime.now().year} {name}. All rights reserved.
-
-This software and associated documentation files are proprietary and confidential.
-Unauthorized copying, modification, distribution, or use of this software,
-via any medium, is strictly prohibited.
-""",
-}
+    return root
 
 
 # ─────────────────────────────────────────────
-# Scaffolding Logic
+# Batch Scaffolding
 # ─────────────────────────────────────────────
 
-def create_dir(path: str):
-    """Create directory if it doesn't exist."""
-    os.makedirs(path, exist_ok=True)
+# Stand-in project name used to render the templates once per (license, date)
+NAME_SLOT = "\x00project-name\x00"
+VISIBILITIES = ("public", "private")
 
 
-def write_file(path: str, content: str):
-    """Write content to a file, creating parent dirs if needed."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"  ✅ {os.path.relpath(path)}")
+def render_base(context: dict, loader: TemplateLoader) -> list[tuple[str, tuple[str, ...]]]:
+    """Render every template once with NAME_SLOT as the name, split around it."""
+    return [
+        (path, tuple(content.split(NAME_SLOT)))
+        for path, content in build_manifest(NAME_SLOT, context["license"], context, loader)
+    ]
 
 
-def scaffold_project(
-    project_name: str,
-    base_path: str = ".",
-    license_type: str = "MIT",
-    visibility: str = "private",
-):
-    """Scaffold the complete project structure."""
-    
-    root = os.path.join(base_path, project_name)
-    
+def instantiate(base: list[tuple[str, tuple[str, ...]]], project_name: str) -> list[tuple[str, str]]:
+    """The manifest of one project, filling the name into a rendered base."""
+    return [(path, project_name.join(parts)) for path, parts in base]
+
+
+def load_batch(path: str, defaults: dict) -> list[dict]:
+    """Read a CSV, JSON or YAML list of projects.
+
+    Each project has a `name` and optionally `license`, `visibility` and
+    `path`; missing fields take the values in `defaults`. JSON and YAML may
+    also be a plain list of names or an object with a `projects` list.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if ext == ".csv":
+            rows = list(csv.DictReader(f))
+        elif ext == ".json":
+            rows = json.load(f)
+        elif ext in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("leer YAML requiere PyYAML (pip install pyyaml); usa CSV o JSON")
+            rows = yaml.safe_load(f)
+        else:
+            raise ValueError(f"formato no soportado: '{ext}' (usa .csv, .json o .yaml)")
+
+    if isinstance(rows, dict):
+        rows = rows.get("projects")
+    if not isinstance(rows, list):
+        raise ValueError("el manifiesto debe ser una lista de proyectos")
+
+    projects = []
+    for row in rows:
+        if isinstance(row, str):
+            row = {"name": row}
+        if not isinstance(row, dict):
+            raise ValueError(f"entrada no válida: {row!r}")
+        row = {k.strip().lower(): str(v).strip() for k, v in row.items() if k and v not in (None, "")}
+        projects.append({**defaults, **row})
+    return projects
+
+
+def _check_project(project: dict) -> str | None:
+    """Why a manifest entry cannot be scaffolded, or None if it is valid."""
+    if not project.get("name"):
+        return "falta el nombre del proyecto"
+    if project["license"] not in LICENSE_TYPES:
+        return f"licencia desconocida '{project['license']}'"
+    if project["visibility"] not in VISIBILITIES:
+        return f"visibilidad desconocida '{project['visibility']}'"
+    return None
+
+
+_BASES: dict[tuple[str, str], tuple[dict, list]] = {}
+_SKILLS: list[tuple[str, str]] = []
+_DURABILITY = [DEFAULT_DURABILITY]
+_HARDLINK = [False]
+
+
+def _init_batch_worker(
+    bases: dict[tuple[str, str], tuple],
+    skills: list | None = None,
+    durability: str = DEFAULT_DURABILITY,
+    hardlink_skills: bool = False,
+) -> None:
+    _BASES.update(bases)
+    _SKILLS[:] = skills or []
+    _DURABILITY[0] = durability
+    _HARDLINK[0] = hardlink_skills
+
+
+def _scaffold_entry(project: dict) -> tuple[bool, str]:
+    """Scaffold one project from a pre-rendered base; never raises."""
+    root = os.path.join(project["path"], project["name"])
     if os.path.exists(root):
-        print(f"  ❌ Error: El directorio '{root}' ya existe.")
-        sys.exit(1)
-    
-    print(f"\n🚀 Inicializando proyecto: {project_name}")
-    print(f"   Ubicación: {os.path.abspath(root)}")
-    print(f"   Licencia: {license_type}")
-    print(f"   Visibilidad: {visibility}")
-    print()
-    
-    # ── Directories ──
-    dirs = [
-        ".agent/hub",
-        ".agent/skills/commiter",
-        ".agent/skills/changelog-updater/scripts",
-        ".agent/config",
-        "architecture",
-        "tools",
-        "templates",
-        ".tmp",
+        return False, f"el directorio '{root}' ya existe"
+    try:
+        context, base = _BASES[project["license"], project["visibility"]]
+        manifest = instantiate(base, project["name"])
+        with staged(root, _DURABILITY[0], workers=1) as target:
+            write_manifest(target, manifest, workers=1)
+            write_record(target, {**context, "project_name": project["name"]}, manifest)
+            if _SKILLS:
+                install(_SKILLS, os.path.join(target, ".agent", "skills"), _HARDLINK[0])
+    except OSError as e:
+        return False, str(e)
+    return True, os.path.abspath(root)
+
+
+def scaffold_batch(
+    projects: list[dict],
+    jobs: int | None = None,
+    templates: str | None = None,
+    skills: list[tuple[str, str]] | None = None,
+    durability: str = DEFAULT_DURABILITY,
+    hardlink_skills: bool = False,
+) -> int:
+    """Scaffold every project in one process pool and report each result.
+
+    Templates are rendered once per (license, visibility) from a single
+    clock reading in the parent and shipped to each worker once, together
+    with the `skills` plan to link into each project. A failing project is
+    reported and the run goes on. Returns the number of failures.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    now = datetime.now()
+    loader = TemplateLoader(templates)
+    started = time.perf_counter()
+
+    results: list[tuple[bool, str] | None] = [None] * len(projects)
+    pending, seen = [], set()
+    for i, project in enumerate(projects):
+        error = _check_project(project)
+        root = os.path.abspath(os.path.join(project.get("path", "."), project.get("name", "")))
+        if not error and root in seen:
+            error = "proyecto duplicado en el manifiesto"
+        if error:
+            results[i] = (False, error)
+        else:
+            seen.add(root)
+            pending.append(i)
+
+    bases, broken = {}, {}
+    for key in {(projects[i]["license"], projects[i]["visibility"]) for i in pending}:
+        try:
+            context = make_context(NAME_SLOT, *key, now)
+            bases[key] = context, render_base(context, loader)
+        except (OSError, ValueError) as e:
+            broken[key] = f"error en las plantillas: {e}"
+    for i in pending:
+        key = projects[i]["license"], projects[i]["visibility"]
+        if key in broken:
+            results[i] = (False, broken[key])
+    pending = [i for i in pending if results[i] is None]
+    todo = [projects[i] for i in pending]
+    if jobs <= 1 or len(todo) <= 1:
+        _init_batch_worker(bases, skills, durability, hardlink_skills)
+        done = map(_scaffold_entry, todo)
+        for i, result in zip(pending, done):
+            results[i] = result
+    else:
+        chunksize = max(1, len(todo) // (jobs * 4))
+        with ProcessPoolExecutor(jobs, initializer=_init_batch_worker, initargs=(bases, skills, durability, hardlink_skills)) as pool:
+            for i, result in zip(pending, pool.map(_scaffold_entry, todo, chunksize=chunksize)):
+                results[i] = result
+
+    elapsed = time.perf_counter() - started
+    out = [f"\n🚀 Inicializando {len(projects)} proyectos ({jobs} procesos)", ""]
+    failures = 0
+    for project, (ok, detail) in zip(projects, results):
+        name = project.get("name") or "?"
+        if ok:
+            out.append(f"  ✅ {name} → {detail}")
+        else:
+            failures += 1
+            out.append(f"  ❌ {name}: {detail}")
+    out += [
+        "",
+        "=" * 50,
+        f"📦 {len(projects) - failures} creados, {failures} con error en {elapsed:.2f} s.",
+        "",
     ]
-    
-    print("📂 Creando estructura de directorios...")
-    for d in dirs:
-        create_dir(os.path.join(root, d))
-        print(f"  📁 {d}/")
-    print()
-    
-    # ── Memory Files ──
-    print("📜 Creando archivos de memoria...")
-    write_file(os.path.join(root, "genesis.md"), genesis_template(project_name))
-    write_file(os.path.join(root, "task_plan.md"), task_plan_template(project_name))
-    write_file(os.path.join(root, "progress.md"), progress_template(project_name))
-    write_file(os.path.join(root, "findings.md"), findings_template(project_name))
-    write_file(os.path.join(root, "changelog.md"), changelog_template(project_name))
-    print()
-    
-    # ── Agent Infrastructure ──
-    print("🤖 Creando infraestructura de agente...")
-    write_file(os.path.join(root, ".agent/hub/agent.md"), agent_template(project_name))
-    write_file(os.path.join(root, ".agent/hub/router.md"), router_template())
-    write_file(os.path.join(root, ".agent/skills/_registry.md"), registry_template())
-    write_file(os.path.join(root, ".agent/config/skill-search.md"), skill_search_template())
-    print()
-    
-    # ── Repository Files ──
-    print("📦 Creando archivos de repositorio...")
-    write_file(os.path.join(root, "README.md"), readme_template(project_name))
-    write_file(os.path.join(root, ".gitignore"), gitignore_template())
-    
-    # License
-    license_fn = LICENSES.get(license_type)
-    if license_fn:
-        write_file(os.path.join(root, "LICENSE"), license_fn(project_name))
-    
-    # CHANGELOG.md (git-level, separate from changelog.md which tracks genesis.md)
-    today = datetime.now().strftime("%Y-%m-%d")
-    write_file(
-        os.path.join(root, "CHANGELOG.md"),
-        f"# Changelog\n\n## [{today}]\n\n- 🎉 Inicialización del proyecto con ProjectStarterSkill (E.T.A.P.A. v2.0)\n",
-    )
-    
-    # .env placeholder
-    write_file(
-        os.path.join(root, ".env"),
-        "# Credenciales y variables de entorno\n# Nunca commitear este archivo\n\n",
-    )
-    
-    # .tmp/.gitkeep
-    write_file(os.path.join(root, ".tmp/.gitkeep"), "")
-    print()
-    
-    # ── Summary ──
-    print("=" * 50)
-    print(f"✅ Proyecto '{project_name}' inicializado correctamente.")
-    print()
-    print("📋 Próximos pasos:")
-    print("  1. Responde las preguntas de descubrimiento.")
-    print("  2. Puebla genesis.md con schemas y reglas.")
-    print("  3. Instala las skills base (commiter, changelog-updater).")
-    print("  4. Crea el repositorio en GitHub.")
-    print("  5. Realiza el primer commit.")
-    print()
-    
-    return root
+    print("\n".join(out))
+    return failures
 
 
 # ─────────────────────────────────────────────
@@ -594,12 +673,12 @@ def main():
     parser = argparse.ArgumentParser(
         description="ProjectStarterSkill — Inicializa un proyecto E.T.A.P.A. v2.0"
     )
-    parser.add_argument("name", help="Nombre del proyecto")
+    parser.add_argument("name", nargs="?", help="Nombre del proyecto")
     parser.add_argument("--path", default=".", help="Directorio base (default: actual)")
     parser.add_argument(
         "--license",
         default="MIT",
-        choices=["MIT", "Apache-2.0", "GPL-3.0", "Proprietary"],
+        choices=LICENSE_TYPES,
         help="Tipo de licencia (default: MIT)",
     )
     parser.add_argument(
@@ -608,9 +687,131 @@ def main():
         choices=["public", "private"],
         help="Visibilidad del repositorio (default: private)",
     )
-    
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Lista cada directorio y archivo creado"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=WRITE_WORKERS,
+        help=f"Hilos de escritura en paralelo (default: {WRITE_WORKERS})",
+    )
+    parser.add_argument(
+        "--templates",
+        metavar="DIR",
+        default=None,
+        help="Directorio con plantillas que sustituyen a las de assets/templates/",
+    )
+    parser.add_argument(
+        "--archive",
+        choices=ARCHIVE_FORMATS,
+        default=None,
+        help="Emite el proyecto como tar/tgz/zip en vez de escribirlo en disco",
+    )
+    parser.add_argument(
+        "--output",
+        default="-",
+        help="Archivo de salida para --archive (default: stdout)",
+    )
+    parser.add_argument(
+        "--install-skills",
+        nargs="?",
+        const=DEFAULT_SOURCE,
+        default=None,
+        metavar="SKILLS_DIR",
+        help="Instala commiter y changelog-updater desde un directorio local de skills "
+        "(default: el que contiene esta skill)",
+    )
+    parser.add_argument(
+        "--store",
+        default=None,
+        help="Almacén de contenido para --install-skills (default: ~/.cache/project-starter/store)",
+    )
+    parser.add_argument(
+        "--hardlink-skills",
+        action="store_true",
+        help="Con --install-skills, enlaza con hardlink al almacén si no hay reflink "
+        "(archivos de solo lectura compartidos entre proyectos)",
+    )
+    parser.add_argument(
+        "--durability",
+        choices=DURABILITY_MODES,
+        default=DEFAULT_DURABILITY,
+        help="fast: escritura directa; atomic: directorio temporal + rename (default); "
+        "durable: atomic + fsync en lote",
+    )
+    parser.add_argument(
+        "--upgrade",
+        nargs="+",
+        metavar="PROJECT_DIR",
+        help="Actualiza proyectos existentes a las plantillas actuales sin pisar ediciones",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Con --upgrade, informa de los cambios sin escribir nada",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        help="Crea todos los proyectos de un CSV/JSON/YAML (name, license, visibility, path)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Procesos para --batch (default: número de CPUs)",
+    )
+
     args = parser.parse_args()
-    scaffold_project(args.name, args.path, args.license, args.visibility)
+    if args.templates and not os.path.isdir(args.templates):
+        parser.error(f"--templates: '{args.templates}' no es un directorio")
+    if args.upgrade:
+        from upgrade_project import upgrade_projects
+
+        sys.exit(1 if upgrade_projects(args.upgrade, args.templates, args.dry_run, args.verbose) else 0)
+    if args.batch and args.archive:
+        parser.error("--archive no es compatible con --batch")
+    if args.archive and args.install_skills:
+        parser.error("--install-skills no es compatible con --archive")
+    skills = None
+    if args.install_skills:
+        try:
+            skills = SkillStore(args.store).plan(args.install_skills)
+        except OSError as e:
+            print(f"  ❌ Error preparando las skills base: {e}")
+            sys.exit(1)
+    if args.batch:
+        defaults = {"license": args.license, "visibility": args.visibility, "path": args.path}
+        try:
+            projects = load_batch(args.batch, defaults)
+        except (OSError, ValueError) as e:
+            print(f"  ❌ Error leyendo el manifiesto: {e}")
+            sys.exit(1)
+        failures = scaffold_batch(
+            projects, args.jobs, args.templates, skills, args.durability, args.hardlink_skills
+        )
+        sys.exit(1 if failures else 0)
+    if not args.name:
+        parser.error("indica el nombre del proyecto o --batch <manifiesto>")
+
+    options = dict(
+        base_path=args.path,
+        license_type=args.license,
+        visibility=args.visibility,
+        verbose=args.verbose,
+        workers=args.workers,
+        templates=args.templates,
+        archive=args.archive,
+        skills=skills,
+        durability=args.durability,
+        hardlink_skills=args.hardlink_skills,
+    )
+    if args.archive and args.output != "-":
+        with open(args.output, "wb") as output:
+            scaffold_project(args.name, output=output, **options)
+    else:
+        scaffold_project(args.name, **options)
 
 
 if __name__ == "__main__":
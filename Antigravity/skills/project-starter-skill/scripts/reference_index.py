@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+ProjectStarterSkill — reference_index.py
+Carga perezosa de las referencias de las skills, sección a sección.
+
+Trocea cada `references/*.md` por sus encabezados: cada sección va desde su
+encabezado hasta el siguiente del mismo nivel o superior (incluye sus
+subsecciones). De cada una se guarda el offset y la longitud en bytes dentro
+del archivo y un hash de su contenido, en un único archivo binario pensado
+para `mmap`:
+
+    cabecera | archivos (ruta, mtime, tamaño, sha256) |
+    secciones ordenadas por título normalizado | cadenas UTF-8
+
+Buscar un título es una búsqueda binaria sobre el mmap; leer la sección es
+un `seek` + `read` sobre el markdown original, sin cargar el resto. Al
+actualizar, un archivo con el mismo mtime y tamaño, o con el mismo sha256,
+conserva sus secciones; solo se vuelven a trocear los que cambiaron.
+
+Usage:
+    python reference_index.py "Patrón: Rate Limiter Interno"
+    python reference_index.py --file patron-fan-out "Errores Comunes"
+    python reference_index.py --toc nodos-flujo
+    python reference_index.py --skills-dir ~/skills --rebuild
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+
+from skill_index import scan
+from skill_router import DEFAULT_CACHE_DIR, normalize
+from skill_store import DEFAULT_SOURCE
+
+MAGIC = b"SKRI"
+INDEX_VERSION = 1
+HEADER = struct.Struct("<4sIIII")  # magic, version, files, chunks, strings offset
+FILE = struct.Struct("<IIqQ32s")  # path (offset, length), mtime_ns, size, sha256
+CHUNK = struct.Struct("<IIIIIHQI16s")  # key, title (offset, length), file, level, start, length, digest
+HEADING = re.compile(rb"(#{1,6})[ \t]+(.+?)(?:[ \t]+#+)?[ \t]*\r?\n?$")
+FENCES = (b"```", b"~~~")
+
+
+# ─────────────────────────────────────────────
+# Chunking
+# ─────────────────────────────────────────────
+
+def chunk_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def chunk_markdown(data: bytes) -> list[tuple[str, int, int, int, bytes]]:
+    """Sections of a markdown document as (title, level, start, length, digest).
+
+    Headings inside fenced code blocks are ignored. Text before the first
+    heading belongs to no section.
+    """
+    sections = []  # [title, level, start, end]
+    open_sections = []
+    fence = None
+    offset = 0
+    for line in data.splitlines(keepends=True):
+        stripped = line.lstrip()
+        if stripped.startswith(FENCES):
+            if fence is None:
+                fence = stripped[:3]
+            elif stripped.startswith(fence):
+                fence = None
+        elif fence is None and line.startswith(b"#"):
+            match = HEADING.match(line)
+            if match:
+                level = len(match.group(1))
+                while open_sections and open_sections[-1][1] >= level:
+                    open_sections.pop()[3] = offset
+                section = [match.group(2).decode("utf-8", "replace"), level, offset, None]
+                sections.append(section)
+                open_sections.append(section)
+        offset += len(line)
+    for section in open_sections:
+        section[3] = offset
+
+    return [
+        (title, level, start, end - start, chunk_digest(data[start:end]))
+        for title, level, start, end in sections
+    ]
+
+
+def heading_key(title: str) -> bytes:
+    return " ".join(normalize(title)).encode("utf-8")
+
+
+# ─────────────────────────────────────────────
+# Index file
+# ─────────────────────────────────────────────
+
+class ReferenceIndex:
+    """Read-only, memory-mapped view of an index file."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, n_files, self.n_chunks, self.strings = HEADER.unpack_from(self.mm, 0)
+            if magic != MAGIC or version != INDEX_VERSION:
+                raise ValueError(f"{path}: no es un índice de referencias v{INDEX_VERSION}")
+        except (struct.error, ValueError):
+            self.mm.close()
+            raise
+        self.chunks_at = HEADER.size + n_files * FILE.size
+        self.files = []  # [(path, mtime_ns, size, sha256)]
+        for i in range(n_files):
+            path_off, path_len, mtime, size, sha = FILE.unpack_from(self.mm, HEADER.size + i * FILE.size)
+            self.files.append((self._string(path_off, path_len).decode("utf-8"), mtime, size, sha))
+
+    def close(self) -> None:
+        self.mm.close()
+
+    def _string(self, offset: int, length: int) -> bytes:
+        start = self.strings + offset
+        return self.mm[start:start + length]
+
+    def _key(self, i: int) -> bytes:
+        key_off, key_len = struct.unpack_from("<II", self.mm, self.chunks_at + i * CHUNK.size)
+        return self._string(key_off, key_len)
+
+    def chunk(self, i: int) -> dict:
+        _, _, title_off, title_len, file, level, start, length, digest = CHUNK.unpack_from(
+            self.mm, self.chunks_at + i * CHUNK.size
+        )
+        return {
+            "title": self._string(title_off, title_len).decode("utf-8"),
+            "path": self.files[file][0],
+            "level": level,
+            "start": start,
+            "length": length,
+            "digest": digest,
+        }
+
+    def chunks(self):
+        return (self.chunk(i) for i in range(self.n_chunks))
+
+    def find(self, heading: str, file_filter: str | None = None) -> list[dict]:
+        """Sections titled `heading` (ignoring case, accents and punctuation).
+
+        Exact titles are found by binary search; if there is none, every title
+        containing all the words of `heading` matches instead.
+        """
+        key = heading_key(heading)
+        lo, hi = 0, self.n_chunks
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        found = []
+        while lo < self.n_chunks and self._key(lo) == key:
+            found.append(self.chunk(lo))
+            lo += 1
+        if not found and key:
+            words = set(key.split())
+            found = [self.chunk(i) for i in range(self.n_chunks) if words <= set(self._key(i).split())]
+        if file_filter:
+            found = [c for c in found if file_filter in c["path"]]
+        return found
+
+
+def write_index(path: str, files: list[tuple[str, int, int, bytes, list]]) -> None:
+    """Write an index for `files`: (path, mtime_ns, size, sha256, chunks) each."""
+    strings = bytearray()
+    interned: dict[bytes, int] = {}
+
+    def intern(value: bytes) -> tuple[int, int]:
+        if value not in interned:
+            interned[value] = len(strings)
+            strings.extend(value)
+        return interned[value], len(value)
+
+    file_records = bytearray()
+    rows = []
+    for file_id, (file_path, mtime, size, sha, chunks) in enumerate(files):
+        file_records += FILE.pack(*intern(file_path.encode("utf-8")), mtime, size, sha)
+        for title, level, start, length, digest in chunks:
+            rows.append((heading_key(title), title.encode("utf-8"), file_id, level, start, length, digest))
+    rows.sort(key=lambda row: (row[0], row[2], row[4]))
+
+    chunk_records = bytearray()
+    for key, title, file_id, level, start, length, digest in rows:
+        chunk_records += CHUNK.pack(*intern(key), *intern(title), file_id, level, start, length, digest)
+
+    header = HEADER.pack(
+        MAGIC, INDEX_VERSION, len(files), len(rows), HEADER.size + len(file_records) + len(chunk_records)
+    )
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header + file_records + chunk_records + strings)
+    # Readers that still map the old file keep a consistent view of it
+    os.replace(tmp_path, path)
+
+
+def update(skill_dirs: list[str], index_path: str, rebuild: bool = False) -> tuple[ReferenceIndex, int]:
+    """Open the index, re-chunking only the reference files whose content changed.
+
+    Returns the index and the number of files that were (re)chunked.
+    """
+    old = None
+    if not rebuild:
+        try:
+            old = ReferenceIndex(index_path)
+        except (OSError, ValueError, struct.error):
+            old = None
+    previous = {path: (mtime, size, sha) for path, mtime, size, sha in (old.files if old else [])}
+
+    found = sorted(path for path in scan(skill_dirs) if os.path.basename(path) != "SKILL.md")
+    files, rechunked, dirty = [], 0, set(found) != set(previous) or old is None
+    for path in found:
+        st = os.stat(path)
+        before = previous.get(path)
+        if before and before[:2] == (st.st_mtime_ns, st.st_size):
+            files.append((path, *before, None))  # chunks copied from the old index below
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        sha = hashlib.sha256(data).digest()
+        if before and before[2] == sha:
+            chunks = None  # touched, not edited
+        else:
+            chunks = chunk_markdown(data)
+            rechunked += 1
+        files.append((path, st.st_mtime_ns, len(data), sha, chunks))
+        dirty = True
+
+    if not dirty:
+        return old, 0
+    if old:
+        kept = {path: [] for path, _, _, _, chunks in files if chunks is None}
+        for c in old.chunks():
+            if c["path"] in kept:
+                kept[c["path"]].append((c["title"], c["level"], c["start"], c["length"], c["digest"]))
+        files = [(*f[:4], kept[f[0]] if f[4] is None else f[4]) for f in files]
+        old.close()
+    write_index(index_path, files)
+    return ReferenceIndex(index_path), rechunked
+
+
+def read_section(chunk: dict) -> bytes:
+    """The bytes of a section, read straight from its offset in the source file."""
+    with open(chunk["path"], "rb") as f:
+        f.seek(chunk["start"])
+        data = f.read(chunk["length"])
+    if chunk_digest(data) != chunk["digest"]:
+        raise ValueError(f"{chunk['path']} cambió desde que se indexó; vuelve a ejecutar")
+    return data
+
+
+def default_index_path(skill_dirs: list[str]) -> str:
+    key = hashlib.sha1("\n".join(skill_dirs).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(DEFAULT_CACHE_DIR, f"references-{key}.idx")
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Devuelve una sección de las referencias de las skills.")
+    parser.add_argument("heading", nargs="*", help="Título de la sección")
+    parser.add_argument("--file", help="Solo secciones de archivos cuya ruta contenga este texto")
+    parser.add_argument("--toc", metavar="ARCHIVO", help="Lista las secciones de los archivos que coincidan")
+    parser.add_argument("--all", action="store_true", help="Si varias secciones coinciden, las muestra todas")
+    parser.add_argument(
+        "--skills-dir",
+        action="append",
+        default=None,
+        help="Directorio de skills (repetible; default: las skills junto a esta)",
+    )
+    parser.add_argument("--index", default=None, help="Ruta del archivo de índice")
+    parser.add_argument("--rebuild", action="store_true", help="Vuelve a trocear todos los archivos")
+    args = parser.parse_args()
+
+    skill_dirs = [os.path.abspath(d) for d in (args.skills_dir or [DEFAULT_SOURCE])]
+    index, rechunked = update(skill_dirs, args.index or default_index_path(skill_dirs), args.rebuild)
+
+    if args.toc is not None:
+        chunks = sorted(
+            (c for c in index.chunks() if args.toc in c["path"]), key=lambda c: (c["path"], c["start"])
+        )
+        path = None
+        for c in chunks:
+            if c["path"] != path:
+                path = c["path"]
+                print(f"\n📄 {path}")
+            print(f"  {'  ' * (c['level'] - 1)}{c['title']} ({c['length']} bytes)")
+        if not chunks:
+            print(f"🤷 Ningún archivo indexado coincide con '{args.toc}'.")
+            sys.exit(1)
+        return
+
+    if not args.heading:
+        print(f"📑 Índice: {len(index.files)} archivos, {index.n_chunks} secciones ({rechunked} troceados de nuevo).")
+        return
+
+    found = index.find(" ".join(args.heading), args.file)
+    if not found:
+        print(f"🤷 Ninguna sección se titula '{' '.join(args.heading)}'.")
+        sys.exit(1)
+    if len(found) > 1 and not args.all:
+        print(f"🔎 {len(found)} secciones coinciden (acota con --file o usa --all):")
+        for c in found:
+            print(f"  · {c['title']} — {c['path']}")
+        sys.exit(1)
+    try:
+        for c in found:
+            sys.stdout.buffer.write(read_section(c))
+    except (OSError, ValueError) as e:
+        print(f"  ❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+ProjectStarterSkill — skill_index.py
+Búsqueda de skills sin red: índice invertido local con ranking BM25.
+
+Indexa cada SKILL.md y los markdown de su `references/` en una base SQLite
+(tabla de postings término → documento agrupada por término; los términos se
+guardan una vez y los postings solo llevan enteros). En cada uso
+solo se reindexan los archivos cuyo mtime o tamaño cambió, y se eliminan los
+que ya no existen.
+
+Una sola consulta resuelve todas las palabras clave a la vez: se leen de
+golpe los postings de todos los términos y se calcula BM25 por documento.
+Cada skill puntúa, por palabra clave, lo que su mejor documento; el ranking
+global suma todas las palabras clave.
+
+Las palabras clave pueden venir de la línea de comandos o extraerse de un
+genesis.md (`--genesis`): se descartan las palabras vacías y todo el texto
+que ya trae la plantilla de genesis.md.
+
+Usage:
+    python skill_index.py --genesis genesis.md
+    python skill_index.py webhook stripe facturas --top 3
+    python skill_index.py --skills-dir ~/skills --rebuild --json slack
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import sys
+from array import array
+from collections import Counter
+
+from skill_router import DEFAULT_CACHE_DIR, normalize, parse_frontmatter
+from skill_store import DEFAULT_SOURCE
+from template_engine import TemplateLoader
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id     INTEGER PRIMARY KEY,
+    path   TEXT UNIQUE NOT NULL,
+    mtime  INTEGER NOT NULL,
+    size   INTEGER NOT NULL,
+    skill  TEXT NOT NULL,    -- directory of the skill the document belongs to
+    length INTEGER NOT NULL, -- number of tokens
+    terms  BLOB NOT NULL     -- its term ids (array 'I'), to drop its postings
+);
+CREATE TABLE IF NOT EXISTS terms (
+    id   INTEGER PRIMARY KEY,
+    term TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term INTEGER NOT NULL,
+    doc  INTEGER NOT NULL,
+    tf   INTEGER NOT NULL,
+    PRIMARY KEY (term, doc)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS skills (
+    path TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL
+);
+"""
+
+K1 = 1.2
+B = 0.75
+SKIP_DIRS = {"__pycache__", "node_modules", "scripts", "assets"}
+STOPWORDS = set("""
+a al algo como con cual cuando de del desde donde e el ella en entre es esa ese eso esta este esto
+ha hay la las le les lo los mas me mi muy no o para pero por que se ser si sin sobre su sus
+tambien te todo tu un una uno unos unas y ya
+an and are as at be by for from has have if in into is it its of on or that the this to
+was were will with you your
+""".split())
+
+
+# ─────────────────────────────────────────────
+# Indexing
+# ─────────────────────────────────────────────
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open (creating if needed) the index database at `path`."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def tokenize(text: str) -> list[str]:
+    return [w for w in normalize(text) if len(w) > 1 and w not in STOPWORDS]
+
+
+def scan(skill_dirs: list[str]) -> dict[str, tuple[int, int, str]]:
+    """Every indexable file: path -> (mtime_ns, size, skill directory).
+
+    A file belongs to the nearest directory above it that holds a SKILL.md,
+    so nested skills do not depend on the order the walk visits them in.
+    """
+    found = {}
+    for root in skill_dirs:
+        skill_of: dict[str, str | None] = {}
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith("."))
+            skill = dirpath if "SKILL.md" in filenames else skill_of.pop(dirpath, None)
+            for d in dirnames:
+                skill_of[os.path.join(dirpath, d)] = skill
+            if skill is None:
+                continue  # outside any skill
+            in_references = f"{os.sep}references" in dirpath[len(skill):]
+            for filename in filenames:
+                if filename == "SKILL.md" or (in_references and filename.endswith(".md")):
+                    path = os.path.join(dirpath, filename)
+                    st = os.stat(path)
+                    found[path] = (st.st_mtime_ns, st.st_size, skill)
+    return found
+
+
+def update(conn: sqlite3.Connection, skill_dirs: list[str]) -> tuple[int, int]:
+    """Bring the index in line with the files on disk; return (reindexed, removed)."""
+    found = scan(skill_dirs)
+    known = {path: (doc_id, mtime, size, skill) for doc_id, path, mtime, size, skill in conn.execute(
+        "SELECT id, path, mtime, size, skill FROM docs"
+    )}
+    stale = [path for path in known if path not in found]
+    # A new or removed SKILL.md in between also moves files to another skill
+    changed = [
+        path for path, entry in found.items()
+        if path not in known or known[path][1:] != entry
+    ]
+    if not stale and not changed:
+        return 0, 0
+
+    term_ids = dict(conn.execute("SELECT term, id FROM terms"))
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MiB: postings arrive in doc order, not term order
+    with conn:
+        for path in stale + [p for p in changed if p in known]:
+            doc_id = known[path][0]
+            (blob,) = conn.execute("SELECT terms FROM docs WHERE id = ?", (doc_id,)).fetchone()
+            conn.executemany(
+                "DELETE FROM postings WHERE term = ? AND doc = ?",
+                ((term, doc_id) for term in array("I", blob)),
+            )
+            conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+            if path.endswith(f"{os.sep}SKILL.md") and path not in found:
+                conn.execute("DELETE FROM skills WHERE path = ?", (os.path.dirname(path),))
+
+        for path in changed:
+            mtime, size, skill = found[path]
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                tokens = tokenize(f.read())
+            counts = Counter(tokens)
+            new_terms = [term for term in counts if term not in term_ids]
+            if new_terms:
+                first = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM terms").fetchone()[0]
+                term_ids.update(zip(new_terms, range(first, first + len(new_terms))))
+                conn.executemany("INSERT INTO terms (term, id) VALUES (?, ?)", ((t, term_ids[t]) for t in new_terms))
+            ids = array("I", (term_ids[term] for term in counts))
+            doc_id = conn.execute(
+                "INSERT INTO docs (path, mtime, size, skill, length, terms) VALUES (?, ?, ?, ?, ?, ?)",
+                (path, mtime, size, skill, len(tokens), ids.tobytes()),
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO postings (term, doc, tf) VALUES (?, ?, ?)",
+                ((term_ids[term], doc_id, tf) for term, tf in counts.items()),
+            )
+            if os.path.basename(path) == "SKILL.md":
+                meta = parse_frontmatter(path)
+                conn.execute(
+                    "INSERT OR REPLACE INTO skills (path, name, description) VALUES (?, ?, ?)",
+                    (skill, meta.get("name") or os.path.basename(skill), meta.get("description", "")),
+                )
+    return len(changed), len(stale)
+
+
+# ─────────────────────────────────────────────
+# Querying
+# ─────────────────────────────────────────────
+
+def search(conn: sqlite3.Connection, keywords: list[str], top: int = 5) -> dict:
+    """Rank skills for every keyword in one pass over their postings.
+
+    Returns {"keywords": {keyword: [(skill, score), ...]}, "skills": [...]}
+    with skills as dicts (name, path, description, score, keywords).
+    """
+    terms = {}
+    for keyword in keywords:
+        words = tokenize(keyword)
+        if words:
+            terms[keyword] = words
+    n_docs, avg_length = conn.execute("SELECT COUNT(*), AVG(length) FROM docs").fetchone()
+    if not terms or not n_docs:
+        return {"keywords": {k: [] for k in keywords}, "skills": []}
+
+    vocabulary = sorted({w for words in terms.values() for w in words})
+    rows = conn.execute(
+        f"SELECT t.term, p.tf, d.length, d.skill FROM terms t "
+        f"JOIN postings p ON p.term = t.id JOIN docs d ON d.id = p.doc "
+        f"WHERE t.term IN ({', '.join('?' * len(vocabulary))})",
+        vocabulary,
+    ).fetchall()
+
+    df = Counter(term for term, _, _, _ in rows)
+    idf = {t: math.log(1 + (n_docs - n + 0.5) / (n + 0.5)) for t, n in df.items()}
+    # term -> skill -> best document score
+    by_term: dict[str, dict[str, float]] = {}
+    for term, tf, length, skill in rows:
+        score = idf[term] * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avg_length))
+        best = by_term.setdefault(term, {})
+        best[skill] = max(best.get(skill, 0.0), score)
+
+    names = {path: (name, description) for path, name, description in conn.execute(
+        "SELECT path, name, description FROM skills"
+    )}
+    per_keyword, totals, reasons = {}, Counter(), {}
+    for keyword, words in terms.items():
+        scores = Counter()
+        for word in words:
+            scores.update(by_term.get(word, {}))
+        per_keyword[keyword] = [
+            (names.get(skill, (os.path.basename(skill), ""))[0], round(score, 3))
+            for skill, score in scores.most_common(top)
+        ]
+        for skill, score in scores.items():
+            totals[skill] += score
+            reasons.setdefault(skill, []).append(keyword)
+
+    skills = []
+    for skill, score in totals.most_common(top):
+        name, description = names.get(skill, (os.path.basename(skill), ""))
+        skills.append({
+            "name": name,
+            "path": skill,
+            "description": description,
+            "score": round(score, 3),
+            "keywords": reasons[skill],
+        })
+    return {"keywords": per_keyword, "skills": skills}
+
+
+def genesis_keywords(path: str, limit: int = 15, templates: str | None = None) -> list[str]:
+    """The most frequent meaningful words of a genesis.md.
+
+    Words that the genesis.md template itself contains (headings, TODO
+    placeholders, invariants) are ignored, so only what the user wrote counts.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        words = tokenize(f.read())
+    boilerplate = set(tokenize("".join(TemplateLoader(templates).get("genesis.md")[::2])))
+    counts = Counter(w for w in words if w not in boilerplate and not w.isdigit())
+    return [word for word, _ in counts.most_common(limit)]
+
+
+def default_index_path(skill_dirs: list[str]) -> str:
+    key = hashlib.sha1("\n".join(skill_dirs).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(DEFAULT_CACHE_DIR, f"skills-{key}.db")
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Busca skills relevantes sin red (BM25 local).")
+    parser.add_argument("keywords", nargs="*", help="Palabras clave")
+    parser.add_argument("--genesis", help="Extrae las palabras clave de este genesis.md")
+    parser.add_argument(
+        "--skills-dir",
+        action="append",
+        default=None,
+        help="Directorio de skills a indexar (repetible; default: las skills junto a esta)",
+    )
+    parser.add_argument("--index", default=None, help="Ruta de la base de datos del índice")
+    parser.add_argument("--rebuild", action="store_true", help="Reconstruye el índice desde cero")
+    parser.add_argument("--top", type=int, default=5, help="Skills por palabra clave y en el ranking")
+    parser.add_argument("--json", action="store_true", help="Salida en JSON")
+    args = parser.parse_args()
+
+    skill_dirs = [os.path.abspath(d) for d in (args.skills_dir or [DEFAULT_SOURCE])]
+    index_path = args.index or default_index_path(skill_dirs)
+    if args.rebuild and os.path.exists(index_path):
+        os.unlink(index_path)
+    conn = connect(index_path)
+    reindexed, removed = update(conn, skill_dirs)
+
+    keywords = list(args.keywords)
+    if args.genesis:
+        try:
+            keywords += genesis_keywords(args.genesis)
+        except OSError as e:
+            print(f"  ❌ No se puede leer {args.genesis}: {e}")
+            sys.exit(1)
+    if not keywords:
+        n_skills, n_docs = conn.execute(
+            "SELECT (SELECT COUNT(*) FROM skills), (SELECT COUNT(*) FROM docs)"
+        ).fetchone()
+        print(f"📚 Índice: {n_skills} skills, {n_docs} documentos ({reindexed} reindexados, {removed} eliminados).")
+        return
+
+    result = search(conn, keywords, args.top)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    print(f"🔑 Palabras clave: {', '.join(keywords)}\n")
+    for keyword, ranked in result["keywords"].items():
+        found = ", ".join(f"{name} ({score:.2f})" for name, score in ranked) or "—"
+        print(f"  • {keyword}: {found}")
+    print("\n🔎 Skills recomendadas:")
+    if not result["skills"]:
+        print("  🤷 Ninguna skill coincide.")
+    for skill in result["skills"]:
+        print(f"  🧩 {skill['name']} ({skill['score']:.2f}) — {', '.join(skill['keywords'])}")
+
+
+if __name__ == "__main__":
+    main()
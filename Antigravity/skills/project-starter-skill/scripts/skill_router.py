@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+ProjectStarterSkill — skill_router.py
+Router programático de skills a partir de los `triggers` de cada SKILL.md.
+
+Lee el frontmatter de todas las skills instaladas (`triggers` en la raíz o
+bajo `metadata`, más el propio nombre de la skill), normaliza las frases
+(minúsculas, sin acentos ni puntuación) y compila con todas ellas un
+autómata Aho-Corasick sobre palabras. Un texto se recorre una sola vez,
+palabra a palabra, sea cual sea el número de skills.
+
+El autómata se guarda en disco junto con el mtime y tamaño de cada SKILL.md
+y el mtime de cada directorio recorrido: mientras nada cambie, consultar el
+router no vuelve a leer ningún markdown.
+
+Usage:
+    python skill_router.py "quiero hacer un commit de estos cambios"
+    python skill_router.py --skills-dir .agent/skills --json "actualizar el changelog"
+    python skill_router.py --rebuild
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import unicodedata
+from collections import deque
+
+INDEX_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "project-starter"
+)
+SKIP_DIRS = {"__pycache__", "node_modules", "references", "scripts", "assets"}
+NON_WORD = re.compile(r"[\W_]+")
+
+
+# ─────────────────────────────────────────────
+# Frontmatter
+# ─────────────────────────────────────────────
+
+def _scalar(value: str):
+    value = value.strip()
+    if value.startswith("[") and value.endswith("]"):
+        return [_scalar(v) for v in value[1:-1].split(",") if v.strip()]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def parse_frontmatter(path: str) -> dict:
+    """The YAML frontmatter of a markdown file, for the subset SKILL.md uses.
+
+    Supports nested mappings, `- item` lists and quoted or inline-list
+    scalars. Reading stops at the closing `---`, so the body is never read.
+    """
+    lines = []
+    with open(path, "r", encoding="utf-8") as f:
+        if f.readline().strip() != "---":
+            return {}
+        for line in f:
+            if line.strip() == "---":
+                break
+            if line.strip() and not line.lstrip().startswith("#"):
+                lines.append(line.rstrip("\n"))
+
+    root: dict = {}
+    stack = [(0, root)]  # (indent of the container's items, container)
+    for i, raw in enumerate(lines):
+        indent = len(raw) - len(raw.lstrip(" "))
+        line = raw.strip()
+        while len(stack) > 1 and indent < stack[-1][0]:
+            stack.pop()
+        item_indent, container = stack[-1]
+        if indent != item_indent:
+            continue  # continuation of a multi-line value: not needed here
+
+        if line.startswith("- "):
+            if isinstance(container, list):
+                container.append(_scalar(line[2:]))
+            continue
+        if not isinstance(container, dict) or ":" not in line:
+            continue
+        key, _, value = line.partition(":")
+        if value.strip():
+            container[key.strip()] = _scalar(value)
+            continue
+        following = lines[i + 1] if i + 1 < len(lines) else ""
+        child_indent = len(following) - len(following.lstrip(" "))
+        if following.strip().startswith("- ") and child_indent >= indent:
+            child = []
+        elif child_indent > indent:
+            child = {}
+        else:
+            container[key.strip()] = ""
+            continue
+        container[key.strip()] = child
+        stack.append((child_indent, child))
+    return root
+
+
+def skill_triggers(meta: dict) -> list[str]:
+    triggers = meta.get("triggers")
+    if triggers is None and isinstance(meta.get("metadata"), dict):
+        triggers = meta["metadata"].get("triggers")
+    if isinstance(triggers, str):
+        triggers = [triggers]
+    return [t for t in triggers or [] if isinstance(t, str)]
+
+
+# ─────────────────────────────────────────────
+# Normalization
+# ─────────────────────────────────────────────
+
+def normalize(text: str) -> list[str]:
+    """Lowercase words without accents or punctuation."""
+    text = text.casefold()
+    if not text.isascii():
+        decomposed = unicodedata.normalize("NFKD", text)
+        text = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return NON_WORD.sub(" ", text).split()
+
+
+# ─────────────────────────────────────────────
+# Aho-Corasick automaton
+# ─────────────────────────────────────────────
+
+def build_automaton(phrases: list[list[str]]) -> tuple[dict[str, int], list[int], list[list[int]]]:
+    """Goto, fail and output tables for `phrases` (lists of normalized words).
+
+    The automaton runs over words, not characters, so matches always fall on
+    word boundaries and a text is scanned in as many steps as it has words.
+    Transitions live in one flat dict keyed "<state> <word>", which loads
+    far faster than one dict per state. Each state's outputs include those
+    reachable through its fail links.
+    """
+    goto: dict[str, int] = {}
+    children: list[list[tuple[str, int]]] = [[]]
+    out: list[list[int]] = [[]]
+    for pattern_id, words in enumerate(phrases):
+        state = 0
+        for word in words:
+            nxt = goto.get(f"{state} {word}")
+            if nxt is None:
+                nxt = len(out)
+                goto[f"{state} {word}"] = nxt
+                children[state].append((word, nxt))
+                children.append([])
+                out.append([])
+            state = nxt
+        out[state].append(pattern_id)
+
+    fail = [0] * len(out)
+    queue = deque(nxt for _, nxt in children[0])
+    while queue:
+        state = queue.popleft()
+        for word, nxt in children[state]:
+            queue.append(nxt)
+            f = fail[state]
+            while f and f"{f} {word}" not in goto:
+                f = fail[f]
+            fail[nxt] = goto.get(f"{f} {word}", 0)
+            out[nxt] = out[nxt] + out[fail[nxt]]
+    return goto, fail, out
+
+
+class SkillRouter:
+    """Compiled trigger index over one or more skill directories."""
+
+    def __init__(self, index: dict):
+        self.skills = index["skills"]  # [{name, path, description}]
+        self.patterns = index["patterns"]  # [[word count, skill position, original trigger]]
+        self.goto = index["goto"]
+        self.fail = index["fail"]
+        self.out = index["out"]
+
+    @classmethod
+    def load(cls, skill_dirs: list[str], cache_path: str | None = None, rebuild: bool = False) -> "SkillRouter":
+        """Reuse the cached index unless a SKILL.md or a scanned directory changed."""
+        skill_dirs = [os.path.abspath(d) for d in skill_dirs]
+        cache_path = cache_path or default_cache_path(skill_dirs)
+        if not rebuild:
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                if index.get("version") == INDEX_VERSION and index["roots"] == skill_dirs and _fresh(index):
+                    return cls(index)
+            except (OSError, ValueError, KeyError):
+                pass
+
+        index = build_index(skill_dirs)
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+        return cls(index)
+
+    def match(self, text: str) -> list[dict]:
+        """Skills whose triggers appear in `text`, best first.
+
+        A skill scores the number of words of every distinct trigger it
+        matched, so longer, more specific phrases weigh more.
+        """
+        goto, fail, out = self.goto, self.fail, self.out
+        matched = set()
+        state = 0
+        for word in normalize(text):
+            nxt = goto.get(f"{state} {word}")
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto.get(f"{state} {word}")
+            state = nxt or 0
+            if out[state]:
+                matched.update(out[state])
+
+        hits: dict[int, list] = {}
+        for pattern_id in sorted(matched):
+            words, position, trigger = self.patterns[pattern_id]
+            hits.setdefault(position, []).append((words, trigger))
+        results = []
+        for position, phrases in hits.items():
+            results.append({
+                **self.skills[position],
+                "score": sum(words for words, _ in phrases),
+                "triggers": [trigger for _, trigger in phrases],
+            })
+        results.sort(key=lambda r: (-r["score"], r["name"]))
+        return results
+
+
+def default_cache_path(skill_dirs: list[str]) -> str:
+    key = hashlib.sha1("\n".join(skill_dirs).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(DEFAULT_CACHE_DIR, f"router-{key}.json")
+
+
+def _scan(skill_dirs: list[str]) -> tuple[list[str], dict[str, int]]:
+    """Every SKILL.md under `skill_dirs`, and the mtime of each directory visited."""
+    files, dirs = [], {}
+    for root in skill_dirs:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith("."))
+            dirs[dirpath] = os.stat(dirpath).st_mtime_ns
+            if "SKILL.md" in filenames:
+                files.append(os.path.join(dirpath, "SKILL.md"))
+    return files, dirs
+
+
+def _fresh(index: dict) -> bool:
+    try:
+        for path, (mtime, size) in index["sources"].items():
+            st = os.stat(path)
+            if st.st_mtime_ns != mtime or st.st_size != size:
+                return False
+        return all(os.stat(d).st_mtime_ns == mtime for d, mtime in index["dirs"].items())
+    except OSError:
+        return False
+
+
+def build_index(skill_dirs: list[str]) -> dict:
+    files, dirs = _scan(skill_dirs)
+    skills, patterns, phrases, sources = [], [], [], {}
+    seen: set[tuple[tuple[str, ...], int]] = set()
+    for path in files:
+        st = os.stat(path)
+        sources[path] = [st.st_mtime_ns, st.st_size]
+        meta = parse_frontmatter(path)
+        name = meta.get("name") or os.path.basename(os.path.dirname(path))
+        position = len(skills)
+        skills.append({
+            "name": name,
+            "path": os.path.dirname(path),
+            "description": meta.get("description", ""),
+        })
+        for trigger in [name, *skill_triggers(meta)]:
+            words = normalize(trigger)
+            if words and (tuple(words), position) not in seen:
+                seen.add((tuple(words), position))
+                phrases.append(words)
+                patterns.append([len(words), position, trigger])
+
+    goto, fail, out = build_automaton(phrases)
+    return {
+        "version": INDEX_VERSION,
+        "roots": skill_dirs,
+        "sources": sources,
+        "dirs": dirs,
+        "skills": skills,
+        "patterns": patterns,
+        "goto": goto,
+        "fail": fail,
+        "out": out,
+    }
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+def main():
+    from skill_store import DEFAULT_SOURCE
+
+    parser = argparse.ArgumentParser(description="Encuentra las skills cuyos triggers aparecen en un texto.")
+    parser.add_argument("text", nargs="*", help="Texto del usuario")
+    parser.add_argument(
+        "--skills-dir",
+        action="append",
+        default=None,
+        help="Directorio de skills (repetible; default: .agent/skills y las skills junto a esta)",
+    )
+    parser.add_argument("--index", default=None, help="Ruta del índice compilado")
+    parser.add_argument("--rebuild", action="store_true", help="Recompila el índice aunque esté al día")
+    parser.add_argument("--top", type=int, default=5, help="Máximo de skills a mostrar")
+    parser.add_argument("--json", action="store_true", help="Salida en JSON")
+    args = parser.parse_args()
+
+    skill_dirs = args.skills_dir or [
+        d for d in (os.path.join(".agent", "skills"), DEFAULT_SOURCE) if os.path.isdir(d)
+    ]
+    router = SkillRouter.load(skill_dirs, args.index, args.rebuild)
+    if not args.text:
+        print(f"🧭 Índice con {len(router.skills)} skills y {len(router.patterns)} triggers.")
+        return
+
+    results = router.match(" ".join(args.text))[: args.top]
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    if not results:
+        print("🤷 Ninguna skill coincide.")
+        sys.exit(1)
+    for r in results:
+        print(f"  🧩 {r['name']} ({r['score']}) — {', '.join(r['triggers'])}")
+        print(f"     {r['path']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+ProjectStarterSkill — skill_store.py
+Instalación de las skills base en proyectos nuevos sin copiar contenido.
+
+Los archivos de cada skill (SKILL.md, README.md, scripts/…) se guardan una
+sola vez en un almacén direccionado por contenido (`objects/ab/cdef…`, por
+SHA-256). Cada proyecto recibe su propia copia de esos objetos, hecha con el
+método más barato que admita el sistema de archivos:
+
+  1. reflink (FICLONE, copia en escritura: btrfs, XFS, APFS…)
+  2. copy_file_range (copia dentro del kernel)
+  3. copia normal
+
+Los archivos instalados son independientes y editables. Con `hardlink=True`
+(opción `--hardlink-skills`) se prueba además un hardlink tras reflink: todos
+los proyectos comparten entonces el inodo del objeto, que es de solo lectura.
+Un método que falla entre dos dispositivos no se vuelve a intentar para ese
+par. Para que reflink y hardlink funcionen, el almacén debe estar en el mismo
+sistema de archivos que los proyectos (opción `--store`). Un objeto que ya
+está en el almacén se vuelve a verificar antes de reutilizarlo y se repara
+si su contenido ya no coincide con su hash.
+
+Usage:
+    from skill_store import SkillStore, install
+
+    store = SkillStore("~/.cache/project-starter/store")
+    plan = store.plan("Antigravity/skills", ["commiter", "changelog-updater"])
+    install(plan, "mi-proyecto/.agent/skills")
+"""
+
+import errno
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+from collections import Counter
+
+BASE_SKILLS = ("commiter", "changelog-updater")
+# Skills live next to this one: <skills>/project-starter-skill/scripts/skill_store.py
+DEFAULT_SOURCE = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+STORE_ENV = "PROJECT_STARTER_STORE"
+DEFAULT_STORE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "project-starter", "store"
+)
+SKIP_NAMES = {"__pycache__", ".DS_Store"}
+FICLONE = 0x40049409  # linux/fs.h; fcntl.FICLONE from Python 3.12
+
+# Methods that failed between two devices: (method, src st_dev, dst st_dev)
+_UNSUPPORTED: set[tuple[str, int, int]] = set()
+
+
+class SkillStore:
+    """Content-addressed object store for skill files."""
+
+    def __init__(self, root: str | None = None):
+        self.root = os.path.abspath(
+            os.path.expanduser(root or os.environ.get(STORE_ENV) or DEFAULT_STORE)
+        )
+        self.objects = os.path.join(self.root, "objects")
+
+    def ingest(self, path: str) -> str:
+        """Add a file to the store (if its content is new); return the object path.
+
+        An existing object is re-hashed before it is reused and rewritten
+        from `path` if it was modified in place (e.g. through a hardlink).
+        """
+        digest = file_digest(path)
+        executable = os.stat(path).st_mode & 0o111
+        name = digest + ("-x" if executable else "")
+        obj = os.path.join(self.objects, name[:2], name[2:])
+        if os.path.exists(obj) and file_digest(obj) == digest:
+            return obj
+
+        os.makedirs(os.path.dirname(obj), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".ingest-", dir=os.path.dirname(obj))
+        os.close(fd)
+        try:
+            shutil.copyfile(path, tmp_path)
+            # Objects may be shared by hardlink: keep them read-only
+            os.chmod(tmp_path, 0o555 if executable else 0o444)
+            os.replace(tmp_path, obj)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return obj
+
+    def plan(self, source: str, skills=BASE_SKILLS) -> list[tuple[str, str]]:
+        """Ingest every file of `skills` under `source`; return (relative path, object) pairs."""
+        plan = []
+        for skill in skills:
+            skill_dir = os.path.join(source, skill)
+            if not os.path.isfile(os.path.join(skill_dir, "SKILL.md")):
+                raise FileNotFoundError(f"no se encuentra la skill '{skill}' en {source}")
+            for dirpath, dirnames, filenames in os.walk(skill_dir):
+                dirnames[:] = sorted(d for d in dirnames if d not in SKIP_NAMES and not d.startswith("."))
+                for filename in sorted(filenames):
+                    if filename in SKIP_NAMES or filename.startswith(".") or filename.endswith(".pyc"):
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    rel = os.path.join(skill, os.path.relpath(path, skill_dir))
+                    plan.append((rel, self.ingest(path)))
+        return plan
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# ─────────────────────────────────────────────
+# Linking
+# ─────────────────────────────────────────────
+
+def _reflink(src: str, dst: str) -> None:
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink")
+    import fcntl
+
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), getattr(fcntl, "FICLONE", FICLONE), s.fileno())
+        except OSError:
+            d.close()
+            os.unlink(dst)
+            raise
+
+
+def _copy_file_range(src: str, dst: str) -> None:
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.EOPNOTSUPP, "copy_file_range")
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            remaining = os.fstat(s.fileno()).st_size
+            while remaining > 0:
+                sent = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                if sent == 0:
+                    break
+                remaining -= sent
+        except OSError:
+            d.close()
+            os.unlink(dst)
+            raise
+
+
+LINKERS = [
+    ("reflink", _reflink),
+    ("copy_file_range", _copy_file_range),
+    ("copy", shutil.copyfile),
+]
+# Opt-in only: a hardlinked file shares its inode with the store object
+HARDLINK = ("hardlink", os.link)
+
+
+def link_file(src: str, dst: str, src_dev: int, dst_dev: int, hardlink: bool = False) -> str:
+    """Materialize `src` at `dst` with the cheapest working method; return its name.
+
+    Every method but `hardlink` (tried after reflink when enabled) yields
+    an independent, writable file.
+    """
+    linkers = [LINKERS[0], HARDLINK, *LINKERS[1:]] if hardlink else LINKERS
+    for method, linker in linkers:
+        if (method, src_dev, dst_dev) in _UNSUPPORTED:
+            continue
+        if method == "copy":
+            linker(src, dst)
+            break
+        try:
+            linker(src, dst)
+            break
+        except OSError as e:
+            if e.errno in (errno.EEXIST, errno.ENOENT, errno.ENOSPC):
+                raise
+            _UNSUPPORTED.add((method, src_dev, dst_dev))
+    if method != "hardlink":
+        # Private copies stay writable, like any scaffolded file
+        os.chmod(dst, 0o755 if os.stat(src).st_mode & 0o111 else 0o644)
+    return method
+
+
+def install(plan: list[tuple[str, str]], dest: str, hardlink: bool = False) -> Counter:
+    """Install a `SkillStore.plan` under `dest`; return how many files each method handled.
+
+    With `hardlink` the files may share the store's read-only inodes.
+    """
+    used = Counter()
+    made = set()
+    src_dev = None
+    for rel, obj in plan:
+        target = os.path.join(dest, rel)
+        parent = os.path.dirname(target)
+        if parent not in made:
+            os.makedirs(parent, exist_ok=True)
+            made.add(parent)
+        if src_dev is None:
+            src_dev = os.stat(obj).st_dev
+            dst_dev = os.stat(dest).st_dev
+        used[link_file(obj, target, src_dev, dst_dev, hardlink)] += 1
+    return used
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+ProjectStarterSkill — template_engine.py
+Plantillas precompiladas para init_project.py.
+
+Cada plantilla es un archivo de texto con huecos `{{nombre}}`. Al cargarla se
+compila una sola vez en una tupla de trozos estáticos y nombres de hueco, y
+el resultado se cachea por ruta, mtime y tamaño: renderizar es solo unir
+trozos con los valores del contexto.
+
+Las plantillas se buscan primero en un directorio de overrides (opción
+`--templates` o variable PROJECT_STARTER_TEMPLATES) y después en las de la
+skill (`assets/templates/`). Un equipo puede sobrescribir solo los archivos
+que quiera cambiar, con la misma ruta relativa.
+
+Todos los archivos de un proyecto se renderizan con el mismo contexto, creado
+con una única lectura del reloj (`make_context`).
+
+Usage:
+    from template_engine import TemplateLoader, make_context
+
+    loader = TemplateLoader("mis-plantillas")
+    text = loader.render("genesis.md", make_context("mi-proyecto"))
+"""
+
+import os
+import re
+from datetime import datetime
+
+SLOT_PATTERN = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+BUILTIN_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "templates"
+)
+OVERRIDE_ENV = "PROJECT_STARTER_TEMPLATES"
+
+# path -> (mtime_ns, size, compiled)
+_CACHE: dict[str, tuple[int, int, tuple[str, ...]]] = {}
+
+
+def make_context(
+    project_name: str,
+    license_type: str = "MIT",
+    visibility: str = "private",
+    now: datetime | None = None,
+) -> dict[str, str]:
+    """Snapshot of every slot value, reading the clock once."""
+    now = now or datetime.now()
+    return {
+        "project_name": project_name,
+        "license": license_type,
+        "visibility": visibility,
+        "date": now.strftime("%Y-%m-%d"),
+        "year": str(now.year),
+    }
+
+
+def compile_template(text: str) -> tuple[str, ...]:
+    """Split a template into (static, slot, static, slot, ..., static)."""
+    return tuple(SLOT_PATTERN.split(text))
+
+
+def check_slots(name: str, compiled: tuple[str, ...], context: dict[str, str]) -> None:
+    """Raise ValueError if the template uses a slot the context lacks."""
+    missing = [slot for slot in compiled[1::2] if slot not in context]
+    if missing:
+        raise ValueError(f"la plantilla '{name}' usa un hueco desconocido: {missing[0]}")
+
+
+def render(compiled: tuple[str, ...], context: dict[str, str]) -> str:
+    """Fill the slots of a compiled template from `context`."""
+    if len(compiled) == 1:
+        return compiled[0]
+    parts = list(compiled)
+    parts[1::2] = [context[slot] for slot in compiled[1::2]]
+    return "".join(parts)
+
+
+class TemplateLoader:
+    """Resolves template names against the override directory, then the built-ins."""
+
+    def __init__(self, override_dir: str | None = None):
+        override_dir = override_dir or os.environ.get(OVERRIDE_ENV)
+        self.dirs = [d for d in (override_dir, BUILTIN_DIR) if d]
+
+    def path(self, name: str) -> str:
+        for directory in self.dirs:
+            candidate = os.path.join(directory, name)
+            if os.path.isfile(candidate):
+                return candidate
+        raise FileNotFoundError(f"plantilla no encontrada: '{name}' (buscada en {', '.join(self.dirs)})")
+
+    def exists(self, name: str) -> bool:
+        return any(os.path.isfile(os.path.join(d, name)) for d in self.dirs)
+
+    def get(self, name: str) -> tuple[str, ...]:
+        """The compiled template, recompiled only when its file changes."""
+        path = self.path(name)
+        st = os.stat(path)
+        cached = _CACHE.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            compiled = compile_template(f.read())
+        _CACHE[path] = (st.st_mtime_ns, st.st_size, compiled)
+        return compiled
+
+    def render(self, name: str, context: dict[str, str]) -> str:
+        compiled = self.get(name)
+        check_slots(name, compiled, context)
+        return render(compiled, context)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+ProjectStarterSkill — upgrade_project.py
+Actualiza proyectos ya creados a la versión actual de las plantillas.
+
+Al crear un proyecto, init_project.py guarda en `.agent/scaffold.json` el
+contexto de renderizado (nombre, licencia, fecha…) y el SHA-256 de cada
+archivo generado. Para actualizarlo se vuelve a renderizar cada plantilla
+con ese mismo contexto y se compara:
+
+  - salida nueva == hash guardado     → al día; ni siquiera se lee el disco.
+  - disco == hash guardado            → sin editar: se reescribe.
+  - disco == salida nueva             → ya estaba al día: solo se registra.
+  - disco distinto de ambos           → editado por el usuario: se informa.
+  - archivo borrado por el usuario    → se informa, no se recrea.
+  - plantilla nueva sin archivo       → se crea.
+
+Así el trabajo es proporcional a los archivos cuya plantilla cambió.
+
+Usage:
+    python init_project.py --upgrade proyectos/*/ [--dry-run] [--templates <dir>]
+"""
+
+import json
+import os
+import tempfile
+
+import init_project
+from template_engine import TemplateLoader, make_context, render
+
+# Outcomes, as shown in the report
+UPDATED = "actualizado"
+CREATED = "creado"
+EDITED = "editado por el usuario"
+DELETED = "eliminado por el usuario"
+CONFLICT = "ya existe y no lo generó el scaffold"
+OBSOLETE = "ya no forma parte de la plantilla"
+
+
+def disk_digest(path: str) -> str | None:
+    """Hash of a file as text (so platform newlines do not count as edits)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return init_project.content_digest(f.read())
+    except FileNotFoundError:
+        return None
+    except (UnicodeDecodeError, IsADirectoryError):
+        return ""
+
+
+def _replace(path: str, content: str) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".upgrade-", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def upgrade_project(
+    root: str, loader: TemplateLoader, dry_run: bool = False
+) -> tuple[list[tuple[str, str]], int]:
+    """Bring one project up to date; return ([(path, outcome)], files already current).
+
+    Raises OSError or ValueError if the record or a template cannot be read.
+    """
+    record_path = os.path.join(root, init_project.SCAFFOLD_RECORD)
+    with open(record_path, "r", encoding="utf-8") as f:
+        record = json.load(f)
+    if record.get("version") != init_project.RECORD_VERSION:
+        raise ValueError(f"versión de {init_project.SCAFFOLD_RECORD} no soportada")
+
+    saved = record["context"]
+    # Slots added to the templates later get today's values
+    context = {
+        **make_context(saved["project_name"], saved["license"], saved["visibility"]),
+        **saved,
+    }
+    files = record["files"]
+    spec = init_project.compile_manifest(context["license"], context, loader)
+
+    changes, current = [], 0
+    for path, compiled in spec:
+        content = render(compiled, context)
+        new = init_project.content_digest(content)
+        old = files.get(path)
+        if new == old:
+            current += 1
+            continue
+
+        on_disk = disk_digest(os.path.join(root, path))
+        if on_disk == new:
+            outcome = None  # someone already applied this version
+        elif old is None:
+            outcome = CREATED if on_disk is None else CONFLICT
+        elif on_disk is None:
+            outcome = DELETED
+        elif on_disk == old:
+            outcome = UPDATED
+        else:
+            outcome = EDITED
+
+        if outcome in (CREATED, UPDATED) and not dry_run:
+            _replace(os.path.join(root, path), content)
+        if outcome in (None, CREATED, UPDATED):
+            files[path] = new
+        if outcome:
+            changes.append((path, outcome))
+        else:
+            current += 1
+
+    templated = {path for path, _ in spec}
+    for path in [p for p in files if p not in templated]:
+        changes.append((path, OBSOLETE))
+        del files[path]  # from now on the file belongs to the project
+
+    if changes and not dry_run:
+        _replace(record_path, json.dumps(record, ensure_ascii=False, indent=2) + "\n")
+    return changes, current
+
+
+def upgrade_projects(
+    roots: list[str], templates: str | None = None, dry_run: bool = False, verbose: bool = False
+) -> int:
+    """Upgrade every project in `roots` and print a report; return the number of failures."""
+    loader = TemplateLoader(templates)
+    out = [f"\n🔄 Actualizando {len(roots)} proyectos" + (" (simulación)" if dry_run else ""), ""]
+    failures = 0
+    totals: dict[str, int] = {}
+    for root in roots:
+        name = os.path.basename(os.path.normpath(root))
+        if not os.path.isfile(os.path.join(root, init_project.SCAFFOLD_RECORD)):
+            failures += 1
+            out.append(f"  ❌ {name}: sin {init_project.SCAFFOLD_RECORD} (creado con una versión anterior)")
+            continue
+        try:
+            changes, current = upgrade_project(root, loader, dry_run)
+        except (OSError, ValueError, KeyError) as e:
+            failures += 1
+            out.append(f"  ❌ {name}: {e}")
+            continue
+
+        counts: dict[str, int] = {}
+        for _, outcome in changes:
+            counts[outcome] = counts.get(outcome, 0) + 1
+            totals[outcome] = totals.get(outcome, 0) + 1
+        summary = ", ".join(f"{outcome}: {count}" for outcome, count in counts.items())
+        icon = "⚠️ " if EDITED in counts or DELETED in counts or CONFLICT in counts else "✅"
+        out.append(f"  {icon} {name}: {summary or 'al día'} ({current} sin cambios)")
+        for path, outcome in changes:
+            if verbose or outcome in (EDITED, DELETED, CONFLICT):
+                out.append(f"      · {path}: {outcome}")
+
+    totals_line = ", ".join(f"{outcome}: {count}" for outcome, count in totals.items()) or "nada que actualizar"
+    out += ["", "=" * 50, f"📦 {totals_line}; {failures} proyectos con error.", ""]
+    print("\n".join(out))
+    return failures
@@ -0,0 +1,725 @@
+#!/usr/bin/env python3
+"""
+ProjectStarterSkill — validate_schema.py
+Valida datos JSON/JSONL contra los esquemas de Input/Output de genesis.md.
+
+Extrae los bloques ```json de la sección "Esquema de Datos" de genesis.md
+(cada uno se llama como su encabezado: input, output…). Acepta JSON Schema
+(subconjunto: type, properties, required, additionalProperties, items,
+enum, const, format, pattern, min/max, minLength/maxLength,
+minItems/maxItems) y también la notación de ejemplo de la fase E:
+
+    {"id": "string (UUID)", "timestamp": "ISO 8601",
+     "status": "enum: success|error", "tags": ["string"], "nota?": "string"}
+
+Los esquemas se compilan a funciones Python generadas (comprobaciones en
+línea, sin interpretar el esquema en cada registro) y el código compilado se
+cachea en `~/.cache/project-starter/validators/` por el hash de genesis.md.
+
+Los archivos se validan en streaming con memoria constante: JSONL línea a
+línea, y JSON como array (o secuencia de valores) elemento a elemento. Los
+JSONL grandes se reparten por rangos de bytes entre un pool de procesos. El
+resultado es un resumen por campo y tipo de error con algunos ejemplos.
+
+Usage:
+    python validate_schema.py                         # todo .tmp/ contra el único esquema
+                                                      # (o input/output según el nombre del archivo)
+    python validate_schema.py .tmp/respuestas.jsonl --schema input
+    python validate_schema.py .tmp/salida.json --schema output --genesis ../genesis.md --jobs 8
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import marshal
+import math
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from skill_router import DEFAULT_CACHE_DIR, normalize
+
+GENERATOR_VERSION = 2
+CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, "validators")
+SCHEMA_SECTION = "esquema de datos"
+JSON_FENCE = re.compile(r"^```json\s*$", re.IGNORECASE)
+DATA_PATTERNS = ("*.json", "*.jsonl", "*.ndjson")
+LINE_FORMATS = (".jsonl", ".ndjson")
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+NUMBER_CHARS = "0123456789.eE+-"
+PARALLEL_MIN_BYTES = 64 << 20
+MAX_RECORD_BYTES = 64 << 20
+MAX_EXAMPLES = 3
+
+JSON_TYPES = ("string", "number", "integer", "boolean", "object", "array", "null")
+COUNT_KEYWORDS = ("minLength", "maxLength", "minItems", "maxItems")
+BOUND_KEYWORDS = ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")
+SCHEMA_KEYWORDS = {
+    "$schema", "$id", "title", "description", "type", "properties", "required",
+    "additionalProperties", "items", "enum", "const", "format", "pattern",
+    "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "minLength",
+    "maxLength", "minItems", "maxItems", "default", "examples",
+}
+# Shape notation: first matching word wins
+SHAPE_WORDS = [
+    (("uuid",), {"type": "string", "format": "uuid"}),
+    (("iso", "datetime", "timestamp"), {"type": "string", "format": "date-time"}),
+    (("date", "fecha"), {"type": "string", "format": "date"}),
+    (("email", "correo"), {"type": "string", "format": "email"}),
+    (("url", "uri"), {"type": "string", "format": "uri"}),
+    (("string", "str", "texto", "text"), {"type": "string"}),
+    (("integer", "int", "entero"), {"type": "integer"}),
+    (("number", "float", "numero", "decimal"), {"type": "number"}),
+    (("boolean", "bool", "booleano"), {"type": "boolean"}),
+    (("object", "objeto", "dict"), {"type": "object"}),
+    (("array", "list", "lista"), {"type": "array"}),
+    (("null",), {"type": "null"}),
+]
+TYPE_TESTS = {
+    "string": "type({v}) is str",
+    "integer": "(type({v}) is int or (type({v}) is float and {v}.is_integer()))",
+    "number": "type({v}) in (int, float)",
+    "boolean": "type({v}) is bool",
+    "object": "type({v}) is dict",
+    "array": "type({v}) is list",
+    "null": "{v} is None",
+}
+PRELUDE = r'''
+import re
+
+MISSING = object()
+FORMATS = {
+    "date-time": re.compile(r"\d{4}-\d{2}-\d{2}[Tt ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?([Zz]|[+-]\d{2}:?\d{2})?$"),
+    "date": re.compile(r"\d{4}-\d{2}-\d{2}$"),
+    "uuid": re.compile(r"[0-9a-fA-F]{8}-([0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$"),
+    "email": re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+$"),
+    "uri": re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*:\S+$"),
+}
+
+
+def _detail(v):
+    text = repr(v)
+    return text if len(text) <= 40 else text[:37] + "..."
+'''
+
+
+# ─────────────────────────────────────────────
+# Schemas from genesis.md
+# ─────────────────────────────────────────────
+
+def is_json_schema(block) -> bool:
+    if not isinstance(block, dict):
+        return False
+    if "$schema" in block or isinstance(block.get("properties"), dict):
+        return True
+    return block.get("type") in JSON_TYPES and set(block) <= SCHEMA_KEYWORDS
+
+
+def shape_to_schema(shape) -> dict:
+    """A JSON Schema equivalent to an example shape (all fields required unless `key?`)."""
+    if isinstance(shape, dict):
+        if is_json_schema(shape):
+            return shape
+        properties, required = {}, []
+        for key, value in shape.items():
+            name = key[:-1] if key.endswith("?") else key
+            properties[name] = shape_to_schema(value)
+            if not key.endswith("?"):
+                required.append(name)
+        return {"type": "object", "properties": properties, "required": required}
+    if isinstance(shape, list):
+        return {"type": "array", "items": shape_to_schema(shape[0])} if shape else {"type": "array"}
+    if isinstance(shape, bool):
+        return {"type": "boolean"}
+    if isinstance(shape, int):
+        return {"type": "integer"}
+    if isinstance(shape, float):
+        return {"type": "number"}
+    if shape is None:
+        return {"type": "null"}
+
+    text = shape.strip()
+    if text.casefold().startswith("enum:"):
+        return {"enum": [v.strip() for v in text[5:].split("|") if v.strip()]}
+    alternatives = []
+    for part in text.split("|"):
+        words = normalize(part)
+        for keys, schema in SHAPE_WORDS:
+            if any(word in keys for word in words):
+                alternatives.append(schema)
+                break
+        else:
+            return {}  # free text ("API externa"): anything goes
+    if len(alternatives) == 1:
+        return dict(alternatives[0])
+    types = [a["type"] for a in alternatives]
+    formats = {a["format"] for a in alternatives if "format" in a}
+    schema = {"type": list(dict.fromkeys(types))}
+    if len(formats) == 1 and types.count("string") == 1:
+        schema["format"] = formats.pop()
+    return schema
+
+
+def _is_placeholder(block) -> bool:
+    return isinstance(block, dict) and any(key.strip().upper() == "TODO" for key in block)
+
+
+def extract_schemas(text: str) -> tuple[dict[str, dict], list[str]]:
+    """Schemas of the "Esquema de Datos" section: ({name: schema}, [names still TODO]).
+
+    Without that section every ```json block of the file is used. Blocks
+    are named after the closest heading above them; a block with `input` /
+    `output` entries holding a `schema` yields one schema per entry.
+    Raises ValueError if a block is not valid JSON.
+    """
+    lines = text.splitlines()
+    has_section = any(
+        l.startswith("## ") and " ".join(normalize(l[3:])) == SCHEMA_SECTION for l in lines
+    )
+    blocks = []  # (name, first line, source)
+    in_section, heading, i = not has_section, "", 0
+    while i < len(lines):
+        line = lines[i]
+        if line.startswith("## ") and has_section:
+            in_section = " ".join(normalize(line[3:])) == SCHEMA_SECTION
+            heading = ""
+        elif line.startswith("#"):
+            heading = " ".join(normalize(line.lstrip("#"))).replace(" ", "-")
+        if in_section and JSON_FENCE.match(line.strip()):
+            end = i + 1
+            while end < len(lines) and lines[end].strip() != "```":
+                end += 1
+            blocks.append((heading or "schema", i + 2, "\n".join(lines[i + 1:end])))
+            i = end
+        i += 1
+
+    schemas, undefined = {}, []
+
+    def add(name, block):
+        base, n = name, 2
+        while name in schemas or name in undefined:
+            name, n = f"{base}-{n}", n + 1
+        if _is_placeholder(block):
+            undefined.append(name)
+        else:
+            schemas[name] = shape_to_schema(block)
+
+    for name, line_no, source in blocks:
+        try:
+            block = json.loads(source)
+        except ValueError as e:
+            raise ValueError(f"el bloque json de '{name}' (línea {line_no}) no es JSON válido: {e}")
+        wrapped = isinstance(block, dict) and block and all(
+            isinstance(v, dict) and "schema" in v for v in block.values()
+        )
+        if wrapped:
+            for key, value in block.items():
+                add(" ".join(normalize(key)).replace(" ", "-") or name, value["schema"])
+        else:
+            add(name, block)
+    return schemas, undefined
+
+
+# ─────────────────────────────────────────────
+# Code generation
+# ─────────────────────────────────────────────
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _finite(value) -> bool:
+    """False if `value` holds NaN or ±Infinity anywhere (json.loads accepts them)."""
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, list):
+        return all(_finite(v) for v in value)
+    if isinstance(value, dict):
+        return all(_finite(v) for v in value.values())
+    return True
+
+
+def check_keywords(schema, path: str) -> None:
+    """Reject keyword values the generated code cannot use.
+
+    Raises ValueError naming the JSON path of the offending (sub)schema, so a
+    typo in genesis.md is reported instead of crashing codegen or producing
+    source that fails to run.
+    """
+    def fail(keyword, expected):
+        where = f"{path} ({keyword})" if keyword else path
+        shown = schema.get(keyword) if keyword else schema
+        raise ValueError(f"{where}: se esperaba {expected}, no {json.dumps(shown, ensure_ascii=False)[:40]}")
+
+    if not isinstance(schema, dict):
+        fail(None, "un objeto (esquema)")
+    types = schema.get("type")
+    if types is not None and not (
+        isinstance(types, str) or (isinstance(types, list) and all(isinstance(t, str) for t in types))
+    ):
+        fail("type", "un tipo o una lista de tipos")
+    for keyword in COUNT_KEYWORDS:
+        value = schema.get(keyword)
+        if keyword in schema and not (_is_number(value) and value >= 0 and float(value).is_integer()):
+            fail(keyword, "un entero >= 0")
+    for keyword in BOUND_KEYWORDS:
+        value = schema.get(keyword)
+        if keyword in schema and not isinstance(value, bool) and not (_is_number(value) and math.isfinite(value)):
+            fail(keyword, "un número finito")
+    if "enum" in schema and not (isinstance(schema["enum"], list) and _finite(schema["enum"])):
+        fail("enum", "una lista de valores JSON finitos")
+    if "const" in schema and not _finite(schema["const"]):
+        fail("const", "un valor JSON finito")
+    if "pattern" in schema:
+        if not isinstance(schema["pattern"], str):
+            fail("pattern", "una expresión regular")
+        try:
+            re.compile(schema["pattern"])
+        except re.error as e:
+            raise ValueError(f"{path} (pattern): expresión regular no válida: {e}") from None
+    if "format" in schema and not isinstance(schema["format"], str):
+        fail("format", "una cadena")
+    if "properties" in schema and not isinstance(schema["properties"], dict):
+        fail("properties", "un objeto {campo: esquema}")
+    required = schema.get("required")
+    if required is not None and not (isinstance(required, list) and all(isinstance(k, str) for k in required)):
+        fail("required", "una lista de nombres de campo")
+
+
+class _Codegen:
+    """Turns a schema into the body of a `check(v0, err)` function."""
+
+    def __init__(self):
+        self.consts: list[str] = []
+        self.lines: list[str] = []
+        self.n = 0
+
+    def const(self, expr: str) -> str:
+        self.consts.append(f"C{len(self.consts)} = {expr}")
+        return f"C{len(self.consts) - 1}"
+
+    def var(self) -> str:
+        self.n += 1
+        return f"v{self.n}"
+
+    def emit(self, depth: int, line: str) -> None:
+        self.lines.append("    " * depth + line)
+
+    def block(self, depth: int, header: str, body) -> None:
+        """Emit `header` followed by `body(depth + 1)`, or nothing if the body is empty."""
+        mark = len(self.lines)
+        self.emit(depth, header)
+        body(depth + 1)
+        if len(self.lines) == mark + 1:
+            self.lines.pop()
+
+    def error(self, depth: int, path: str, kind: str, var: str) -> None:
+        self.emit(depth, f"err(({path!r}, {kind!r}, _detail({var})))")
+
+    def node(self, schema: dict, var: str, path: str, depth: int) -> None:
+        check_keywords(schema, path)
+        types = schema.get("type")
+        types = [types] if isinstance(types, str) else list(types or [])
+        if types:
+            test = " or ".join(TYPE_TESTS[t].format(v=var) for t in types if t in TYPE_TESTS) or "True"
+            self.emit(depth, f"if not ({test}):")
+            self.error(depth + 1, path, f"se esperaba {'|'.join(types)}", var)
+            self.block(depth, "else:", lambda d: self.constraints(schema, types, var, path, d))
+        else:
+            self.constraints(schema, types, var, path, depth)
+
+    def guarded(self, depth: int, var: str, types: list[str], kind: str, body) -> None:
+        """Run `body` only on values of `kind` unless the type check already ensured it."""
+        if types == [kind]:
+            body(depth)
+        else:
+            self.block(depth, f"if {TYPE_TESTS[kind].format(v=var)}:", body)
+
+    def constraints(self, schema: dict, types: list[str], var: str, path: str, depth: int) -> None:
+        if "enum" in schema:
+            values = self.const(repr(tuple(schema["enum"])))
+            self.emit(depth, f"if {var} not in {values}:")
+            self.error(depth + 1, path, f"fuera de enum ({'|'.join(map(str, schema['enum']))})", var)
+        if "const" in schema:
+            value = self.const(repr(schema["const"]))
+            self.emit(depth, f"if {var} != {value}:")
+            self.error(depth + 1, path, f"distinto de {schema['const']!r}", var)
+
+        def strings(d):
+            if "minLength" in schema:
+                self.emit(d, f"if len({var}) < {int(schema['minLength'])}:")
+                self.error(d + 1, path, f"longitud < {schema['minLength']}", var)
+            if "maxLength" in schema:
+                self.emit(d, f"if len({var}) > {int(schema['maxLength'])}:")
+                self.error(d + 1, path, f"longitud > {schema['maxLength']}", var)
+            if "pattern" in schema:
+                pattern = self.const(f"re.compile({schema['pattern']!r})")
+                self.emit(d, f"if not {pattern}.search({var}):")
+                self.error(d + 1, path, f"no cumple el patrón {schema['pattern']}", var)
+            if schema.get("format") in ("date-time", "date", "uuid", "email", "uri"):
+                self.emit(d, f"if not FORMATS[{schema['format']!r}].match({var}):")
+                self.error(d + 1, path, f"formato {schema['format']} no válido", var)
+
+        def numbers(d):
+            for keyword, op in zip(BOUND_KEYWORDS, ("<", ">", "<=", ">=")):
+                # Draft-04 booleans (`"exclusiveMinimum": true`) are not bounds
+                if keyword in schema and not isinstance(schema[keyword], bool):
+                    self.emit(d, f"if {var} {op} {schema[keyword]!r}:")
+                    self.error(d + 1, path, f"{keyword} {schema[keyword]}", var)
+
+        def objects(d):
+            properties = schema.get("properties") or {}
+            required = set(schema.get("required") or [])
+            for key, child in properties.items():
+                child_path = f"{path}.{key}" if key.isidentifier() else f"{path}[{key!r}]"
+                value = self.var()
+                self.emit(d, f"{value} = {var}.get({key!r}, MISSING)")
+                if key in required:
+                    self.emit(d, f"if {value} is MISSING:")
+                    self.emit(d + 1, f"err(({child_path!r}, 'falta el campo', ''))")
+                    self.block(d, "else:", lambda dd: self.node(child, value, child_path, dd))
+                else:
+                    self.block(d, f"if {value} is not MISSING:", lambda dd: self.node(child, value, child_path, dd))
+            for key in sorted(required - set(properties)):
+                child_path = f"{path}.{key}" if key.isidentifier() else f"{path}[{key!r}]"
+                self.emit(d, f"if {key!r} not in {var}:")
+                self.emit(d + 1, f"err(({child_path!r}, 'falta el campo', ''))")
+            if schema.get("additionalProperties") is False:
+                allowed = self.const(repr(frozenset(properties)))
+                key = self.var()
+                self.emit(d, f"for {key} in {var}:")
+                self.emit(d + 1, f"if {key} not in {allowed}:")
+                self.error(d + 2, f"{path}.*", "campo no permitido", key)
+
+        def arrays(d):
+            if "minItems" in schema:
+                self.emit(d, f"if len({var}) < {int(schema['minItems'])}:")
+                self.error(d + 1, path, f"menos de {schema['minItems']} elementos", f"len({var})")
+            if "maxItems" in schema:
+                self.emit(d, f"if len({var}) > {int(schema['maxItems'])}:")
+                self.error(d + 1, path, f"más de {schema['maxItems']} elementos", f"len({var})")
+            if isinstance(schema.get("items"), dict) and schema["items"]:
+                item = self.var()
+                self.block(d, f"for {item} in {var}:", lambda dd: self.node(schema["items"], item, f"{path}[*]", dd))
+
+        self.guarded(depth, var, types, "string", strings)
+        self.guarded(depth, var, types, "number", numbers)
+        self.guarded(depth, var, types, "object", objects)
+        self.guarded(depth, var, types, "array", arrays)
+
+
+def generate_source(schemas: dict[str, dict], undefined: list[str]) -> str:
+    """Python source defining one check function per schema, in VALIDATORS.
+
+    Raises ValueError if a schema has keyword values that cannot be compiled.
+    """
+    gen = _Codegen()
+    functions = []
+    for i, (name, schema) in enumerate(schemas.items()):
+        gen.lines = []
+        try:
+            gen.node(schema, "v0", "$", 1)
+        except ValueError as e:
+            raise ValueError(f"esquema '{name}': {e}") from None
+        functions.append(
+            f"def check_{i}(v0, err):\n    # {name}\n" + "\n".join(gen.lines or ["    pass"]) + "\n"
+        )
+    validators = ", ".join(f"{name!r}: check_{i}" for i, name in enumerate(schemas))
+    return "\n".join([
+        PRELUDE,
+        *gen.consts,
+        "\n",
+        "\n\n".join(functions),
+        f"VALIDATORS = {{{validators}}}",
+        f"UNDEFINED = {undefined!r}",
+        "",
+    ])
+
+
+def load_validators(genesis: str) -> dict:
+    """The compiled module namespace for `genesis`, from the cache when its hash is known."""
+    with open(genesis, "rb") as f:
+        data = f.read()
+    key = hashlib.sha256(data + f"\0{GENERATOR_VERSION}".encode("ascii")).hexdigest()[:32]
+    cache_path = os.path.join(CACHE_DIR, f"{key}.{sys.implementation.cache_tag}.bin")
+    try:
+        with open(cache_path, "rb") as f:
+            return exec_validators(f.read())
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+
+    schemas, undefined = extract_schemas(data.decode("utf-8"))
+    code = compile(generate_source(schemas, undefined), f"<{os.path.basename(genesis)}>", "exec")
+    code_bytes = marshal.dumps(code)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(code_bytes)
+    os.replace(tmp_path, cache_path)
+    return exec_validators(code_bytes)
+
+
+def exec_validators(code_bytes: bytes) -> dict:
+    namespace = {"__code__": code_bytes}
+    exec(marshal.loads(code_bytes), namespace)
+    return namespace
+
+
+# ─────────────────────────────────────────────
+# Streaming validation
+# ─────────────────────────────────────────────
+
+class Summary:
+    """Error counts per (path, kind) with a few examples; size bounded by the schema."""
+
+    def __init__(self):
+        self.records = 0
+        self.invalid = 0
+        self.lines = 0
+        self.errors: Counter = Counter()
+        self.examples: dict[tuple[str, str], list[tuple[int, str]]] = {}
+
+    def record(self, where: int, errors: list) -> None:
+        self.records += 1
+        if not errors:
+            return
+        self.invalid += 1
+        for path, kind, detail in errors:
+            key = (path, kind)
+            self.errors[key] += 1
+            examples = self.examples.setdefault(key, [])
+            if len(examples) < MAX_EXAMPLES:
+                examples.append((where, detail))
+
+    def merge(self, other: "Summary", line_offset: int = 0) -> None:
+        self.records += other.records
+        self.invalid += other.invalid
+        self.lines += other.lines
+        self.errors.update(other.errors)
+        for key, examples in other.examples.items():
+            mine = self.examples.setdefault(key, [])
+            mine += [(where + line_offset, detail) for where, detail in examples][: MAX_EXAMPLES - len(mine)]
+
+
+def validate_lines(path: str, check, start: int = 0, end: int | None = None) -> Summary:
+    """Validate the JSONL lines in bytes [start, end) of `path`; line numbers are relative to `start`."""
+    summary = Summary()
+    pos = start
+    with open(path, "rb") as f:
+        f.seek(start)
+        for line in f:
+            if end is not None and pos >= end:
+                break
+            pos += len(line)
+            summary.lines += 1
+            if not line.strip():
+                continue
+            errors = []
+            try:
+                value = json.loads(line)
+            except ValueError as e:
+                errors.append(("$", "JSON no válido", str(e)[:40]))
+            else:
+                check(value, errors.append)
+            summary.record(summary.lines, errors)
+    return summary
+
+
+def iter_json(f, chunk_size: int = 1 << 20):
+    """Values of a JSON array (or of concatenated JSON values), one at a time."""
+    decoder = json.JSONDecoder()
+    buf, pos, eof, in_array = "", 0, False, None
+    while True:
+        pos = WHITESPACE.match(buf, pos).end()
+        if pos == len(buf):
+            if eof:
+                break
+            more = f.read(chunk_size)
+            buf, pos, eof = buf[pos:] + more, 0, not more
+            continue
+        if in_array is None:
+            in_array = buf[pos] == "["
+            pos += in_array
+            continue
+        if in_array and buf[pos] in "],":
+            if buf[pos] == "]":
+                return
+            pos += 1
+            continue
+        try:
+            value, end = decoder.raw_decode(buf, pos)
+            # A number cut at the end of the buffer ("12" of "12.5") is not complete
+            complete = eof or (end < len(buf) and not (buf[end - 1].isdigit() and buf[end] in NUMBER_CHARS))
+        except json.JSONDecodeError:
+            if eof or len(buf) - pos > MAX_RECORD_BYTES:
+                raise
+            complete = False
+        if not complete:
+            more = f.read(chunk_size)
+            buf, pos, eof = buf[pos:] + more, 0, not more
+            continue
+        yield value
+        pos = end
+    if in_array:
+        raise ValueError("array sin cerrar al final del archivo")
+
+
+def validate_json(path: str, check) -> Summary:
+    summary = Summary()
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            for value in iter_json(f):
+                errors = []
+                check(value, errors.append)
+                summary.record(summary.records + 1, errors)
+        except ValueError as e:
+            summary.record(summary.records + 1, [("$", "JSON no válido", str(e)[:40])])
+    return summary
+
+
+_CHECK = None
+
+
+def _init_worker(code_bytes: bytes, schema: str) -> None:
+    global _CHECK
+    _CHECK = exec_validators(code_bytes)["VALIDATORS"][schema]
+
+
+def _validate_range(path: str, start: int, end: int) -> Summary:
+    return validate_lines(path, _CHECK, start, end)
+
+
+def line_ranges(path: str, parts: int) -> list[tuple[int, int]]:
+    """Split `path` into about `parts` byte ranges that start at line boundaries."""
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            f.seek(size * i // parts)
+            f.readline()
+            if f.tell() > bounds[-1] and f.tell() < size:
+                bounds.append(f.tell())
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def validate_file(path: str, namespace: dict, schema: str, jobs: int = 1) -> Summary:
+    """Validate one JSON or JSONL file against `schema`."""
+    check = namespace["VALIDATORS"][schema]
+    if not path.endswith(LINE_FORMATS):
+        return validate_json(path, check)
+    if jobs <= 1 or os.path.getsize(path) < PARALLEL_MIN_BYTES:
+        return validate_lines(path, check)
+
+    summary = Summary()
+    ranges = line_ranges(path, jobs * 4)
+    with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(namespace["__code__"], schema)) as pool:
+        parts = pool.map(_validate_range, [path] * len(ranges), *zip(*ranges))
+        for part in parts:
+            summary.merge(part, line_offset=summary.lines)
+    return summary
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+def report(path: str, schema: str, summary: Summary, limit: int = 10) -> list[str]:
+    unit = "línea" if path.endswith(LINE_FORMATS) else "registro"
+    if not summary.invalid:
+        return [f"  ✅ {path}: {summary.records} registros válidos ({schema})"]
+    out = [f"  ❌ {path}: {summary.invalid} de {summary.records} registros no válidos ({schema})"]
+    for (field, kind), count in summary.errors.most_common(limit):
+        examples = summary.examples[(field, kind)]
+        where = ", ".join(str(w) for w, _ in examples)
+        detail = f": {examples[0][1]}" if examples[0][1] else ""
+        out.append(f"      · {field} — {kind}: {count} ({unit} {where}{detail})")
+    if len(summary.errors) > limit:
+        out.append(f"      · … y {len(summary.errors) - limit} tipos de error más")
+    return out
+
+
+def schema_for(path: str, validators: dict) -> str | None:
+    """The only schema whose name appears in the file name (`.tmp/input.jsonl` → input)."""
+    words = set(normalize(os.path.splitext(os.path.basename(path))[0]))
+    matches = [name for name in validators if set(name.split("-")) <= words]
+    return matches[0] if len(matches) == 1 else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Valida JSON/JSONL contra los esquemas de genesis.md.")
+    parser.add_argument("files", nargs="*", help="Archivos a validar (default: .json/.jsonl de .tmp/)")
+    parser.add_argument("--genesis", default="genesis.md", help="Ruta de genesis.md")
+    parser.add_argument(
+        "--schema", help="Esquema a aplicar (default: el único definido, o el que nombra cada archivo)"
+    )
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Procesos para JSONL grandes")
+    parser.add_argument("--json", action="store_true", help="Resumen en JSON")
+    args = parser.parse_args()
+
+    try:
+        namespace = load_validators(args.genesis)
+    except (OSError, ValueError) as e:
+        print(f"  ❌ {args.genesis}: {e}")
+        sys.exit(1)
+    validators, undefined = namespace["VALIDATORS"], namespace["UNDEFINED"]
+    schema = args.schema
+    if schema is None and not validators and undefined:
+        schema = undefined[0]
+    if schema is None and len(validators) == 1:
+        schema = next(iter(validators))
+    if schema in undefined:
+        print(f"  ❌ El esquema '{schema}' de genesis.md sigue siendo el TODO de la plantilla: defínelo primero.")
+        sys.exit(1)
+    if schema is None and not validators:
+        parser.error("indica --schema (esquemas definidos: ninguno)")
+    if schema is not None and schema not in validators:
+        parser.error(f"genesis.md no define el esquema '{schema}' (definidos: {', '.join(validators) or 'ninguno'})")
+
+    files = args.files or sorted(p for pattern in DATA_PATTERNS for p in glob.glob(os.path.join(".tmp", pattern)))
+    if not files:
+        print("  🤷 No hay archivos que validar en .tmp/.")
+        return
+
+    failed, results = 0, {}
+    target = f"'{schema}'" if schema else "el esquema de su nombre"
+    out = [f"\n🧪 Validando {len(files)} archivos contra {target}", ""]
+    for path in files:
+        name = schema or schema_for(path, validators)
+        if name is None:
+            failed += 1
+            out.append(
+                f"  ❌ {path}: no se sabe qué esquema aplicar; nómbralo como uno de ellos"
+                f" ({', '.join(validators)}) o usa --schema"
+            )
+            continue
+        try:
+            summary = validate_file(path, namespace, name, args.jobs)
+        except OSError as e:
+            failed += 1
+            out.append(f"  ❌ {path}: {e}")
+            continue
+        failed += bool(summary.invalid)
+        out += report(path, name, summary)
+        results[path] = {
+            "schema": name,
+            "records": summary.records,
+            "invalid": summary.invalid,
+            "errors": [
+                {"path": p, "error": k, "count": c, "examples": summary.examples[(p, k)]}
+                for (p, k), c in summary.errors.most_common()
+            ],
+        }
+
+    if args.json:
+        print(json.dumps({"schema": schema, "files": results}, ensure_ascii=False, indent=2))
+    else:
+        print("\n".join(out + ["", f"📋 {len(files) - failed} válidos, {failed} con errores.", ""]))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+benchmarks — bench_commit_parser.py
+Microbenchmark del parser de commits de update_changelog.py.
+
+Compara el parser original (una regex con IGNORECASE por cada subject y un
+dict por commit) con `parse_commit` actual (descarte por primer carácter,
+caché LRU por subject y registros con __slots__). Antes de medir comprueba que ambos
+clasifican igual un corpus con casos límite.
+
+Usage:
+    python benchmarks/bench_commit_parser.py [--subjects 1000000] [--unique 5000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+SCRIPTS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "Antigravity", "skills", "changelog-updater", "scripts",
+)
+sys.path.insert(0, os.path.abspath(SCRIPTS))
+
+import update_changelog  # noqa: E402
+
+EDGE_CASES = [
+    "feat: x", "FEAT(Api): Mayúsculas", "✨ feat(core): con emoji", "✨feat: pegado",
+    "♻️ refactor: selector de variación", "🐛  fix(ui):  espacios  ", "feat: ", "feat:",
+    "feat():x", "feat(a)(b): x", "feat(a:b): dos puntos", "cifoo: nada", "ci: pipeline",
+    "chore(deps): bump", " feat: espacio inicial", "Merge branch 'main'", "", "✨",
+    "revert: \"feat: x\"", "featx: no", "feat(scope sin cerrar: x", "ſtyle: s larga",
+    "fix:\tcon tab", "docs(ñ): scope unicode", "perf(x): a\nb", "Feat: capital",
+]
+
+
+def legacy_parse_commit(commit: dict) -> dict:
+    """The original implementation, kept here as the baseline."""
+    match = update_changelog.COMMIT_PATTERN.match(commit["subject"])
+    if match:
+        return {
+            "hash": commit["hash"],
+            "type": match.group("type").lower(),
+            "scope": match.group("scope"),
+            "desc": match.group("desc").strip(),
+            "body": commit["body"],
+        }
+    return {
+        "hash": commit["hash"],
+        "type": "other",
+        "scope": None,
+        "desc": commit["subject"].strip(),
+        "body": commit["body"],
+    }
+
+
+def make_subjects(total: int, unique: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    types = ["feat", "fix", "docs", "chore", "refactor", "perf", "test", "ci", "build"]
+    emojis = ["", "✨ ", "🐛 ", "📚 ", "🔧 "]
+    pool = []
+    for i in range(unique):
+        kind = rng.random()
+        if kind < 0.15:
+            pool.append(f"Merge pull request #{i} from org/branch-{i}")
+        elif kind < 0.25:
+            pool.append(f"Update dependency package-{i % 300} to v{i % 9}.{i % 13}.0")
+        else:
+            scope = f"(mod{i % 40})" if rng.random() < 0.6 else ""
+            pool.append(f"{rng.choice(emojis)}{rng.choice(types)}{scope}: cambio número {i}")
+    return [rng.choice(pool) for _ in range(total)]
+
+
+def check_parity(subjects: list[str]) -> int:
+    mismatches = 0
+    for subject in subjects:
+        commit = {"hash": "0" * 40, "subject": subject, "body": ""}
+        if update_changelog.parse_commit(commit).as_dict() != legacy_parse_commit(commit):
+            mismatches += 1
+            print(f"❌ Diferencia en: {subject!r}")
+    return mismatches
+
+
+def bench(parse, commits: list[dict]) -> float:
+    start = time.perf_counter()
+    for commit in commits:
+        parse(commit)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark del parser de commits.")
+    parser.add_argument("--subjects", type=int, default=1_000_000, help="Subjects a parsear")
+    parser.add_argument("--unique", type=int, default=5_000, help="Subjects distintos")
+    args = parser.parse_args()
+
+    subjects = make_subjects(args.subjects, args.unique)
+    if check_parity(EDGE_CASES + subjects[: args.unique]):
+        sys.exit(1)
+    print(f"✅ Paridad con el parser original ({len(EDGE_CASES)} casos límite + muestra).\n")
+
+    commits = [{"hash": f"{i:040x}", "subject": s, "body": ""} for i, s in enumerate(subjects)]
+    legacy = bench(legacy_parse_commit, commits)
+    uncached = update_changelog.classify_subject.__wrapped__
+    uncached_time = bench(
+        lambda c: update_changelog.CommitRecord(c["hash"], *uncached(c["subject"]), c["body"]),
+        commits,
+    )
+    update_changelog.classify_subject.cache_clear()
+    cached = bench(update_changelog.parse_commit, commits)
+    info = update_changelog.classify_subject.cache_info()
+
+    print(f"{'Parser':<34}{'segundos':>10}{'µs/commit':>12}{'speedup':>10}")
+    for name, elapsed in (
+        ("regex original (dict)", legacy),
+        ("dispatch sin caché (slots)", uncached_time),
+        ("dispatch + caché LRU (slots)", cached),
+    ):
+        per = elapsed / len(commits) * 1e6
+        print(f"{name:<34}{elapsed:>10.3f}{per:>12.3f}{legacy / elapsed:>9.1f}x")
+    print(f"\nCaché: {info.hits} aciertos, {info.misses} fallos, máx {info.maxsize} entradas.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+benchmarks — bench_git_backend.py
+Compara el backend nativo (git_native.py) con el CLI de git en update_changelog.py.
+
+Crea un repositorio temporal con N commits, lo empaqueta con `git gc` y mide:
+  - `iter_commits("<watermark>..HEAD")`, el recorrido que hace el hook
+    post-commit (`sync_changelog`), con 1 y con 50 commits nuevos.
+  - `iter_commits()` sobre el historial completo.
+Antes de medir verifica que ambos backends devuelven exactamente los mismos commits.
+
+Usage:
+    python benchmarks/bench_git_backend.py [--commits 5000] [--repeat 50]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPTS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "Antigravity", "skills", "changelog-updater", "scripts",
+)
+sys.path.insert(0, os.path.abspath(SCRIPTS))
+
+import update_changelog  # noqa: E402
+
+TYPES = ["feat", "fix", "docs", "refactor", "perf", "chore"]
+
+
+def build_repo(path: str, commits: int) -> None:
+    """Create a repository with `commits` commits via fast-import and pack it."""
+    env = dict(os.environ, GIT_CONFIG_NOSYSTEM="1")
+    subprocess.run(["git", "init", "-q", path], check=True, env=env)
+
+    lines = []
+    for i in range(commits):
+        message = f"{TYPES[i % len(TYPES)]}(mod{i % 7}): cambio número {i}\n\nDetalle del cambio {i}.\n"
+        data = message.encode("utf-8")
+        lines.append(b"commit refs/heads/main\n")
+        lines.append(f"committer Bench <bench@example.com> {1700000000 + i * 3600} +0100\n".encode())
+        lines.append(f"data {len(data)}\n".encode() + data)
+        lines.append(b"\n")
+
+    subprocess.run(
+        ["git", "fast-import", "--quiet"], input=b"".join(lines), cwd=path, check=True, env=env
+    )
+    subprocess.run(["git", "symbolic-ref", "HEAD", "refs/heads/main"], cwd=path, check=True)
+    subprocess.run(["git", "gc", "-q", "--aggressive"], cwd=path, check=True)
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del backend nativo de git.")
+    parser.add_argument("--commits", type=int, default=5000, help="Commits del repo de prueba")
+    parser.add_argument("--repeat", type=int, default=50, help="Iteraciones por medición")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = os.path.join(tmp, "repo")
+        print(f"🏗️  Creando repositorio con {args.commits} commits empaquetados...")
+        build_repo(repo, args.commits)
+        os.chdir(repo)
+
+        ranges = [None]
+        for new_commits in (1, 50):
+            watermark = subprocess.run(
+                ["git", "rev-parse", f"HEAD~{new_commits}"],
+                capture_output=True, text=True, check=True,
+            ).stdout.strip()
+            ranges.append(f"{watermark}..HEAD")
+
+        checked = 0
+        for rev_range in ranges:
+            cli = list(update_changelog.iter_commits(rev_range, backend="cli"))
+            native = list(update_changelog.iter_commits(rev_range, backend="native"))
+            strip = [{k: c[k] for k in ("hash", "date", "subject", "body")} for c in native]
+            if strip != cli:
+                print(f"❌ Los backends devuelven commits distintos ({rev_range or 'HEAD'}).")
+                sys.exit(1)
+            checked += len(cli)
+        print(f"✅ Ambos backends coinciden en {checked} commits ({len(ranges)} rangos).\n")
+
+        def walk(rev_range):
+            return lambda b: sum(1 for _ in update_changelog.iter_commits(rev_range, backend=b))
+
+        rows = [
+            ("watermark..HEAD (1)", walk(ranges[1]), args.repeat),
+            ("watermark..HEAD (50)", walk(ranges[2]), args.repeat),
+            ("iter_commits (historial)", walk(None), max(1, args.repeat // 10)),
+        ]
+        print(f"{'Operación':<28}{'cli (ms)':>12}{'native (ms)':>14}{'speedup':>10}")
+        for name, fn, repeat in rows:
+            cli_time = timed(lambda: fn("cli"), repeat) * 1000
+            native_time = timed(lambda: fn("native"), repeat) * 1000
+            print(f"{name:<28}{cli_time:>12.2f}{native_time:>14.2f}{cli_time / native_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
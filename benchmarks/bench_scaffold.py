@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+benchmarks — bench_scaffold.py
+Mide el scaffolding de init_project.py sobre un sistema de archivos concreto.
+
+Compara el patrón original (un `os.makedirs` + open/write/close + `print` por
+archivo, en secuencia) con `write_manifest` (directorios creados una vez y
+escrituras en un pool de hilos) con 1 y N hilos. La diferencia crece con la
+latencia por operación: apunta `--target` a un montaje NFS/SMB para medirla, o
+simúlala con `--latency-ms` (una espera en cada apertura de archivo).
+
+También mide el coste de los modos de durabilidad: `atomic` (directorio
+temporal + rename) y `durable` (además, fsync en lote antes del rename),
+frente a la referencia ingenua de un fsync por archivo.
+
+Usage:
+    python benchmarks/bench_scaffold.py [--projects 200] [--workers 8] [--target /mnt/nfs/tmp] [--latency-ms 2]
+"""
+
+import argparse
+import builtins
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+SCRIPTS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "Antigravity", "skills", "project-starter-skill", "scripts",
+)
+sys.path.insert(0, os.path.abspath(SCRIPTS))
+
+import init_project  # noqa: E402
+
+
+def legacy_scaffold(root: str, manifest: list[tuple[str, str]]) -> None:
+    """The original per-file sequence, kept here as the baseline."""
+    for d in init_project.DIRS:
+        os.makedirs(os.path.join(root, d), exist_ok=True)
+        print(f"  📁 {d}/")
+    for rel, content in manifest:
+        path = os.path.join(root, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        print(f"  ✅ {os.path.relpath(path)}")
+
+
+def per_file_fsync(root: str, manifest: list[tuple[str, str]]) -> None:
+    """Reference: fsync each file right after writing it."""
+    for rel in init_project.manifest_dirs(manifest):
+        os.makedirs(os.path.join(root, rel), exist_ok=True)
+    for rel, content in manifest:
+        with open(os.path.join(root, rel), "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def transactional(durability: str, workers: int):
+    def scaffold(root: str, manifest: list[tuple[str, str]]) -> None:
+        with init_project.staged(root, durability, workers) as target:
+            init_project.write_manifest(target, manifest, workers=workers)
+
+    return scaffold
+
+
+def run(base: str, projects: int, scaffold) -> float:
+    manifest = init_project.build_manifest("bench")
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(projects):
+            scaffold(os.path.join(base, f"p{i}"), manifest)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del scaffolding de init_project.py.")
+    parser.add_argument("--projects", type=int, default=200, help="Proyectos a crear por variante")
+    parser.add_argument("--workers", type=int, default=init_project.WRITE_WORKERS, help="Hilos del pool")
+    parser.add_argument("--target", default=None, help="Directorio donde crear los proyectos")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Latencia simulada por apertura de archivo"
+    )
+    args = parser.parse_args()
+
+    if args.latency_ms:
+        real_open = builtins.open
+
+        def slow_open(*a, **kw):
+            time.sleep(args.latency_ms / 1000)
+            return real_open(*a, **kw)
+
+        builtins.open = slow_open
+
+    variants = [
+        ("secuencial original", legacy_scaffold),
+        ("manifest, 1 hilo", lambda root, m: init_project.write_manifest(root, m, workers=1)),
+        (f"manifest, {args.workers} hilos", lambda root, m: init_project.write_manifest(root, m, workers=args.workers)),
+        ("atomic (staging+rename)", transactional("atomic", 1)),
+        ("durable (fsync en lote)", transactional("durable", args.workers)),
+        ("fsync por archivo", per_file_fsync),
+    ]
+
+    print(f"{'Variante':<26}{'segundos':>10}{'ms/proyecto':>14}{'speedup':>10}")
+    baseline = None
+    for name, scaffold in variants:
+        base = tempfile.mkdtemp(prefix="bench-scaffold-", dir=args.target)
+        try:
+            elapsed = run(base, args.projects, scaffold)
+        finally:
+            shutil.rmtree(base)
+        baseline = baseline or elapsed
+        per = elapsed / args.projects * 1000
+        print(f"{name:<26}{elapsed:>10.3f}{per:>14.2f}{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
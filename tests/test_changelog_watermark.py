@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+tests — test_changelog_watermark.py
+Comportamiento del modo incremental de update_changelog.py (watermark + índice de hashes).
+
+Cada prueba crea un repositorio temporal y llama a `sync_changelog` como lo
+hace el hook post-commit, con los dos backends de lectura.
+
+Usage:
+    python -m pytest tests/test_changelog_watermark.py
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SCRIPTS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "Antigravity", "skills", "changelog-updater", "scripts",
+)
+sys.path.insert(0, os.path.abspath(SCRIPTS))
+
+import update_changelog  # noqa: E402
+
+GIT_ENV = dict(
+    os.environ,
+    GIT_CONFIG_NOSYSTEM="1",
+    GIT_AUTHOR_NAME="Test", GIT_AUTHOR_EMAIL="test@example.com",
+    GIT_COMMITTER_NAME="Test", GIT_COMMITTER_EMAIL="test@example.com",
+)
+
+
+def git(*args: str, cwd: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, env=GIT_ENV, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+class WatermarkTest(unittest.TestCase):
+    backend = "cli"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = os.path.realpath(self.tmp.name)
+        self.changelog = os.path.join(self.repo, "CHANGELOG.md")
+        git("init", "-q", "-b", "main", cwd=self.repo)
+        update_changelog._HASH_CACHE.clear()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def commit(self, subject: str) -> str:
+        git("commit", "-q", "--allow-empty", "-m", subject, cwd=self.repo)
+        return git("rev-parse", "HEAD", cwd=self.repo)
+
+    def sync(self) -> int:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return update_changelog.sync_changelog(self.changelog, backend=self.backend, cwd=self.repo)
+
+    def entries(self) -> list[str]:
+        with open(self.changelog, "r", encoding="utf-8") as f:
+            return [line for line in f if line.startswith("- ")]
+
+    def test_first_run_registers_only_head(self):
+        self.commit("feat: primero")
+        head = self.commit("fix: segundo")
+        self.assertEqual(self.sync(), 1)
+        self.assertEqual(update_changelog.read_watermark(self.changelog), head)
+        self.assertEqual(len(self.entries()), 1)
+        self.assertIn(head[:7], self.entries()[0])
+
+    def test_registers_exactly_the_commits_after_the_watermark(self):
+        self.commit("feat: base")
+        self.sync()
+        new = [self.commit(f"feat: cambio {i}") for i in range(3)]
+        self.assertEqual(self.sync(), 3)
+        self.assertEqual(update_changelog.read_watermark(self.changelog), new[-1])
+        text = "".join(self.entries())
+        for sha in new:
+            self.assertEqual(text.count(sha[:7]), 1)
+
+    def test_repeated_runs_are_idempotent(self):
+        self.commit("feat: base")
+        self.sync()
+        self.commit("fix: arreglo")
+        self.sync()
+        with open(self.changelog, "rb") as f:
+            before = f.read()
+        self.assertEqual(self.sync(), 0)
+        with open(self.changelog, "rb") as f:
+            self.assertEqual(f.read(), before)
+
+    def test_commits_in_the_hash_index_are_not_logged_twice(self):
+        base = self.commit("feat: base")
+        self.sync()
+        self.commit("feat: nuevo")
+        self.sync()
+        # An older watermark (e.g. restored from a backup) re-walks the range
+        update_changelog.write_watermark(self.changelog, base)
+        self.assertEqual(self.sync(), 0)
+        self.assertEqual(len(self.entries()), 2)
+
+    def test_unresolvable_watermark_falls_back_to_head(self):
+        self.commit("feat: base")
+        self.sync()
+        head = self.commit("fix: tras reescribir la historia")
+        update_changelog.write_watermark(self.changelog, "0" * 40)
+        self.assertEqual(self.sync(), 1)
+        self.assertEqual(update_changelog.read_watermark(self.changelog), head)
+
+    def test_state_stays_out_of_the_working_tree(self):
+        self.commit("feat: base")
+        self.sync()
+        self.assertEqual(git("status", "--porcelain", "--ignored", cwd=self.repo), "?? CHANGELOG.md")
+
+
+class NativeWatermarkTest(WatermarkTest):
+    backend = "native"
+
+
+if __name__ == "__main__":
+    unittest.main()
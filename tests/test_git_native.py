@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+tests — test_git_native.py
+Paridad entre el lector nativo (git_native.py) y el CLI de git.
+
+Se construye un historial con merges, fechas de committer desordenadas y
+zonas horarias cerca de medianoche, y se compara el recorrido de ambos
+backends con objetos sueltos, empaquetados con deltas OFS y con deltas REF.
+
+Usage:
+    python -m pytest tests/test_git_native.py
+    python -m unittest discover tests
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+SCRIPTS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "Antigravity", "skills", "changelog-updater", "scripts",
+)
+sys.path.insert(0, os.path.abspath(SCRIPTS))
+
+import git_native  # noqa: E402
+import update_changelog  # noqa: E402
+
+GIT_ENV = dict(
+    os.environ,
+    GIT_CONFIG_NOSYSTEM="1",
+    GIT_AUTHOR_NAME="Test", GIT_AUTHOR_EMAIL="test@example.com",
+    GIT_COMMITTER_NAME="Test", GIT_COMMITTER_EMAIL="test@example.com",
+)
+# Long shared body: similar commit objects, so `gc --aggressive` deltifies them
+BODY = "\n".join(f"Detalle compartido {i}: texto repetido para forzar deltas." for i in range(40))
+KEYS = ("hash", "date", "subject", "body")
+
+
+def git(*args: str, cwd: str, env: dict | None = None) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, env=env or GIT_ENV, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def build_history(repo: str) -> dict[str, str]:
+    """Create the test DAG; return {name: sha}.
+
+        R ─ A ─ Y ─ C ─ D ─ M ─ T ─ L1 … L12   (main)
+             │   └ X (old, dated before Y)
+             └ F1 ─ F2 ──────┘                  (feature)
+    """
+    git("init", "-q", "-b", "main", cwd=repo)
+    shas: dict[str, str] = {}
+    files = 0
+
+    def make(name: str, parents: list[str], when: int, tz: str = "+0000") -> None:
+        nonlocal files
+        files += 1
+        with open(os.path.join(repo, "notas.txt"), "a", encoding="utf-8") as f:
+            f.write(f"línea {files} de {name}\n")
+        git("add", "notas.txt", cwd=repo)
+        tree = git("write-tree", cwd=repo)
+        env = dict(GIT_ENV, GIT_COMMITTER_DATE=f"@{when} {tz}", GIT_AUTHOR_DATE=f"@{when} {tz}")
+        args = ["commit-tree", tree, "-m", f"feat({name.lower()}): commit {name}", "-m", BODY]
+        for parent in parents:
+            args += ["-p", shas[parent]]
+        shas[name] = git(*args, cwd=repo, env=env)
+
+    day = 1_700_000_000 - 1_700_000_000 % 86400  # midnight UTC
+    make("R", [], day + 1000)
+    make("A", ["R"], day + 2000)
+    make("Y", ["A"], day + 3000)
+    make("X", ["Y"], day + 1500)  # committer clock behind its parent
+    make("F1", ["A"], day + 3500, "-0800")  # previous day in its own zone
+    make("C", ["Y"], day + 4000)
+    make("F2", ["F1"], day + 4500, "+0530")
+    make("D", ["C"], day + 5000)
+    make("M", ["D", "F2"], day + 6000)
+    make("T", ["M"], day + 7000)
+    parent = "T"
+    for i in range(1, 13):
+        # L7 is dated before L6, like a rebased commit with an old committer date
+        when = day + 7000 + i * 3600 - (5400 if i == 7 else 0)
+        make(f"L{i}", [parent], when, "+0100" if i % 2 else "-0300")
+        parent = f"L{i}"
+
+    git("update-ref", "refs/heads/main", shas[parent], cwd=repo)
+    git("update-ref", "refs/heads/feature", shas["F2"], cwd=repo)
+    git("update-ref", "refs/heads/old", shas["X"], cwd=repo)
+    git("tag", "v1", shas["M"], cwd=repo)
+    git("tag", "-a", "v2", "-m", "v2", shas["L6"], cwd=repo)
+    git("symbolic-ref", "HEAD", "refs/heads/main", cwd=repo)
+    return shas
+
+
+class NativeParityTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.repo = os.path.realpath(cls.tmp.name)
+        cls.shas = build_history(cls.repo)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def ranges(self) -> list[str | None]:
+        s = self.shas
+        return [
+            None,
+            "main",
+            "old..main",
+            "feature..main",
+            "main..feature",
+            "v1..main",
+            "v2..HEAD",
+            f"{s['L3']}..{s['L9']}",
+            f"{s['X']}..{s['F2']}",
+            f"{s['D']}..{s['M']}",
+            "main..main",
+        ]
+
+    def cli(self, rev_range, max_count=None) -> list[dict]:
+        return list(update_changelog.iter_commits(rev_range, max_count=max_count, cwd=self.repo))
+
+    def native(self, rev_range, max_count=None) -> list[dict]:
+        # The native walk itself: no silent fallback to the CLI
+        commits = update_changelog._native_commits(rev_range, max_count, self.repo)
+        return [{k: c[k] for k in KEYS} for c in commits]
+
+    def assertParity(self):
+        for rev_range in self.ranges():
+            for max_count in (None, 1, 3):
+                with self.subTest(rev_range=rev_range, max_count=max_count):
+                    self.assertEqual(self.native(rev_range, max_count), self.cli(rev_range, max_count))
+
+    def repack(self, *args: str, config: tuple[str, ...] = ()) -> None:
+        git(*config, "repack", "-q", "-a", "-d", "-f", *args, cwd=self.repo)
+        git("prune-packed", cwd=self.repo)
+        self.assertEqual(git("count-objects", cwd=self.repo).split()[0], "0")
+
+    def deltified_commits(self) -> int:
+        pack_dir = os.path.join(self.repo, ".git", "objects", "pack")
+        count = 0
+        for name in os.listdir(pack_dir):
+            if name.endswith(".idx"):
+                out = git("verify-pack", "-v", os.path.join(pack_dir, name), cwd=self.repo)
+                count += sum(1 for line in out.splitlines() if line.split()[1:2] == ["commit"] and len(line.split()) >= 7)
+        return count
+
+    def test_parity(self):
+        # One test, in order: loose objects, then OFS_DELTA packs, then REF_DELTA packs
+        with self.subTest("loose"):
+            self.assertParity()
+        with self.subTest("ofs-delta"):
+            self.repack("--depth=50", "--window=250")
+            self.assertGreater(self.deltified_commits(), 0)
+            self.assertParity()
+        with self.subTest("ref-delta"):
+            self.repack("--depth=50", "--window=250", config=("-c", "repack.useDeltaBaseOffset=false"))
+            self.assertGreater(self.deltified_commits(), 0)
+            self.assertParity()
+
+    def test_excluded_side_reached_late(self):
+        # X is dated before Y: Y, A and R must still be excluded from old..main
+        hashes = [c["hash"] for c in self.native("old..main")]
+        for name in ("Y", "A", "R"):
+            self.assertNotIn(self.shas[name], hashes)
+        self.assertIn(self.shas["F1"], hashes)
+
+    def test_unsupported_revision_raises(self):
+        with self.assertRaises(git_native.NativeUnsupported):
+            self.native("HEAD~3..HEAD")
+
+    def test_fallback_resumes_on_the_cli(self):
+        expected = self.cli(None)
+
+        def flaky(rev_range, max_count, cwd=None):
+            # Gives up after two commits, unless max_count was reached first
+            yield from expected[:min(2, max_count or 2)]
+            if max_count is None or max_count > 2:
+                raise git_native.NativeUnsupported("lectura interrumpida")
+
+        with mock.patch.object(update_changelog, "_native_commits", flaky):
+            for max_count in (None, 1, 2, 5):
+                with self.subTest(max_count=max_count):
+                    commits = list(update_changelog.iter_commits(
+                        max_count=max_count, backend="native", cwd=self.repo
+                    ))
+                    self.assertEqual(commits, expected[:max_count])
+
+
+if __name__ == "__main__":
+    unittest.main()
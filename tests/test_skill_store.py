@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+tests — test_skill_store.py
+Instalación de skills desde el almacén direccionado por contenido (skill_store.py).
+
+Cubre la cadena de métodos (reflink → copy_file_range → copia), el hardlink
+opcional, la reparación de objetos modificados y los permisos de los
+archivos instalados. Los métodos que dependen del sistema de archivos se
+sustituyen por dobles que fallan como lo haría el kernel.
+
+Usage:
+    python -m pytest tests/test_skill_store.py
+    python -m unittest discover tests
+"""
+
+import errno
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+SCRIPTS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "Antigravity", "skills", "project-starter-skill", "scripts",
+)
+sys.path.insert(0, os.path.abspath(SCRIPTS))
+
+import skill_store  # noqa: E402
+
+
+def unsupported(calls: list):
+    """A linker that fails like a filesystem without that feature."""
+    def linker(src, dst):
+        calls.append(dst)
+        raise OSError(errno.EOPNOTSUPP, "no soportado")
+    return linker
+
+
+class SkillStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        self.source = os.path.join(root, "skills")
+        self.skill = os.path.join(self.source, "demo")
+        os.makedirs(os.path.join(self.skill, "scripts"))
+        self.write("SKILL.md", "---\nname: demo\n---\n")
+        self.write("scripts/run.py", "print('hola')\n")
+        os.chmod(os.path.join(self.skill, "scripts", "run.py"), 0o755)
+        self.store = skill_store.SkillStore(os.path.join(root, "store"))
+        self.dest = os.path.join(root, "proyecto")
+        os.makedirs(self.dest)
+        # Failed methods are remembered per device pair: start from scratch
+        patcher = mock.patch.object(skill_store, "_UNSUPPORTED", set())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        for dirpath, dirnames, filenames in os.walk(self.tmp.name):
+            os.chmod(dirpath, 0o755)  # read-only objects must not block cleanup
+        self.tmp.cleanup()
+
+    def write(self, rel: str, text: str) -> None:
+        with open(os.path.join(self.skill, rel), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def linkers(self, reflink=None, copy_file_range=None) -> list:
+        return [
+            ("reflink", reflink or unsupported([])),
+            ("copy_file_range", copy_file_range or unsupported([])),
+            ("copy", shutil.copyfile),
+        ]
+
+    def test_default_install_makes_private_writable_copies(self):
+        plan = self.store.plan(self.source, ["demo"])
+        used = skill_store.install(plan, self.dest)
+        self.assertNotIn("hardlink", used)
+        self.assertEqual(sum(used.values()), 2)
+        for rel, obj in plan:
+            target = os.path.join(self.dest, rel)
+            self.assertNotEqual(os.stat(target).st_ino, os.stat(obj).st_ino)
+            self.assertTrue(os.stat(target).st_mode & stat.S_IWUSR)
+        script = os.path.join(self.dest, "demo", "scripts", "run.py")
+        self.assertTrue(os.stat(script).st_mode & stat.S_IXUSR)
+
+        # Editing an installed file leaves the store (and other projects) alone
+        with open(script, "a", encoding="utf-8") as f:
+            f.write("print('editado')\n")
+        obj = dict(plan)[os.path.join("demo", "scripts", "run.py")]
+        with open(obj, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "print('hola')\n")
+
+    def test_falls_back_to_copy_and_remembers_failures(self):
+        reflinks, ranges = [], []
+        linkers = self.linkers(unsupported(reflinks), unsupported(ranges))
+        with mock.patch.object(skill_store, "LINKERS", linkers):
+            used = skill_store.install(self.store.plan(self.source, ["demo"]), self.dest)
+        self.assertEqual(used, {"copy": 2})
+        # Each method is tried once per device pair, not once per file
+        self.assertEqual(len(reflinks), 1)
+        self.assertEqual(len(ranges), 1)
+
+    def test_copy_file_range_used_when_reflink_fails(self):
+        linkers = self.linkers(copy_file_range=shutil.copyfile)
+        with mock.patch.object(skill_store, "LINKERS", linkers):
+            used = skill_store.install(self.store.plan(self.source, ["demo"]), self.dest)
+        self.assertEqual(used, {"copy_file_range": 2})
+
+    def test_hardlink_is_opt_in(self):
+        plan = self.store.plan(self.source, ["demo"])
+        with mock.patch.object(skill_store, "LINKERS", self.linkers()):
+            used = skill_store.install(plan, self.dest, hardlink=True)
+        self.assertEqual(used, {"hardlink": 2})
+        for rel, obj in plan:
+            self.assertEqual(os.stat(os.path.join(self.dest, rel)).st_ino, os.stat(obj).st_ino)
+
+    def test_hardlink_falls_back_across_devices(self):
+        failing = mock.Mock(side_effect=OSError(errno.EXDEV, "otro dispositivo"))
+        with mock.patch.object(skill_store, "LINKERS", self.linkers()), \
+                mock.patch.object(skill_store, "HARDLINK", ("hardlink", failing)):
+            used = skill_store.install(self.store.plan(self.source, ["demo"]), self.dest, hardlink=True)
+        self.assertEqual(used, {"copy": 2})
+        self.assertEqual(failing.call_count, 1)
+
+    def test_existing_target_is_an_error(self):
+        plan = self.store.plan(self.source, ["demo"])
+        skill_store.install(plan, self.dest)
+        with mock.patch.object(skill_store, "LINKERS", self.linkers()):
+            with self.assertRaises(FileExistsError):
+                skill_store.install(plan, self.dest, hardlink=True)
+
+    def test_modified_object_is_repaired_on_ingest(self):
+        path = os.path.join(self.skill, "SKILL.md")
+        obj = self.store.ingest(path)
+        # What a write through a hardlinked project file would do
+        os.chmod(obj, 0o644)
+        with open(obj, "w", encoding="utf-8") as f:
+            f.write("contenido corrupto\n")
+
+        self.assertEqual(self.store.ingest(path), obj)
+        self.assertEqual(skill_store.file_digest(obj), skill_store.file_digest(path))
+        self.assertFalse(os.stat(obj).st_mode & 0o222)
+
+    def test_plan_reuses_identical_content(self):
+        self.write("README.md", "---\nname: demo\n---\n")  # same bytes as SKILL.md
+        plan = dict(self.store.plan(self.source, ["demo"]))
+        skill_md = plan[os.path.join("demo", "SKILL.md")]
+        self.assertEqual(plan[os.path.join("demo", "README.md")], skill_md)
+        self.assertNotEqual(plan[os.path.join("demo", "scripts", "run.py")], skill_md)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+tests — test_validate_schema.py
+Generación de validadores de validate_schema.py a partir de los esquemas de genesis.md.
+
+Cubre los caminos de error de la generación de código (valores de palabras
+clave inutilizables, NaN/Infinity), que deben acabar en un ValueError con la
+ruta JSON y nunca en una traza, y la elección de esquema por nombre de
+archivo cuando genesis.md define varios.
+
+Usage:
+    python -m pytest tests/test_validate_schema.py
+    python -m unittest discover tests
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SCRIPTS = os.path.abspath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "Antigravity", "skills", "project-starter-skill", "scripts",
+))
+sys.path.insert(0, SCRIPTS)
+
+import validate_schema  # noqa: E402
+
+
+def compile_schema(schema: dict) -> dict:
+    """Generate, compile and run the validator module for one schema named 'input'."""
+    namespace: dict = {}
+    exec(compile(validate_schema.generate_source({"input": schema}, []), "<test>", "exec"), namespace)
+    return namespace
+
+
+def errors_of(schema: dict, value) -> list[tuple]:
+    errors: list[tuple] = []
+    compile_schema(schema)["VALIDATORS"]["input"](value, errors.append)
+    return errors
+
+
+def genesis(*blocks: tuple[str, str]) -> str:
+    sections = "".join(f"### {name}\n\n```json\n{source}\n```\n\n" for name, source in blocks)
+    return f"# Proyecto\n\n## Esquema de Datos\n\n{sections}"
+
+
+class CodegenErrorTest(unittest.TestCase):
+    def assertRejected(self, schema: dict, where: str) -> None:
+        with self.assertRaises(ValueError) as caught:
+            validate_schema.generate_source({"input": schema}, [])
+        self.assertIn("esquema 'input'", str(caught.exception))
+        self.assertIn(where, str(caught.exception))
+
+    def test_bad_counts(self):
+        for keyword in validate_schema.COUNT_KEYWORDS:
+            for value in ("3", -1, 2.5, None, True, [1]):
+                with self.subTest(keyword=keyword, value=value):
+                    self.assertRejected(
+                        {"type": "object", "properties": {"a": {keyword: value}}}, f"$.a ({keyword})"
+                    )
+
+    def test_bad_bounds(self):
+        for keyword in validate_schema.BOUND_KEYWORDS:
+            for value in ("3", None, float("nan"), float("inf"), [0]):
+                with self.subTest(keyword=keyword, value=value):
+                    self.assertRejected({"type": "number", keyword: value}, f"$ ({keyword})")
+
+    def test_non_finite_enum_and_const(self):
+        nan, inf = float("nan"), float("inf")
+        for schema in ({"enum": [1, nan]}, {"enum": [{"x": [inf]}]}, {"const": -inf}, {"const": {"a": nan}}):
+            with self.subTest(schema=schema):
+                self.assertRejected({"type": "array", "items": schema}, "$[*]")
+
+    def test_malformed_keywords(self):
+        cases = [
+            ({"enum": "a|b"}, "(enum)"),
+            ({"type": "string", "pattern": "("}, "(pattern)"),
+            ({"type": "string", "pattern": 5}, "(pattern)"),
+            ({"type": 5}, "(type)"),
+            ({"type": "object", "properties": []}, "(properties)"),
+            ({"type": "object", "required": "id"}, "(required)"),
+            ({"type": "object", "properties": {"a b": 5}}, "$['a b']"),
+            ({"type": "string", "format": 1}, "(format)"),
+        ]
+        for schema, where in cases:
+            with self.subTest(schema=schema):
+                self.assertRejected(schema, where)
+
+    def test_draft4_boolean_exclusive_bounds_are_ignored(self):
+        self.assertEqual(errors_of({"type": "number", "minimum": 1, "exclusiveMinimum": True}, 1), [])
+
+    def test_integral_float_counts_and_finite_values_compile(self):
+        schema = {
+            "type": "object",
+            "properties": {
+                "a": {"type": "string", "minLength": 2.0, "maxLength": 3},
+                "b": {"enum": [1.5, "x", None, [1]]},
+                "c": {"const": {"k": 1e300}},
+                "d": {"type": "integer", "minimum": -1, "exclusiveMaximum": 10},
+            },
+            "required": ["a"],
+        }
+        self.assertEqual(errors_of(schema, {"a": "xy", "b": [1], "c": {"k": 1e300}, "d": 9}), [])
+        paths = {path for path, _, _ in errors_of(schema, {"a": "x", "b": 2, "c": {}, "d": 10})}
+        self.assertEqual(paths, {"$.a", "$.b", "$.c", "$.d"})
+
+    def test_genesis_with_nan_is_rejected_before_codegen(self):
+        text = genesis(("Input", '{"type": "object", "properties": {"s": {"enum": ["a", NaN]}}}'))
+        schemas, undefined = validate_schema.extract_schemas(text)
+        with self.assertRaises(ValueError):
+            validate_schema.generate_source(schemas, undefined)
+
+
+class CliTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.project = self.tmp.name
+        os.makedirs(os.path.join(self.project, ".tmp"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_cli(self, *args: str) -> subprocess.CompletedProcess:
+        env = dict(os.environ, XDG_CACHE_HOME=os.path.join(self.project, "cache"))
+        return subprocess.run(
+            [sys.executable, os.path.join(SCRIPTS, "validate_schema.py"), *args],
+            cwd=self.project, env=env, capture_output=True, text=True,
+        )
+
+    def write(self, rel: str, text: str) -> None:
+        with open(os.path.join(self.project, rel), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_bad_schema_is_reported_without_traceback(self):
+        self.write("genesis.md", genesis(("Input", '{"type": "object", "properties": {"id": {"minLength": "x"}}}')))
+        self.write(".tmp/input.jsonl", '{"id": "a"}\n')
+        result = self.run_cli()
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("$.id (minLength)", result.stdout)
+        self.assertNotIn("Traceback", result.stderr)
+
+    def test_files_are_matched_to_schemas_by_name(self):
+        self.write("genesis.md", genesis(
+            ("Input", '{"id": "string"}'),
+            ("Output", '{"ok": "boolean"}'),
+        ))
+        self.write(".tmp/input.jsonl", '{"id": "a"}\n{"id": 1}\n')
+        self.write(".tmp/output_2024.json", '[{"ok": true}]')
+        self.write(".tmp/notas.json", "{}")
+        result = self.run_cli("--json")
+        self.assertEqual(result.returncode, 1)
+        files = json.loads(result.stdout)["files"]
+        self.assertEqual(files[".tmp/input.jsonl"]["schema"], "input")
+        self.assertEqual(files[".tmp/input.jsonl"]["invalid"], 1)
+        self.assertEqual(files[".tmp/output_2024.json"]["schema"], "output")
+        self.assertEqual(files[".tmp/output_2024.json"]["invalid"], 0)
+        self.assertNotIn(".tmp/notas.json", files)
+
+        # --schema still applies one schema to every file
+        result = self.run_cli(".tmp/output_2024.json", "--schema", "output")
+        self.assertEqual(result.returncode, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()